@@ -0,0 +1,6 @@
+"""Permite executar a CLI com python -m src (ver src/cli.py)."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -7,12 +7,14 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
-from sklearn.cluster import DBSCAN, KMeans
-from .grid_mapping import build_number_coord_map, GridSpec
+from .bitmask import numbers_array_to_masks, popcount
+from .grid_mapping import GridSpec, grid_tables
+from .io_data import build_draw_store
+from .prefix_index import FrequencyIndex
 
 
 def hot_cold_analysis(freq_by_number: np.ndarray, n_sorteios: int, 
-                     spec: GridSpec = GridSpec()) -> pd.DataFrame:
+                     spec: GridSpec = GridSpec(), threshold: float = 1.5) -> pd.DataFrame:
     """
     Classifica números em quentes, médios e frios.
     
@@ -20,6 +22,8 @@ def hot_cold_analysis(freq_by_number: np.ndarray, n_sorteios: int,
         freq_by_number: Array com frequência de cada número
         n_sorteios: Total de sorteios
         spec: Especificação do grid
+        threshold: Desvio (%) da frequência esperada acima do qual o número
+                   é quente (e abaixo de -threshold, frio)
         
     Returns:
         DataFrame com classificação de cada número
@@ -32,9 +36,9 @@ def hot_cold_analysis(freq_by_number: np.ndarray, n_sorteios: int,
         deviation = ((freq - expected_freq) / expected_freq) * 100
         
         # Classificação
-        if deviation > 1.5:
+        if deviation > threshold:
             category = "🔥 Quente"
-        elif deviation < -1.5:
+        elif deviation < -threshold:
             category = "❄️ Frio"
         else:
             category = "🌡️ Médio"
@@ -65,15 +69,26 @@ def temporal_trend_analysis(df: pd.DataFrame, ball_cols: List[str],
     Returns:
         DataFrame com tendências
     """
+    # Contagens em janelas móveis por diferença de somas de prefixo
+    index = FrequencyIndex.from_store(build_draw_store(df, ball_cols))
+    return trends_from_windows(index.window_counts(window_size, window_size // 2))
+
+
+def trends_from_windows(windows: np.ndarray) -> pd.DataFrame:
+    """
+    Tendência de cada número a partir das contagens em janelas móveis.
+    
+    Args:
+        windows: Array (W, 26) de frequências por janela
+                 (ver prefix_index.FrequencyIndex.window_counts)
+        
+    Returns:
+        DataFrame com tendências (vazio se houver menos de 2 janelas)
+    """
     trends = []
     
     for n in range(1, 26):
-        # Conta em janelas móveis
-        freq_over_time = []
-        for i in range(0, len(df) - window_size, window_size // 2):
-            window = df.iloc[i:i+window_size]
-            count = (window[ball_cols] == n).sum().sum()
-            freq_over_time.append(count)
+        freq_over_time = list(windows[:, n])
         
         if len(freq_over_time) >= 2:
             # Tendência: últimas janelas vs primeiras
@@ -88,7 +103,8 @@ def temporal_trend_analysis(df: pd.DataFrame, ball_cols: List[str],
                 "status": "📈 Subindo" if trend > 5 else "📉 Caindo" if trend < -5 else "➡️ Estável"
             })
     
-    return pd.DataFrame(trends).sort_values("tendencia_%", ascending=False)
+    return pd.DataFrame(trends, columns=["numero", "tendencia_%", "status"]).sort_values(
+        "tendencia_%", ascending=False)
 
 
 def micro_clusters_analysis(freq_by_number: np.ndarray, 
@@ -103,14 +119,14 @@ def micro_clusters_analysis(freq_by_number: np.ndarray,
     Returns:
         Dicionário com diferentes análises de clusters
     """
-    from .cluster_analysis import _pairwise_manhattan
+    from sklearn.cluster import DBSCAN, KMeans  # import pesado, só quando usado
     
-    n2c = build_number_coord_map(spec)
+    tables = grid_tables(spec)
     numbers = list(range(1, spec.n_max + 1))
-    coords = np.array([n2c[n] for n in numbers], dtype=int)
+    coords = tables.coords[numbers].astype(int)
     
     # Matriz de distâncias
-    D = _pairwise_manhattan(coords)
+    D = tables.manhattan[np.ix_(numbers, numbers)].astype(float)
     
     results = {}
     
@@ -200,22 +216,13 @@ def edge_center_bias(df: pd.DataFrame, ball_cols: List[str],
     Returns:
         Dicionário com estatísticas de bias
     """
-    n2c = build_number_coord_map(spec)
+    tables = grid_tables(spec)
+    masks = numbers_array_to_masks(df[ball_cols].to_numpy())
     
-    edge_count = 0
-    center_count = 0
-    total_numbers = 0
-    
-    for nums in df[ball_cols].to_numpy():
-        for n in nums:
-            total_numbers += 1
-            r, c = n2c[int(n)]
-            
-            # Borda: linha/coluna 0 ou 4
-            if r == 0 or r == 4 or c == 0 or c == 4:
-                edge_count += 1
-            else:
-                center_count += 1
+    # Borda: linha/coluna 0 ou 4
+    total_numbers = int(popcount(masks).sum())
+    edge_count = int(popcount(masks & tables.mask_dtype.type(tables.edge_mask)).sum())
+    center_count = int(popcount(masks & tables.mask_dtype.type(tables.center_mask)).sum())
     
     edge_percent = (edge_count / total_numbers) * 100
     center_percent = (center_count / total_numbers) * 100
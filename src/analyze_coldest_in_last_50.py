@@ -1,6 +1,12 @@
+import os
+import sys
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.prefix_index import load_frequency_index
+
 def analyze_coldest_in_last_50():
     # Pool de 18 números mais frios
     pool_frios = [1, 2, 3, 4, 5, 6, 7, 8, 9, 12, 15, 16, 17, 18, 19, 21, 22, 23]
@@ -85,12 +91,9 @@ def analyze_coldest_in_last_50():
     for r in bottom_frios:
         print(f"  Concurso {r['Concurso']:5d}: {r['Qtd_Frios']:2d} frios → {r['Frios_Sorteados']}")
     
-    # Números frios mais frequentes nos últimos 50
-    todos_frios_sorteados = []
-    for r in resultados:
-        todos_frios_sorteados.extend(r['Frios_Sorteados'])
-    
-    freq_frios = Counter(todos_frios_sorteados)
+    # Números frios mais frequentes nos últimos 50 (diferença de somas de prefixo)
+    contagens = load_frequency_index().last(50)
+    freq_frios = {numero: int(contagens[numero]) for numero in pool_frios}
     
     print("\n" + "=" * 120)
     print("FREQUÊNCIA DOS NÚMEROS FRIOS NOS ÚLTIMOS 50 SORTEIOS")
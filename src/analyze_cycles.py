@@ -1,48 +1,28 @@
-import pandas as pd
+import os
+import sys
 import matplotlib.pyplot as plt
 from pathlib import Path
 import numpy as np
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+from src.incremental import load_or_build_state
+
 def analyze_cycles():
-    # Carregar sorteios
-    df = pd.read_csv('data/lotofacil_sorteios.csv')
+    # Carregar sorteios (bitmasks compartilhados)
+    store = load_draw_store()
+    incidence = store.incidence()
     
-    # Para cada número, calcular latência (gaps entre aparições)
-    numeros_ciclos = {}
-    
-    for numero in range(1, 26):
-        aparicoes = []
-        
-        for idx, row in df.iterrows():
-            numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-            if numero in numeros_sorteados:
-                aparicoes.append(idx)
-        
-        # Calcular gaps (latências)
-        gaps = []
-        for i in range(1, len(aparicoes)):
-            gap = aparicoes[i] - aparicoes[i-1]
-            gaps.append(gap)
-        
-        # Estatísticas
-        if len(gaps) > 0:
-            numeros_ciclos[numero] = {
-                'total_aparicoes': len(aparicoes),
-                'gaps': gaps,
-                'gap_medio': np.mean(gaps),
-                'gap_mediano': np.median(gaps),
-                'gap_min': np.min(gaps),
-                'gap_max': np.max(gaps),
-                'desvio_gap': np.std(gaps),
-                'ultimo_concurso': aparicoes[-1] if aparicoes else None,
-                'latencia_atual': len(df) - aparicoes[-1] - 1 if aparicoes else len(df)
-            }
+    # Gaps e latência por número, mantidos incrementalmente (só os
+    # sorteios novos desde o último estado salvo são processados)
+    numeros_ciclos = load_or_build_state(store).gap_stats()
     
     print("=" * 100)
     print("ANÁLISE DE CICLOS E LATÊNCIA")
     print("=" * 100)
-    print(f"\nTotal de sorteios analisados: {len(df)}")
-    print(f"Último concurso: {df.iloc[-1]['Concurso']}")
+    print(f"\nTotal de sorteios analisados: {len(store)}")
+    print(f"Último concurso: {store.contests[-1]}")
     print("\n" + "=" * 100)
     
     # Ordenar por gap médio
@@ -95,7 +75,7 @@ def analyze_cycles():
         print(f"{'SIM' if atrasado else 'NÃO'})")
     
     # Últimos 50 sorteios - frequência recente vs ciclo histórico
-    ultimos_50 = df.tail(50)
+    ultimos_50 = incidence[-50:]
     
     print("\n" + "=" * 100)
     print("FREQUÊNCIA RECENTE (Últimos 50) vs CICLO HISTÓRICO:")
@@ -109,11 +89,7 @@ def analyze_cycles():
         gap_esperado = stats['gap_medio']
         
         # Contar aparições nos últimos 50
-        aparicoes_50 = 0
-        for idx, row in ultimos_50.iterrows():
-            numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-            if numero in numeros_sorteados:
-                aparicoes_50 += 1
+        aparicoes_50 = int(ultimos_50[:, numero - 1].sum())
         
         freq_pct = (aparicoes_50 / 50) * 100
         gap_real_50 = 50 / aparicoes_50 if aparicoes_50 > 0 else float('inf')
@@ -167,15 +143,7 @@ def analyze_cycles():
     plt.figure(figsize=(14, 8))
     
     aparicoes_totais = [numeros_ciclos[n]['total_aparicoes'] for n in numeros_list]
-    aparicoes_recentes = []
-    
-    for numero in numeros_list:
-        count = 0
-        for idx, row in ultimos_50.iterrows():
-            numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-            if numero in numeros_sorteados:
-                count += 1
-        aparicoes_recentes.append(count)
+    aparicoes_recentes = [int(ultimos_50[:, numero - 1].sum()) for numero in numeros_list]
     
     x = np.arange(len(numeros_list))
     width = 0.35
@@ -183,7 +151,7 @@ def analyze_cycles():
     fig, ax = plt.subplots(figsize=(16, 8))
     
     # Normalizar para comparação
-    aparicoes_totais_norm = [(a / len(df)) * 50 for a in aparicoes_totais]
+    aparicoes_totais_norm = [(a / len(store)) * 50 for a in aparicoes_totais]
     
     rects1 = ax.bar(x - width/2, aparicoes_totais_norm, width, label='Frequência Histórica (normalizada)', alpha=0.7)
     rects2 = ax.bar(x + width/2, aparicoes_recentes, width, label='Últimos 50 Sorteios', alpha=0.7)
@@ -206,7 +174,7 @@ def analyze_cycles():
         f.write("=" * 100 + "\n")
         f.write("ANÁLISE DE CICLOS E LATÊNCIA\n")
         f.write("=" * 100 + "\n\n")
-        f.write(f"Total de sorteios analisados: {len(df)}\n\n")
+        f.write(f"Total de sorteios analisados: {len(store)}\n\n")
         
         f.write("NÚMEROS CRÍTICOS ANALISADOS:\n")
         f.write("-" * 100 + "\n\n")
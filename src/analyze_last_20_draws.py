@@ -1,6 +1,12 @@
+import os
+import sys
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.prefix_index import load_frequency_index
+
 def analyze_last_20_draws():
     # Carregar sorteios
     df = pd.read_csv('data/lotofacil_sorteios.csv')
@@ -18,8 +24,9 @@ def analyze_last_20_draws():
     print(f"\nPeríodo analisado: Concurso {primeiro_concurso} a {ultimo_concurso}")
     print(f"Total de sorteios: 20\n")
     
-    # Contar frequência de cada número
-    frequencia = {i: 0 for i in range(1, 26)}
+    # Frequência de cada número (diferença de somas de prefixo)
+    contagens = load_frequency_index().last(20)
+    frequencia = {i: int(contagens[i]) for i in range(1, 26)}
     
     # Lista de todos os sorteios
     sorteios_detalhados = []
@@ -32,9 +39,6 @@ def analyze_last_20_draws():
             'Data': row['Data Sorteio'],
             'Numeros': numeros_sorteados
         })
-        
-        for numero in numeros_sorteados:
-            frequencia[numero] += 1
     
     # Ordenar por frequência
     freq_ordenada = sorted(frequencia.items(), key=lambda x: x[1], reverse=True)
@@ -1,6 +1,12 @@
+import os
+import sys
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.prefix_index import load_frequency_index
+
 # Pool otimizada
 POOL_OTIMIZADA = {1, 2, 3, 4, 5, 6, 8, 10, 11, 12, 13, 14, 15, 18, 20, 22, 24, 25}
 
@@ -28,8 +34,11 @@ def analyze_last_50():
     print(f"Data: {last_50.iloc[0]['Data Sorteio']} até {last_50.iloc[-1]['Data Sorteio']}")
     print("\n" + "=" * 80)
     
+    # Acertos da pool em cada sorteio (diferença de somas de prefixo)
+    acertos_por_sorteio = load_frequency_index().draw_hits(POOL_OTIMIZADA, -50)
+    
     # Analisar cada sorteio
-    for idx, row in last_50.iterrows():
+    for (idx, row), acertos in zip(last_50.iterrows(), acertos_por_sorteio):
         concurso = row['Concurso']
         data = row['Data Sorteio']
         
@@ -38,9 +47,6 @@ def analyze_last_50():
         for i in range(1, 16):
             numeros_sorteados.add(row[f'Bola{i}'])
         
-        # Contar acertos
-        acertos = len(POOL_OTIMIZADA & numeros_sorteados)
-        
         if acertos >= 10:
             results[acertos].append({
                 'concurso': concurso,
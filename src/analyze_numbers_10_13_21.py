@@ -1,6 +1,13 @@
+import os
+import sys
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+from src.lattice_index import load_or_build_lattice
+
 def analyze_specific_numbers():
     # Números para análise
     numeros_analise = [10, 13, 21]
@@ -14,6 +21,8 @@ def analyze_specific_numbers():
     # Carregar dados
     df = pd.read_csv('data/lotofacil_sorteios.csv')
     total_sorteios = len(df)
+    # contagens sobre o histórico inteiro: uma leitura no índice de conjuntos
+    lattice = load_or_build_lattice(load_draw_store())
     ultimos_50 = df.tail(50)
     ultimos_100 = df.tail(100)
     
@@ -45,8 +54,7 @@ def analyze_specific_numbers():
             print(f"❌ NÃO INCLUÍDO no pool de 18 números")
         
         # Frequência histórica
-        aparicoes_hist = sum(1 for idx, row in df.iterrows() 
-                            if numero in [row[f'Bola{i}'] for i in range(1, 16)])
+        aparicoes_hist = lattice.containing([numero])
         freq_hist_pct = (aparicoes_hist / total_sorteios) * 100
         
         # Frequência últimos 100
@@ -163,8 +171,7 @@ def analyze_specific_numbers():
         
         no_pool = "✅ SIM" if numero in pool_18_atual else "❌ NÃO"
         
-        aparicoes_hist = sum(1 for idx, row in df.iterrows() 
-                            if numero in [row[f'Bola{i}'] for i in range(1, 16)])
+        aparicoes_hist = lattice.containing([numero])
         freq_hist_pct = (aparicoes_hist / total_sorteios) * 100
         
         aparicoes_50 = sum(1 for idx, row in ultimos_50.iterrows() 
@@ -189,6 +196,11 @@ def analyze_specific_numbers():
         
         print(f"{numero:8d} | {classif:>25} | {no_pool:>12} | {freq_hist_pct:8.2f}% | {aparicoes_50:9d} | {tend_str:>15}")
     
+    juntos = lattice.containing(numeros_analise)
+    nenhum = lattice.avoiding(numeros_analise)
+    print(f"\nSorteios com 10, 13 e 21 juntos: {juntos} ({(juntos / total_sorteios) * 100:.2f}%)")
+    print(f"Sorteios sem nenhum dos três: {nenhum} ({(nenhum / total_sorteios) * 100:.2f}%)")
+    
     # Recomendação
     print("\n" + "=" * 100)
     print("RECOMENDAÇÕES")
@@ -240,8 +252,7 @@ def analyze_specific_numbers():
         f.write("=" * 100 + "\n\n")
         
         for numero in numeros_analise:
-            aparicoes_hist = sum(1 for idx, row in df.iterrows() 
-                                if numero in [row[f'Bola{i}'] for i in range(1, 16)])
+            aparicoes_hist = lattice.containing([numero])
             freq_hist_pct = (aparicoes_hist / total_sorteios) * 100
             
             aparicoes_50 = sum(1 for idx, row in ultimos_50.iterrows() 
@@ -1,13 +1,21 @@
-import pandas as pd
+import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+
 def analyze_impact_of_removing_each():
     # Pool atual de 19 números
     pool_19 = [1, 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 15, 16, 18, 19, 20, 22, 23, 25]
     
-    # Carregar sorteios
-    df = pd.read_csv('data/lotofacil_sorteios.csv')
-    ultimos_50 = df.tail(50)
+    # Carregar sorteios (bitmasks compartilhados)
+    store = load_draw_store()
+    ultimos_50 = store.tail(50)
+    acertos_hist_19 = store.hits(pool_19)
+    acertos_50_19 = ultimos_50.hits(pool_19)
+    incidence = store.incidence()
     
     print("=" * 120)
     print("ANÁLISE DE IMPACTO: REMOVER 1 NÚMERO DO POOL DE 19")
@@ -23,51 +31,28 @@ def analyze_impact_of_removing_each():
         pool_18_teste = [n for n in pool_19 if n != numero_remover]
         
         # Contar jogos perfeitos perdidos (15 acertos que viram 14)
-        jogos_perfeitos_perdidos = 0
-        for idx, row in df.iterrows():
-            numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-            acertos_com_19 = len([n for n in numeros_sorteados if n in pool_19])
-            acertos_com_18 = len([n for n in numeros_sorteados if n in pool_18_teste])
-            
-            if acertos_com_19 == 15 and acertos_com_18 == 14:
-                jogos_perfeitos_perdidos += 1
+        acertos_hist_18 = store.hits(pool_18_teste)
+        jogos_perfeitos_perdidos = int(((acertos_hist_19 == 15) & (acertos_hist_18 == 14)).sum())
         
         # Performance nos últimos 50
-        total_acertos_19 = 0
-        total_acertos_18 = 0
-        
-        for idx, row in ultimos_50.iterrows():
-            numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-            total_acertos_19 += len([n for n in numeros_sorteados if n in pool_19])
-            total_acertos_18 += len([n for n in numeros_sorteados if n in pool_18_teste])
+        total_acertos_19 = int(acertos_50_19.sum())
+        total_acertos_18 = int(ultimos_50.hits(pool_18_teste).sum())
         
         media_19 = total_acertos_19 / 50
         media_18 = total_acertos_18 / 50
         perda_acertos = media_19 - media_18
         
         # Frequência do número nos últimos 50
-        freq_50 = sum(1 for idx, row in ultimos_50.iterrows() 
-                     if numero_remover in [row[f'Bola{i}'] for i in range(1, 16)])
+        freq_50 = int(incidence[-50:, numero_remover - 1].sum())
         
         # Frequência histórica
-        freq_hist = sum(1 for idx, row in df.iterrows() 
-                       if numero_remover in [row[f'Bola{i}'] for i in range(1, 16)])
-        freq_hist_pct = (freq_hist / len(df)) * 100
+        freq_hist = int(incidence[:, numero_remover - 1].sum())
+        freq_hist_pct = (freq_hist / len(store)) * 100
         
         # Distribuição de acertos com pool de 18
-        dist_13_plus = 0
-        dist_14_plus = 0
-        dist_15 = 0
-        
-        for idx, row in df.iterrows():
-            numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-            acertos = len([n for n in numeros_sorteados if n in pool_18_teste])
-            if acertos >= 13:
-                dist_13_plus += 1
-            if acertos >= 14:
-                dist_14_plus += 1
-            if acertos == 15:
-                dist_15 += 1
+        dist_13_plus = int((acertos_hist_18 >= 13).sum())
+        dist_14_plus = int((acertos_hist_18 >= 14).sum())
+        dist_15 = int((acertos_hist_18 == 15).sum())
         
         resultados.append({
             'Numero': numero_remover,
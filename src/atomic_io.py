@@ -0,0 +1,83 @@
+"""
+Módulo de escrita atômica de arquivos.
+Cada escrita vai para um temporário de nome único no diretório de destino
+e é renomeada para o destino no fim, então processos que gravam o mesmo
+arquivo ao mesmo tempo (pools de processos, etapas paralelas do pipeline)
+não truncam o temporário uns dos outros e quem lê nunca vê um arquivo pela
+metade.
+
+Só usa a biblioteca padrão e não tem imports relativos: é importado tanto
+como src.atomic_io quanto como atomic_io (scripts que colocam src/ no path).
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import uuid
+from typing import IO, Iterator
+
+
+def temp_path_for(path: str) -> str:
+    """Nome de temporário exclusivo deste processo, no mesmo diretório de path."""
+    return f"{path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+
+
+@contextlib.contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    """
+    Fornece um caminho temporário a ser preenchido e o renomeia para path.
+
+    Se o bloco falhar, o temporário é apagado e path fica intacto. Se o
+    rename falhar mas path existir (outro processo gravou o mesmo arquivo e
+    ele está aberto, ex.: memory mapping no Windows), a escrita é dada como
+    concluída.
+
+    Args:
+        path: Arquivo de destino
+
+    Yields:
+        Caminho do temporário
+    """
+    tmp_path = temp_path_for(path)
+    try:
+        yield tmp_path
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            if not os.path.exists(path):
+                raise
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+
+
+@contextlib.contextmanager
+def atomic_open(path: str, mode: str = "w", encoding: str | None = None) -> Iterator[IO]:
+    """
+    open() em um temporário renomeado para path ao fechar (ver atomic_path).
+
+    Args:
+        path: Arquivo de destino
+        mode: Modo de escrita ('w' ou 'wb')
+        encoding: Codificação (modo texto)
+
+    Yields:
+        Arquivo aberto
+    """
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, mode, encoding=encoding) as f:
+            yield f
+
+
+def write_json(path: str, data: object, **dump_kwargs) -> None:
+    """
+    Grava JSON em UTF-8 de forma atômica.
+
+    Args:
+        path: Arquivo de destino
+        data: Objeto serializável
+        **dump_kwargs: Repassados a json.dump (indent, default...)
+    """
+    with atomic_open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_kwargs)
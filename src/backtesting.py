@@ -5,17 +5,28 @@ Este script testa os 30 jogos gerados pela análise combinada contra todos os
 sorteios históricos da Lotofácil para avaliar a eficácia das estratégias.
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 import json
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+from src.bitmask import numbers_to_mask
+from src.combinatorics import rank_masks
+from src.hit_engine import hit_summary, PRIZE_TIERS
+from src.probability import at_least_probability
+
 class BacktestingEngine:
     """Motor de backtesting para validar estratégias de loteria"""
     
     def __init__(self):
         self.historical_draws = []
+        self.draw_store = None
         self.optimized_games = []
         self.results = defaultdict(list)
         
@@ -23,14 +34,13 @@ class BacktestingEngine:
         """Carregar sorteios históricos da Lotofácil"""
         print("📂 Carregando sorteios históricos da Lotofácil...")
         
-        # Carregar do CSV convertido
-        df = pd.read_csv('data/lotofacil_sorteios.csv')
+        # Histórico compartilhado em bitmasks
+        self.draw_store = load_draw_store()
         
-        for _, row in df.iterrows():
-            numbers = sorted([int(row[f'Bola{i}']) for i in range(1, 16)])
+        for concurso, numbers in zip(self.draw_store.contests, self.draw_store.numbers()):
             self.historical_draws.append({
-                'concurso': int(row['Concurso']),
-                'numbers': numbers
+                'concurso': int(concurso),
+                'numbers': numbers.tolist()
             })
         
         print(f"✅ {len(self.historical_draws)} sorteios históricos carregados")
@@ -41,18 +51,28 @@ class BacktestingEngine:
         
         df = pd.read_csv('out/jogos_otimizados_combined.csv')
         
-        for _, row in df.iterrows():
-            # Parse da string de números
-            nums_str = row['numeros_str']
-            numbers = sorted([int(x) for x in nums_str.split(',')])
+        # Bitmask como chave canônica: jogos repetidos são descartados em O(1)
+        masks = np.array([numbers_to_mask(int(x) for x in s.split(','))
+                          for s in df['numeros_str']], dtype=np.uint32)
+        ranks = rank_masks(masks)
+        seen = set()
+        
+        for row, mask, rank in zip(df.itertuples(index=False), masks.tolist(), ranks.tolist()):
+            if mask in seen:
+                continue
+            seen.add(mask)
             
             self.optimized_games.append({
-                'jogo_id': row['jogo_id'],
-                'numbers': numbers,
-                'strategy': row['estrategia']
+                'jogo_id': row.jogo_id,
+                'numbers': sorted(int(x) for x in row.numeros_str.split(',')),
+                'strategy': row.estrategia,
+                'rank': rank
             })
         
+        duplicates = len(df) - len(self.optimized_games)
         print(f"✅ {len(self.optimized_games)} jogos otimizados carregados")
+        if duplicates:
+            print(f"   ♻️ {duplicates} jogos repetidos ignorados")
         
     def calculate_matches(self, game_numbers, draw_numbers):
         """Calcular quantos números acertados"""
@@ -101,29 +121,22 @@ class BacktestingEngine:
         
         print("\n🔄 Processando backtesting...")
         
-        for game in self.optimized_games:
+        # Todos os jogos × todos os sorteios de uma vez (bitmask + popcount)
+        summary = hit_summary([game['numbers'] for game in self.optimized_games], self.draw_store)
+        
+        for i, game in enumerate(self.optimized_games):
             game_id = game['jogo_id']
             game_nums = game['numbers']
             strategy = game['strategy']
             
-            matches_distribution = defaultdict(int)
-            prizes_won = defaultdict(int)
-            total_matches = 0
-            best_match = 0
+            total_matches = int(summary['total_acertos'][i])
+            best_match = int(summary['max_acertos'][i])
             
-            for draw in self.historical_draws:
-                draw_nums = draw['numbers']
-                matches = self.calculate_matches(game_nums, draw_nums)
-                
-                matches_distribution[matches] += 1
-                total_matches += matches
-                
-                if matches > best_match:
-                    best_match = matches
-                
-                prize = self.classify_prize(matches)
-                if prize != 'Sem prêmio':
-                    prizes_won[prize] += 1
+            prizes_won = defaultdict(int)
+            for tier in PRIZE_TIERS:
+                count = int(summary[f'premios_{tier}'][i])
+                if count:
+                    prizes_won[self.classify_prize(tier)] += count
             
             # Estatísticas do jogo
             avg_matches = total_matches / len(self.historical_draws)
@@ -140,7 +153,8 @@ class BacktestingEngine:
                 'prizes_13': prizes_won.get('13 acertos (QUADRA)', 0),
                 'prizes_14': prizes_won.get('14 acertos (QUINA)', 0),
                 'prizes_15': prizes_won.get('15 acertos (SENA)', 0),
-                'numbers': ','.join(map(str, game_nums))
+                'numbers': ','.join(map(str, game_nums)),
+                'indice_combinatorio': game['rank']
             })
             
             # Acumular por estratégia
@@ -247,7 +261,10 @@ class BacktestingEngine:
         
         # Baseline aleatório (esperado)
         print(f"\n📊 COMPARAÇÃO COM BASELINE ALEATÓRIO:")
-        expected_11 = len(self.historical_draws) * 0.1134  # ~11.34% para 11+ acertos
+        # P(11+ acertos) exata (hipergeométrica) para o tamanho de cada jogo
+        game_sizes = df_games['numbers'].str.count(',') + 1
+        expected_rate = game_sizes.map(lambda k: at_least_probability(k, PRIZE_TIERS[0])).mean()
+        expected_11 = len(self.historical_draws) * expected_rate
         actual_avg = df_games['prize_rate'].mean() / 100 * len(self.historical_draws)
         
         print(f"   • Esperado (aleatório): ~{expected_11:.1f} prêmios por jogo")
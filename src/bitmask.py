@@ -0,0 +1,120 @@
+"""
+Módulo de representação de números da Lotofácil como bitmasks.
+Cada número n (1..25) ocupa o bit n-1 de um inteiro uint32, de modo que
+um sorteio ou aposta inteira cabe em 4 bytes.
+"""
+from __future__ import annotations
+
+import numpy as np
+from typing import Iterable, List
+
+N_NUMBERS = 25
+FULL_MASK = (1 << N_NUMBERS) - 1
+
+# bit de cada número (índice 0 não é usado)
+NUMBER_BITS = np.array([0] + [1 << (n - 1) for n in range(1, N_NUMBERS + 1)], dtype=np.uint32)
+
+
+def numbers_to_mask(numbers: Iterable[int]) -> int:
+    """
+    Converte uma coleção de números (1..25) em bitmask.
+
+    Args:
+        numbers: Números do sorteio/aposta
+
+    Returns:
+        Inteiro com o bit n-1 ligado para cada número n
+
+    Raises:
+        ValueError: Se algum número estiver fora de 1..25
+    """
+    mask = 0
+    for n in numbers:
+        n = int(n)
+        if not (1 <= n <= N_NUMBERS):
+            raise ValueError(f"Número fora do intervalo: {n}")
+        mask |= 1 << (n - 1)
+    return mask
+
+
+def mask_to_numbers(mask: int) -> List[int]:
+    """
+    Converte um bitmask de volta para a lista ordenada de números.
+
+    Args:
+        mask: Bitmask (bit n-1 = número n)
+
+    Returns:
+        Lista ordenada de números
+    """
+    mask = int(mask)
+    return [n for n in range(1, N_NUMBERS + 1) if mask >> (n - 1) & 1]
+
+
+def numbers_array_to_masks(numbers: np.ndarray) -> np.ndarray:
+    """
+    Converte uma matriz de números (uma linha por sorteio/aposta) em bitmasks.
+
+    Args:
+        numbers: Array (M, k) com números de 1 a 25
+
+    Returns:
+        Array (M,) uint32 com um bitmask por linha
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+    if numbers.ndim == 1:
+        numbers = numbers[np.newaxis, :]
+    return np.bitwise_or.reduce(NUMBER_BITS[numbers], axis=1).astype(np.uint32)
+
+
+def masks_to_incidence(masks: np.ndarray) -> np.ndarray:
+    """
+    Expande bitmasks em matriz de incidência 0/1.
+
+    Args:
+        masks: Array (M,) de bitmasks
+
+    Returns:
+        Array (M, 25) uint8 onde [i, n-1] = 1 se o número n está no bitmask i
+    """
+    masks = np.asarray(masks, dtype=np.uint32)
+    shifts = np.arange(N_NUMBERS, dtype=np.uint32)
+    return ((masks[:, np.newaxis] >> shifts) & 1).astype(np.uint8)
+
+
+def masks_to_numbers_array(masks: np.ndarray, k: int) -> np.ndarray:
+    """
+    Converte bitmasks com exatamente k bits em matriz ordenada de números.
+
+    Args:
+        masks: Array (M,) de bitmasks com k bits ligados cada
+        k: Quantidade de números por bitmask
+
+    Returns:
+        Array (M, k) uint8 com os números em ordem crescente
+    """
+    incidence = masks_to_incidence(masks).astype(bool)
+    cols = np.nonzero(incidence)[1]
+    return (cols.reshape(-1, k) + 1).astype(np.uint8)
+
+
+def popcount(x: np.ndarray) -> np.ndarray:
+    """
+    Conta os bits ligados de cada elemento (vetorizado).
+
+    Usa np.bitwise_count quando disponível (numpy >= 2.0) e, caso contrário,
+    o algoritmo SWAR clássico em aritmética uint32.
+
+    Args:
+        x: Array de inteiros sem sinal (até 32 bits)
+
+    Returns:
+        Array uint8 com a contagem de bits de cada elemento
+    """
+    x = np.asarray(x, dtype=np.uint32)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x).astype(np.uint8, copy=False)
+    x = x - ((x >> 1) & np.uint32(0x55555555))
+    x = (x & np.uint32(0x33333333)) + ((x >> 2) & np.uint32(0x33333333))
+    x = (x + (x >> 4)) & np.uint32(0x0F0F0F0F)
+    return ((x * np.uint32(0x01010101)) >> 24).astype(np.uint8)
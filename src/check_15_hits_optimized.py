@@ -2,28 +2,18 @@
 Verifica se a nova combinação (16 quentes + 2 frios) já fez 15 acertos
 """
 
-import pandas as pd
+import os
+import sys
+import numpy as np
 from pathlib import Path
-from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
 
 def load_all_draws():
-    """Carrega todos os sorteios"""
-    df = pd.read_csv('data/lotofacil_sorteios.csv')
-    
-    draws = []
-    for _, row in df.iterrows():
-        numbers = set()
-        for i in range(1, 16):
-            numbers.add(int(row[f'Bola{i}']))
-        
-        draws.append({
-            'concurso': int(row['Concurso']),
-            'data': row['Data Sorteio'],
-            'numbers': numbers,
-            'numbers_list': sorted(numbers)
-        })
-    
-    return draws
+    """Carrega todos os sorteios (bitmasks compartilhados)"""
+    return load_draw_store()
 
 def check_15_hits():
     """Verifica se algum sorteio teve 15 números da nossa combinação"""
@@ -31,24 +21,25 @@ def check_15_hits():
     # Nossa combinação otimizada (18 números)
     our_numbers = set([1, 2, 3, 4, 5, 6, 8, 10, 11, 12, 13, 14, 15, 18, 20, 22, 24, 25])
     
-    draws = load_all_draws()
+    store = load_all_draws()
+    
+    # Conta quantos números de cada sorteio estão na nossa combinação
+    matches = store.hits(our_numbers)
+    numbers = store.numbers()
     
     perfect_matches = []
     
-    for draw in draws:
-        # Conta quantos números do sorteio estão na nossa combinação
-        matches = len(draw['numbers'] & our_numbers)
-        
-        if matches == 15:
-            # TODOS os 15 números do sorteio estão na nossa combinação de 18!
-            # Isso significa que qualquer jogo de 15 números dentro dos nossos 18
-            # que contenha esses 15 específicos teria ganhado
-            perfect_matches.append({
-                'concurso': draw['concurso'],
-                'data': draw['data'],
-                'numbers': draw['numbers_list'],
-                'missing_from_our_pool': sorted(our_numbers - draw['numbers'])
-            })
+    for idx in np.flatnonzero(matches == 15):
+        # TODOS os 15 números do sorteio estão na nossa combinação de 18!
+        # Isso significa que qualquer jogo de 15 números dentro dos nossos 18
+        # que contenha esses 15 específicos teria ganhado
+        draw_numbers = numbers[idx].tolist()
+        perfect_matches.append({
+            'concurso': int(store.contests[idx]),
+            'data': store.format_date(idx),
+            'numbers': draw_numbers,
+            'missing_from_our_pool': sorted(our_numbers - set(draw_numbers))
+        })
     
     return perfect_matches, our_numbers
 
@@ -0,0 +1,249 @@
+"""
+Linha de comando unificada das análises da Lotofácil e da Mega-Sena.
+
+Uso:
+    python -m src <comando> [argumentos do comando]
+    python -m src --help
+
+Cada script de análise vira um subcomando com o mesmo nome do módulo
+(ex.: python -m src analyze_last_20_draws) e só é importado quando
+executado, então pandas, matplotlib, seaborn, networkx e scikit-learn
+não pesam na inicialização dos comandos que não os usam. Dois comandos
+são nativos: "conferir" (confere uma aposta contra o último sorteio,
+só com numpy e o cache binário) e "startup" (verifica o orçamento de
+tempo de inicialização).
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import runpy
+import subprocess
+import sys
+import time
+from math import comb
+from typing import Dict, List
+
+# comando -> descrição; o módulo executado é src.<comando>
+SCRIPT_COMMANDS: Dict[str, str] = {
+    "main": "Análise espacial completa (heatmap, métricas, co-ocorrência, clusters)",
+    "advanced_main": "Análises avançadas (quentes/frios, tendências, micro-clusters, bias)",
+    "simulation_main": "Simulação Monte Carlo e comparação de estratégias",
+    "universe_main": "Universo completo de apostas (build/query/coverage)",
+    "update_main": "Atualização incremental após um novo concurso",
+    "megasena_main": "Análise geométrica da Mega-Sena",
+    "combined_analysis": "Análise combinada Mega-Sena + Lotofácil",
+    "wheel_main": "Fechamento (wheel) com garantia para pools de 18 a 21 números",
+    "walk_forward_main": "Backtesting walk-forward das estratégias (sem lookahead)",
+    "sweep_main": "Varredura de parâmetros quentes/frios com cache de resultados",
+    "pipeline_main": "Executa as análises como pipeline incremental (pula etapas atualizadas)",
+    "export_to_excel": "Exporta dados e análises para Excel",
+    "draw_cache": "Pré-gera o cache binário dos arquivos de sorteios",
+    "backtesting": "Backtesting dos jogos otimizados contra o histórico",
+    "optimize_combinations": "Otimizador de combinações dos 18 números mais quentes",
+    "generate_more_games": "Gerador de jogos otimizados",
+    "test_all_strategies": "Testa estratégias e identifica a melhor",
+    "optimize_hot_cold_balance": "Otimiza a proporção quentes/frios em apostas de 18",
+    "optimize_hot_cold_mix": "Otimiza a mistura quentes/frios em apostas de 18",
+    "calculate_prize_money": "Calcula os valores dos prêmios conquistados",
+    "compare_games_results": "Compara os jogos otimizados com os últimos sorteios",
+    "check_15_hits_optimized": "Verifica se a combinação otimizada já fez 15 acertos",
+    "check_historical_matches": "Acertos históricos do pool de 19 números",
+    "check_pool_with_13_21": "Novo pool com trocas 10→13 e 22→21",
+    "test_pool_18_plus_21": "Adiciona o número 21 ao pool ótimo de 18",
+    "pool_search_main": "Busca exata do melhor pool de 16 a 21 números (com restrições)",
+    "find_optimal_18_pool": "Busca o pool ótimo de 18 números",
+    "find_safe_to_remove": "Números seguros para remover do pool",
+    "find_draws_without_cold": "Sorteios sem nenhum número frio",
+    "select_4_complementary": "Seleciona 4 números complementares (2 frios + 2 quentes)",
+    "select_next_4_to_18": "Seleciona os próximos 4 números para completar 18",
+    "list_coldest_50_draws": "Lista os últimos 50 sorteios com os números frios",
+    "analyze_13_and_21": "Análise dos números 13 e 21",
+    "analyze_13_hits": "Jogos com 13 acertos e números que faltaram",
+    "analyze_14_hits": "Jogos com 14 acertos e números que faltaram",
+    "analyze_by_dozens": "Distribuição por dezenas",
+    "analyze_cold_numbers": "Análise dos 15 números mais frios",
+    "analyze_coldest_in_last_50": "Números frios nos últimos 50 sorteios",
+    "analyze_coldest_numbers": "Análise dos números mais frios",
+    "analyze_consecutives": "Números consecutivos",
+    "analyze_core_numbers": "Os 11 números da base (core)",
+    "analyze_cycles": "Ciclos e latência",
+    "analyze_cycles_prediction": "Previsão de próxima aparição por ciclos",
+    "analyze_last_20_draws": "Números que se repetiram nos últimos 20 sorteios",
+    "analyze_last_50_draws": "Últimos 50 sorteios contra a pool otimizada",
+    "analyze_new_combination": "Acertos de 13/14 com a nova combinação otimizada",
+    "analyze_numbers_10_13_21": "Análise dos números 10, 13 e 21",
+    "analyze_parity": "Paridade (par/ímpar)",
+    "analyze_pool_impact": "Impacto dos números da pool nos últimos 50 sorteios",
+    "analyze_removal_impact": "Impacto de remover 1 número do pool de 19",
+    "analyze_sum_total": "Soma total dos números sorteados",
+}
+
+# módulos pesados que não devem ser carregados pela própria CLI
+HEAVY_MODULES = ("pandas", "matplotlib", "seaborn", "networkx", "sklearn")
+
+# orçamento padrão de inicialização do comando "conferir" (segundos)
+DEFAULT_STARTUP_BUDGET = 1.0
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_script(name: str, argv: List[str]) -> int:
+    """
+    Executa um script de análise como se fosse chamado diretamente.
+
+    Args:
+        name: Nome do módulo em src (chave de SCRIPT_COMMANDS)
+        argv: Argumentos repassados ao script
+
+    Returns:
+        Código de saída (0 em caso de sucesso)
+    """
+    module = f"{__package__ or 'src'}.{name}"
+    sys.argv = [os.path.join(_REPO_ROOT, "src", f"{name}.py")] + argv
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    return 0
+
+
+def conferir(numbers: List[int], contest: int | None = None,
+             path: str = "data/lotofacil_sorteios.csv") -> int:
+    """
+    Confere uma aposta contra um sorteio (padrão: o último).
+
+    Usa apenas numpy e o cache binário (draw_cache); apostas de 16 a 20
+    números são desdobradas nas C(n, 15) apostas simples equivalentes.
+
+    Args:
+        numbers: Números da aposta (vazio = só mostra o sorteio)
+        contest: Número do concurso (None = último)
+        path: Arquivo de sorteios
+
+    Returns:
+        Código de saída (0 em caso de sucesso)
+    """
+    from .bitmask import N_NUMBERS
+    from .draw_cache import load_draw_table
+
+    table = load_draw_table(path, n_max=N_NUMBERS)
+    if contest is None:
+        pos = len(table) - 1
+    else:
+        matches = (table.contests == contest).nonzero()[0]
+        if matches.size == 0:
+            print(f"❌ Concurso {contest} não encontrado")
+            return 1
+        pos = int(matches[0])
+
+    drawn = sorted(int(n) for n in table.balls[pos])
+    date = table.dates[pos].item()
+    date_str = date.strftime("%d/%m/%Y") if date is not None else "-"
+    print(f"🎯 Concurso {int(table.contests[pos])} ({date_str})")
+    print(f"   Sorteados: {' '.join(f'{n:02d}' for n in drawn)}")
+    if not numbers:
+        return 0
+
+    bet = sorted(set(numbers))
+    if not (15 <= len(bet) <= 20) or not all(1 <= n <= N_NUMBERS for n in bet):
+        print(f"❌ Aposta inválida: use de 15 a 20 números distintos entre 1 e {N_NUMBERS}")
+        return 1
+
+    hits = len(set(bet) & set(drawn))
+    print(f"   Aposta:    {' '.join(f'{n:02d}' for n in bet)}")
+    print(f"   Acertos:   {hits}")
+
+    total = 0.0
+    for tier in range(15, 10, -1):
+        games = comb(hits, tier) * comb(len(bet) - hits, 15 - tier)
+        if games == 0:
+            continue
+        col = f"Rateio {tier} acertos"
+        value = table.money_column(col)[pos] / 100 if col in table.money_columns else 0.0
+        total += games * value
+        print(f"   {tier} acertos: {games:4d} jogo(s) × R$ {value:>12,.2f}")
+    print(f"   Prêmio total: R$ {total:,.2f}")
+    return 0
+
+
+def check_startup(budget: float = DEFAULT_STARTUP_BUDGET, runs: int = 5) -> int:
+    """
+    Verifica o orçamento de inicialização da CLI.
+
+    Mede o tempo de parede de "python -m src conferir" em subprocessos
+    (após um aquecimento que gera o cache) e confere que importar a CLI
+    não carrega nenhum dos HEAVY_MODULES.
+
+    Args:
+        budget: Tempo máximo aceito para a mediana das execuções (segundos)
+        runs: Quantidade de execuções medidas
+
+    Returns:
+        0 se dentro do orçamento, 1 caso contrário
+    """
+    package = __package__ or "src"
+    command = [sys.executable, "-m", package, "conferir"]
+    subprocess.run(command, cwd=_REPO_ROOT, check=True, capture_output=True)
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=_REPO_ROOT, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    median = times[len(times) // 2]
+
+    probe = (f"import sys, {package}.cli; "
+             f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, "-c", probe], cwd=_REPO_ROOT, check=True,
+                            capture_output=True, text=True).stdout.split()
+
+    ok = median <= budget and not loaded
+    print(f"{'✅' if ok else '❌'} conferir: mediana {median * 1000:.0f} ms "
+          f"(mín {times[0] * 1000:.0f} ms, orçamento {budget * 1000:.0f} ms, {runs} execuções)")
+    if loaded:
+        print(f"❌ Módulos pesados carregados na importação da CLI: {', '.join(loaded)}")
+    return 0 if ok else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser com os comandos nativos e um subcomando por script."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Análises da Lotofácil e da Mega-Sena",
+    )
+    sub = parser.add_subparsers(dest="command", required=True, metavar="comando")
+
+    p_check = sub.add_parser("conferir", help="Confere uma aposta contra o último sorteio")
+    p_check.add_argument("numeros", nargs="*", type=int, help="Números da aposta (15 a 20)")
+    p_check.add_argument("--concurso", type=int, help="Concurso a conferir (padrão: último)")
+    p_check.add_argument("--arquivo", default="data/lotofacil_sorteios.csv", help="Arquivo de sorteios")
+
+    p_startup = sub.add_parser("startup", help="Verifica o orçamento de tempo de inicialização")
+    p_startup.add_argument("--budget", type=float, default=DEFAULT_STARTUP_BUDGET,
+                           help="Tempo máximo em segundos (padrão: %(default)s)")
+    p_startup.add_argument("--runs", type=int, default=5, help="Execuções medidas")
+
+    for name, description in SCRIPT_COMMANDS.items():
+        p = sub.add_parser(name, help=description, add_help=False)
+        p.add_argument("args", nargs=argparse.REMAINDER)
+
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Ponto de entrada de python -m src."""
+    argv = sys.argv[1:] if argv is None else argv
+    # scripts recebem os argumentos sem passar pelo argparse da CLI
+    # (REMAINDER não captura opções como --help logo após o subcomando)
+    if argv and argv[0] in SCRIPT_COMMANDS:
+        return run_script(argv[0], argv[1:])
+
+    args = build_parser().parse_args(argv)
+
+    if args.command == "conferir":
+        return conferir(args.numeros, args.concurso, args.arquivo)
+    if args.command == "startup":
+        return check_startup(args.budget, args.runs)
+    return run_script(args.command, args.args)
@@ -7,28 +7,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
-from sklearn.cluster import DBSCAN
 
-from .grid_mapping import build_number_coord_map, GridSpec
-
-
-def _pairwise_manhattan(coords: np.ndarray) -> np.ndarray:
-    """
-    Calcula matriz de distâncias de Manhattan entre todos os pontos.
-    
-    Args:
-        coords: Array (N, 2) com coordenadas dos pontos
-        
-    Returns:
-        Matriz (N, N) com distâncias de Manhattan
-    """
-    N = coords.shape[0]
-    D = np.zeros((N, N), dtype=float)
-    for i in range(N):
-        for j in range(i+1, N):
-            d = abs(coords[i, 0] - coords[j, 0]) + abs(coords[i, 1] - coords[j, 1])
-            D[i, j] = D[j, i] = d
-    return D
+from .grid_mapping import GridSpec, grid_tables
 
 
 def cluster_numbers_dbscan(
@@ -70,14 +50,15 @@ def cluster_numbers_dbscan(
     nums = nums[:top_n]
 
     # mapeia para coordenadas
-    n2c = build_number_coord_map(spec)
+    tables = grid_tables(spec)
     selected_numbers = [n for n, _ in nums]
-    coords = np.array([n2c[n] for n in selected_numbers], dtype=int)
+    coords = tables.coords[selected_numbers].astype(int)
 
-    # calcula matriz de distâncias Manhattan
-    D = _pairwise_manhattan(coords)
+    # matriz de distâncias Manhattan (pré-calculada no grid)
+    D = tables.manhattan[np.ix_(selected_numbers, selected_numbers)].astype(float)
 
-    # aplica DBSCAN
+    # aplica DBSCAN (sklearn é importado só aqui, por ser pesado)
+    from sklearn.cluster import DBSCAN
     model = DBSCAN(eps=eps, min_samples=min_samples, metric="precomputed")
     labels = model.fit_predict(D)
 
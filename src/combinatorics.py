@@ -0,0 +1,269 @@
+"""
+Módulo de enumeração combinatória em bitmask.
+Gera combinações k-de-n diretamente como bitmasks de números (bit n-1 =
+número n), em blocos de arrays numpy, sem materializar tuplas Python, e
+converte apostas de/para seu índice no sistema numérico combinatório
+(posição colexicográfica), um identificador compacto de 4 bytes.
+"""
+from __future__ import annotations
+
+import numpy as np
+from math import comb
+from typing import Iterator, Sequence
+
+from .bitmask import (
+    N_NUMBERS, NUMBER_BITS, masks_to_numbers_array, numbers_array_to_masks, popcount
+)
+
+# inteiros varridos por bloco na enumeração (~4 MB em uint32)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# maior pool suportado (índices cabem em uint32)
+MAX_POOL_SIZE = 32
+
+# BINOMIAL[n, k] = C(n, k) para 0 <= n, k <= 25
+BINOMIAL = np.array([[comb(n, k) for k in range(N_NUMBERS + 1)]
+                     for n in range(N_NUMBERS + 1)], dtype=np.int64)
+
+
+def iter_index_masks(n: int, k: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     descending: bool = False) -> Iterator[np.ndarray]:
+    """
+    Enumera os subconjuntos de k posições entre n como bitmasks de índices.
+
+    Em ordem crescente de inteiro, que é a ordem colexicográfica (a mesma
+    do "Gosper's hack"). Cada bloco varre um intervalo de inteiros e mantém
+    os que têm exatamente k bits ligados.
+
+    Args:
+        n: Quantidade de posições (até 32)
+        k: Tamanho de cada subconjunto
+        chunk_size: Inteiros varridos por bloco
+        descending: Se True, enumera na ordem inversa
+
+    Yields:
+        Arrays uint32 de bitmasks de índices (bit i = posição i)
+    """
+    if not (0 <= n <= MAX_POOL_SIZE):
+        raise ValueError(f"Pool deve ter entre 0 e {MAX_POOL_SIZE} posições: {n}")
+    if not (0 <= k <= n):
+        return
+
+    first = (1 << k) - 1
+    last = first << (n - k)
+    starts = range(first, last + 1, chunk_size)
+    if descending:
+        starts = reversed(starts)
+
+    for start in starts:
+        stop = min(start + chunk_size, last + 1)
+        candidates = np.arange(start, stop, dtype=np.uint64).astype(np.uint32)
+        masks = candidates[popcount(candidates) == k]
+        if descending:
+            masks = masks[::-1]
+        if masks.size:
+            yield masks
+
+
+def _byte_tables(pool: Sequence[int]) -> np.ndarray:
+    """
+    Tabelas (4, 256) que traduzem cada byte de um bitmask de índices no
+    bitmask de números correspondente.
+    """
+    bits = np.zeros(MAX_POOL_SIZE, dtype=np.uint32)
+    bits[:len(pool)] = NUMBER_BITS[np.asarray(pool, dtype=np.int64)]
+
+    values = np.arange(256, dtype=np.uint32)
+    tables = np.zeros((4, 256), dtype=np.uint32)
+    for byte in range(4):
+        for bit in range(8):
+            selected = (values >> bit) & 1 == 1
+            tables[byte, selected] |= bits[byte * 8 + bit]
+    return tables
+
+
+def _translate(index_masks: np.ndarray, tables: np.ndarray) -> np.ndarray:
+    """Aplica as tabelas de _byte_tables a um array uint32 de índices."""
+    return (tables[0][index_masks & 0xFF]
+            | tables[1][(index_masks >> 8) & 0xFF]
+            | tables[2][(index_masks >> 16) & 0xFF]
+            | tables[3][index_masks >> 24])
+
+
+def index_masks_to_number_masks(index_masks: np.ndarray, pool: Sequence[int]) -> np.ndarray:
+    """
+    Converte bitmasks de posições do pool em bitmasks de números.
+
+    Args:
+        index_masks: Array de bitmasks de índices (bit i = pool[i])
+        pool: Números do pool, na ordem dos índices
+
+    Returns:
+        Array uint32 de bitmasks de números (bit n-1 = número n)
+    """
+    index_masks = np.asarray(index_masks, dtype=np.uint32)
+    return _translate(index_masks, _byte_tables(pool))
+
+
+def iter_combination_masks(pool: Sequence[int], k: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           order: str = "colex") -> Iterator[np.ndarray]:
+    """
+    Enumera todas as combinações de k números do pool como bitmasks.
+
+    Args:
+        pool: Números disponíveis (1..25)
+        k: Números por combinação
+        chunk_size: Inteiros varridos por bloco
+        order: "colex" (ordem colexicográfica das posições do pool) ou
+               "lex" (mesma ordem de itertools.combinations(pool, k))
+
+    Yields:
+        Arrays uint32 de bitmasks de números
+    """
+    pool = [int(n) for n in pool]
+    if order == "lex":
+        # lex sobre o pool = colex decrescente sobre o pool invertido
+        pool = pool[::-1]
+        descending = True
+    elif order == "colex":
+        descending = False
+    else:
+        raise ValueError(f"Ordem desconhecida: {order}")
+
+    tables = _byte_tables(pool)
+    for index_masks in iter_index_masks(len(pool), k, chunk_size, descending):
+        yield _translate(index_masks, tables)
+
+
+def count_combinations(n: int, k: int) -> int:
+    """
+    Calcula C(n, k).
+
+    Args:
+        n: Tamanho do pool
+        k: Tamanho da combinação
+
+    Returns:
+        Quantidade de combinações
+    """
+    return comb(n, k)
+
+
+def colex_rank(numbers: Sequence[int]) -> int:
+    """
+    Posição de uma combinação na ordem colexicográfica.
+
+    É a mesma posição em que iter_combination_masks(range(1, 26), k)
+    produz a combinação, então serve de índice direto para tabelas com
+    uma linha por combinação.
+
+    Args:
+        numbers: Números da combinação (1..25), em qualquer ordem
+
+    Returns:
+        Posição de 0 a C(25, k) - 1
+    """
+    return sum(comb(n - 1, i) for i, n in enumerate(sorted(int(n) for n in numbers), 1))
+
+
+def colex_unrank(rank: int, k: int, n: int = N_NUMBERS) -> list:
+    """
+    Combinação que ocupa uma posição na ordem colexicográfica.
+
+    Args:
+        rank: Posição de 0 a C(n, k) - 1
+        k: Números por combinação
+        n: Maior número possível
+
+    Returns:
+        Lista ordenada de números da combinação
+    """
+    if not (0 <= rank < comb(n, k)):
+        raise ValueError(f"Posição fora do intervalo: {rank}")
+    numbers = []
+    candidate = n
+    for i in range(k, 0, -1):
+        # maior c tal que C(c, i) <= rank
+        candidate -= 1
+        while comb(candidate, i) > rank:
+            candidate -= 1
+        numbers.append(candidate + 1)
+        rank -= comb(candidate, i)
+    return numbers[::-1]
+
+
+def rank_masks(masks: np.ndarray) -> np.ndarray:
+    """
+    Índice colexicográfico de cada aposta (versão vetorizada de colex_rank).
+
+    O índice é relativo ao tamanho da aposta: apostas de 15 números vão de
+    0 a 3.268.759 e apostas de tamanhos diferentes podem ter o mesmo índice.
+
+    Args:
+        masks: Array (M,) de bitmasks
+
+    Returns:
+        Array (M,) int64 de índices
+    """
+    masks = np.asarray(masks, dtype=np.uint32)
+    ranks = np.zeros(masks.shape, dtype=np.int64)
+    seen = np.zeros(masks.shape, dtype=np.int64)
+    for position in range(N_NUMBERS):
+        bit = ((masks >> np.uint32(position)) & np.uint32(1)).astype(np.int64)
+        seen += bit
+        ranks += bit * BINOMIAL[position, seen]
+    return ranks
+
+
+def unrank_masks(ranks: np.ndarray, k: int) -> np.ndarray:
+    """
+    Bitmasks das apostas de k números nos índices dados (inverso de rank_masks).
+
+    Args:
+        ranks: Array (M,) de índices de 0 a C(25, k) - 1
+        k: Números por aposta
+
+    Returns:
+        Array (M,) uint32 de bitmasks
+
+    Raises:
+        ValueError: Se algum índice estiver fora do intervalo
+    """
+    ranks = np.array(ranks, dtype=np.int64, ndmin=1)
+    if ranks.size and (ranks.min() < 0 or ranks.max() >= BINOMIAL[N_NUMBERS, k]):
+        raise ValueError(f"Índice fora do intervalo para apostas de {k} números")
+
+    masks = np.zeros(ranks.shape, dtype=np.uint32)
+    for i in range(k, 0, -1):
+        # maior posição c com C(c, i) <= índice restante
+        position = np.searchsorted(BINOMIAL[:N_NUMBERS, i], ranks, side='right') - 1
+        masks |= NUMBER_BITS[position + 1]
+        ranks = ranks - BINOMIAL[position, i]
+    return masks
+
+
+def rank_numbers(numbers: np.ndarray) -> np.ndarray:
+    """
+    Índices colexicográficos de apostas dadas como matriz de números.
+
+    Args:
+        numbers: Array (M, k) com números de 1 a 25 (qualquer ordem)
+
+    Returns:
+        Array (M,) int64 de índices
+    """
+    return rank_masks(numbers_array_to_masks(numbers))
+
+
+def unrank_numbers(ranks: np.ndarray, k: int) -> np.ndarray:
+    """
+    Apostas de k números nos índices dados, como matriz de números.
+
+    Args:
+        ranks: Array (M,) de índices
+        k: Números por aposta
+
+    Returns:
+        Array (M, k) uint8 com os números em ordem crescente
+    """
+    return masks_to_numbers_array(unrank_masks(ranks, k), k)
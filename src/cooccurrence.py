@@ -1,65 +1,194 @@
 """
 Módulo de análise de co-ocorrência de números.
-Calcula quais números tendem a sair juntos nos sorteios.
+Calcula quais números tendem a sair juntos nos sorteios: pares pela
+matriz de incidência (X.T @ X) e trios/quadras por contenção de bitmasks.
 """
 from __future__ import annotations
 
 import numpy as np
 import pandas as pd
-from typing import List
+from typing import List, Tuple
+
+from .bitmask import masks_to_numbers_array, numbers_array_to_masks
+from .combinatorics import iter_combination_masks
+from .hit_engine import DrawsLike, map_hit_blocks
+
+# nomes das colunas de cada número da tupla em top_pairs/top_tuples
+TUPLE_COLUMNS = ["a", "b", "c", "d", "e"]
+
+
+def incidence_matrix(df: pd.DataFrame, ball_cols: List[str], n_max: int = 25) -> np.ndarray:
+    """
+    Monta a matriz de incidência sorteios × números.
+
+    Args:
+        df: DataFrame com os sorteios
+        ball_cols: Lista de colunas contendo os números sorteados
+        n_max: Número máximo (25 para Lotofácil)
+
+    Returns:
+        Matriz (M, n_max) int64 onde [i, n-1] = 1 se o número n saiu no sorteio i
+    """
+    nums = df[ball_cols].to_numpy(dtype=np.int64)
+    X = np.zeros((nums.shape[0], n_max), dtype=np.int64)
+    X[np.arange(nums.shape[0])[:, np.newaxis], nums - 1] = 1
+    return X
+
+
+def cooccurrence_from_incidence(X: np.ndarray) -> np.ndarray:
+    """
+    Matriz de co-ocorrência a partir da matriz de incidência.
+
+    Args:
+        X: Matriz (M, n_max) 0/1 de incidência
+
+    Returns:
+        Matriz (n_max+1, n_max+1) com diagonal zero; índice 0 não é usado
+    """
+    X = np.asarray(X, dtype=np.int64)
+    n_max = X.shape[1]
+    mat = np.zeros((n_max + 1, n_max + 1), dtype=int)
+    mat[1:, 1:] = X.T @ X
+    np.fill_diagonal(mat, 0)
+    return mat
 
 
 def cooccurrence_matrix(df: pd.DataFrame, ball_cols: List[str], n_max: int = 25) -> np.ndarray:
     """
     Calcula a matriz de co-ocorrência de números.
-    
+
     Para cada par de números, conta quantas vezes eles aparecem juntos
-    no mesmo sorteio.
-    
+    no mesmo sorteio. Calculada como um único produto X.T @ X da matriz
+    de incidência sorteios × números.
+
     Args:
         df: DataFrame com os sorteios
         ball_cols: Lista de colunas contendo os números sorteados
         n_max: Número máximo (25 para Lotofácil)
-        
+
     Returns:
         Matriz numpy (26x26) onde mat[a][b] = quantas vezes os números a e b
         saíram juntos. Índice 0 não é usado.
     """
-    mat = np.zeros((n_max + 1, n_max + 1), dtype=int)  # 1..25 (ignorando 0)
-    
-    for nums in df[ball_cols].to_numpy():
-        nums = list(map(int, nums))
-        # conta todas as combinações de pares
-        for i in range(len(nums)):
-            for j in range(i+1, len(nums)):
-                a, b = nums[i], nums[j]
-                mat[a, b] += 1
-                mat[b, a] += 1  # matriz simétrica
-                
-    return mat
+    return cooccurrence_from_incidence(incidence_matrix(df, ball_cols, n_max))
+
+
+def top_k_indices(counts: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Índices dos top K valores, do maior para o menor.
+
+    Seleciona com argpartition (O(n)) e ordena só os K escolhidos. Empates
+    mantêm a ordem original do array, inclusive no corte do K-ésimo valor,
+    então o resultado é o mesmo de uma ordenação estável completa.
+
+    Args:
+        counts: Array 1-D de contagens
+        top_k: Quantidade de índices
+
+    Returns:
+        Array de até top_k índices
+    """
+    counts = np.asarray(counts)
+    n = counts.shape[0]
+    top_k = min(top_k, n)
+    if top_k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if top_k < n:
+        kth = counts[np.argpartition(-counts, top_k - 1)[top_k - 1]]
+        above = np.flatnonzero(counts > kth)
+        ties = np.flatnonzero(counts == kth)[:top_k - above.size]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(n)
+    return candidates[np.lexsort((candidates, -counts[candidates]))]
 
 
 def top_pairs(mat: np.ndarray, top_k: int = 50) -> pd.DataFrame:
     """
     Retorna os top K pares de números que mais saem juntos.
-    
+
     Args:
         mat: Matriz de co-ocorrência
         top_k: Quantidade de pares a retornar
-        
+
     Returns:
         DataFrame com colunas: a, b, count (ordenado por count decrescente)
     """
-    pairs = []
     n = mat.shape[0] - 1
-    
-    # percorre apenas triângulo superior para evitar duplicatas
-    for a in range(1, n+1):
-        for b in range(a+1, n+1):
-            pairs.append((a, b, int(mat[a, b])))
-    
-    # ordena por contagem decrescente
-    pairs.sort(key=lambda x: x[2], reverse=True)
-    pairs = pairs[:top_k]
-    
-    return pd.DataFrame(pairs, columns=["a", "b", "count"])
+
+    # triângulo superior (a < b), em ordem lexicográfica
+    a, b = np.triu_indices(n, k=1)
+    counts = mat[a + 1, b + 1]
+    best = top_k_indices(counts, top_k)
+
+    return pd.DataFrame({
+        "a": a[best] + 1,
+        "b": b[best] + 1,
+        "count": counts[best].astype(int),
+    })
+
+
+def tuple_cooccurrence(draws: DrawsLike, k: int, n_max: int = 25) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Conta quantas vezes cada k-tupla de números saiu completa num sorteio.
+
+    Para k=3 são 2.300 trios e para k=4, 12.650 quadras. Cada tupla é um
+    bitmask e a contagem usa o motor de acertos: a tupla está contida no
+    sorteio quando popcount(tupla & sorteio) == k.
+
+    Args:
+        draws: DrawStore ou array de bitmasks dos sorteios
+        k: Tamanho da tupla (2 a 5)
+        n_max: Número máximo (25 para Lotofácil)
+
+    Returns:
+        Tupla (tuplas (T, k) uint8 em ordem lexicográfica, contagens (T,) int64)
+    """
+    if not (2 <= k <= len(TUPLE_COLUMNS)):
+        raise ValueError(f"Tamanho de tupla não suportado: {k}")
+
+    masks = np.concatenate(list(iter_combination_masks(range(1, n_max + 1), k, order="lex")))
+    counts = np.zeros(masks.shape[0], dtype=np.int64)
+
+    def reduce(start: int, block: np.ndarray) -> None:
+        counts[start:start + block.shape[0]] = (block == k).sum(axis=1)
+
+    map_hit_blocks(reduce, masks, draws)
+    return masks_to_numbers_array(masks, k), counts
+
+
+def top_tuples(tuples: np.ndarray, counts: np.ndarray, top_k: int = 50) -> pd.DataFrame:
+    """
+    Retorna as top K tuplas (trios, quadras...) que mais saem juntas.
+
+    Args:
+        tuples: Array (T, k) retornado por tuple_cooccurrence
+        counts: Contagens (T,) retornadas por tuple_cooccurrence
+        top_k: Quantidade de tuplas a retornar
+
+    Returns:
+        DataFrame com colunas a, b, c[, d, e], count (count decrescente)
+    """
+    best = top_k_indices(counts, top_k)
+    k = tuples.shape[1]
+    frame = pd.DataFrame(tuples[best].astype(int), columns=TUPLE_COLUMNS[:k])
+    frame["count"] = counts[best].astype(int)
+    return frame
+
+
+def top_tuples_from_df(df: pd.DataFrame, ball_cols: List[str], k: int, top_k: int = 50) -> pd.DataFrame:
+    """
+    Atalho: top K tuplas de tamanho k direto do DataFrame de sorteios.
+
+    Args:
+        df: DataFrame com os sorteios
+        ball_cols: Lista de colunas contendo os números sorteados
+        k: Tamanho da tupla
+        top_k: Quantidade de tuplas a retornar
+
+    Returns:
+        DataFrame como em top_tuples
+    """
+    draw_masks = numbers_array_to_masks(df[ball_cols].to_numpy())
+    tuples, counts = tuple_cooccurrence(draw_masks, k)
+    return top_tuples(tuples, counts, top_k)
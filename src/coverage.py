@@ -0,0 +1,126 @@
+"""
+Módulo de cobertura exata de um portfólio de apostas.
+Confronta o portfólio com todos os C(25, 15) = 3.268.760 sorteios possíveis
+(e não só com o histórico), dando garantias do tipo "pelo menos 11 acertos
+em X% de todos os sorteios".
+"""
+from __future__ import annotations
+
+import re
+import numpy as np
+import pandas as pd
+from math import comb
+from typing import Dict, List
+from tqdm import tqdm
+
+from .bitmask import N_NUMBERS, popcount
+from .combinatorics import DEFAULT_CHUNK_SIZE, iter_combination_masks
+from .hit_engine import (
+    DEFAULT_BLOCK_ELEMENTS, MAX_HITS, PRIZE_TIERS, BetsLike, bets_to_masks, map_hit_blocks
+)
+from .probability import DRAW_SIZE
+
+DRAW_UNIVERSE_SIZE = comb(N_NUMBERS, DRAW_SIZE)
+
+
+def load_portfolio(path: str, column: str = 'numeros') -> List[List[int]]:
+    """
+    Lê um portfólio salvo em CSV.
+
+    Aceita os formatos de optimize_combinations.save_optimized_games
+    ("1,2,3,...") e de generate_more_games.save_games ("[1, 2, 3, ...]").
+
+    Args:
+        path: Arquivo CSV
+        column: Coluna com os números de cada aposta
+
+    Returns:
+        Lista de apostas (listas de números)
+    """
+    df = pd.read_csv(path)
+    return [[int(n) for n in re.findall(r'\d+', str(value))] for value in df[column]]
+
+
+def portfolio_coverage(bets: BetsLike, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       block_elements: int = DEFAULT_BLOCK_ELEMENTS, workers: int = 1,
+                       progress: bool = True) -> Dict[str, object]:
+    """
+    Cobertura exata de um portfólio sobre todos os sorteios possíveis.
+
+    O universo de sorteios é enumerado em blocos (iter_combination_masks)
+    e cada bloco é confrontado com o portfólio pelo motor de acertos, que
+    reduz a matriz sorteios × apostas ao melhor acerto de cada sorteio.
+
+    Args:
+        bets: Apostas do portfólio (ver hit_engine.bets_to_masks)
+        chunk_size: Inteiros varridos por bloco na enumeração do universo
+        block_elements: Tamanho máximo de cada bloco (sorteios × apostas)
+        workers: Threads usadas na contagem de acertos
+        progress: Mostra barra de progresso
+
+    Returns:
+        Dicionário com:
+        - apostas, sorteios: tamanho do portfólio e do universo
+        - melhor_acertos: array (16,) com quantos sorteios têm h como
+          melhor acerto do portfólio
+        - cobertura_%: array (16,) com o % de sorteios em que o portfólio
+          faz pelo menos h acertos
+        - premios_11 .. premios_15: pares (aposta, sorteio) com exatamente
+          11..15 acertos, somados sobre todo o universo
+        - sorteios_premiados: sorteios com pelo menos uma aposta premiada
+
+    Raises:
+        ValueError: Se o portfólio estiver vazio
+    """
+    bet_masks = bets_to_masks(bets)
+    if bet_masks.size == 0:
+        raise ValueError("Portfólio vazio")
+
+    best_hist = np.zeros(MAX_HITS + 1, dtype=np.int64)
+    with tqdm(total=DRAW_UNIVERSE_SIZE, desc="Cobertura", disable=not progress) as bar:
+        for draw_masks in iter_combination_masks(range(1, N_NUMBERS + 1), DRAW_SIZE, chunk_size):
+            best = np.empty(draw_masks.size, dtype=np.uint8)
+
+            def reduce(start: int, block: np.ndarray) -> None:
+                best[start:start + block.shape[0]] = block.max(axis=1)
+
+            # linhas = sorteios do universo, colunas = apostas do portfólio
+            map_hit_blocks(reduce, draw_masks, bet_masks, block_elements, workers)
+            best_hist += np.bincount(best, minlength=MAX_HITS + 1)
+            bar.update(draw_masks.size)
+
+    # contagem por faixa de cada aposta é combinatória: C(k, h) * C(25 - k, 15 - h)
+    sizes = np.bincount(popcount(bet_masks), minlength=N_NUMBERS + 1)
+    coverage = {
+        'apostas': int(bet_masks.size),
+        'sorteios': DRAW_UNIVERSE_SIZE,
+        'melhor_acertos': best_hist,
+        'cobertura_%': best_hist[::-1].cumsum()[::-1] / DRAW_UNIVERSE_SIZE * 100,
+    }
+    for tier in PRIZE_TIERS:
+        coverage[f'premios_{tier}'] = int(sum(
+            int(count) * comb(k, tier) * comb(N_NUMBERS - k, DRAW_SIZE - tier)
+            for k, count in enumerate(sizes) if count
+        ))
+    coverage['sorteios_premiados'] = int(best_hist[PRIZE_TIERS[0]:].sum())
+    return coverage
+
+
+def coverage_frame(coverage: Dict[str, object]) -> pd.DataFrame:
+    """
+    Tabela legível da distribuição de melhor acerto.
+
+    Args:
+        coverage: Resultado de portfolio_coverage
+
+    Returns:
+        DataFrame com acertos, sorteios com esse melhor acerto, % e % acumulado (h+)
+    """
+    hist = coverage['melhor_acertos']
+    frame = pd.DataFrame({
+        'acertos': np.arange(hist.size),
+        'sorteios': hist,
+        'percentual': hist / coverage['sorteios'] * 100,
+        'pelo_menos_%': coverage['cobertura_%'],
+    })
+    return frame[frame['sorteios'] > 0].iloc[::-1].reset_index(drop=True)
@@ -0,0 +1,349 @@
+"""
+Módulo de cache binário colunar dos arquivos de sorteios.
+Converte o CSV/XLSX de sorteios (Lotofácil ou Mega-Sena) em arrays .npy
+compactos — bolas uint8, concursos int32, datas e valores em centavos —
+e os carrega por memory mapping, sem reinterpretar o texto a cada execução.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import numpy as np
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple
+
+from .atomic_io import atomic_open, write_json
+
+# pandas só é necessário para (re)construir o cache; a leitura usa só numpy
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_CACHE_DIR = "out/cache"
+
+# arquivos de dados conhecidos e o maior número de cada jogo
+DEFAULT_SOURCES = {
+    "data/lotofacil_sorteios.csv": 25,
+    "data/Lotofacil.xlsx": 25,
+    "data/Mega-Sena.xlsx": 60,
+}
+
+# versão do formato em disco; mudar invalida os caches existentes
+CACHE_VERSION = 1
+
+_CONTEST_COLUMNS = ("Concurso", "concurso")
+_DATE_COLUMNS = ("Data Sorteio", "Data do Sorteio", "data")
+_ARRAYS = ("balls", "contests", "dates", "money", "winners")
+
+
+@dataclass(frozen=True)
+class DrawTable:
+    """
+    Colunas numéricas de um arquivo de sorteios, em arrays somente leitura.
+
+    Textos livres (cidades, observações) não são guardados.
+
+    Atributos:
+        balls: Array (M, k) uint8 com as bolas na ordem do arquivo
+        contests: Array (M,) int32 com o número do concurso
+        dates: Array (M,) datetime64[D] com a data do sorteio (NaT se ausente)
+        money: Array (M, P) float64 com os valores em R$ em centavos
+        winners: Array (M, W) int32 com a quantidade de ganhadores por faixa
+        ball_columns: Nomes das colunas de bolas
+        money_columns: Nomes das colunas de valores, na ordem de money
+        winner_columns: Nomes das colunas de ganhadores, na ordem de winners
+    """
+    balls: np.ndarray
+    contests: np.ndarray
+    dates: np.ndarray
+    money: np.ndarray
+    winners: np.ndarray
+    ball_columns: Tuple[str, ...]
+    money_columns: Tuple[str, ...]
+    winner_columns: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return int(self.balls.shape[0])
+
+    def money_column(self, name: str) -> np.ndarray:
+        """
+        Valores de uma coluna monetária em centavos.
+
+        Args:
+            name: Nome da coluna no arquivo original (ex.: "Rateio 15 acertos")
+
+        Returns:
+            Array (M,) float64 em centavos
+
+        Raises:
+            KeyError: Se a coluna não existir no arquivo
+        """
+        return self.money[:, self.money_columns.index(name)]
+
+    def winner_column(self, name: str) -> np.ndarray:
+        """
+        Quantidade de ganhadores de uma faixa.
+
+        Args:
+            name: Nome da coluna no arquivo original (ex.: "Ganhadores 15 acertos")
+
+        Returns:
+            Array (M,) int32
+        """
+        return self.winners[:, self.winner_columns.index(name)]
+
+
+def parse_money_cents(values: pd.Series) -> np.ndarray:
+    """
+    Converte valores no formato "R$1.234,56" em centavos.
+
+    Mesma regra de calculate_prize_money.parse_money (vazio/inválido = 0),
+    aplicada à coluna inteira de uma vez.
+
+    Args:
+        values: Série com os valores em texto (ou já numéricos)
+
+    Returns:
+        Array float64 em centavos (valores inteiros)
+    """
+    import pandas as pd
+
+    text = values.astype("string")
+    text = (text.str.replace("R$", "", regex=False)
+                .str.replace(".", "", regex=False)
+                .str.replace(",", ".", regex=False)
+                .str.strip())
+    reais = pd.to_numeric(text, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.nan_to_num(np.round(reais * 100), nan=0.0)
+
+
+def validate_ball_matrix(balls: np.ndarray, n_max: int, labels: Sequence | None = None) -> None:
+    """
+    Valida faixa (1..n_max) e duplicidades de cada sorteio em O(M·k).
+
+    Duplicidades saem de uma ordenação por linha seguida de diferença entre
+    vizinhos, sem laço Python por sorteio.
+
+    Args:
+        balls: Array (M, k) com as bolas de cada sorteio
+        n_max: Maior número válido
+        labels: Rótulos das linhas usados na mensagem de erro (padrão: posição)
+
+    Raises:
+        ValueError: Se houver números fora do intervalo ou duplicados no sorteio
+    """
+    balls = np.asarray(balls)
+
+    def first_labels(rows: np.ndarray) -> list:
+        positions = np.flatnonzero(rows)[:10]
+        return positions.tolist() if labels is None else [labels[i] for i in positions]
+
+    bad = ((balls < 1) | (balls > n_max)).any(axis=1)
+    if bad.any():
+        raise ValueError(f"Encontrados números fora de 1..{n_max} nas linhas: {first_labels(bad)} (mostrando até 10)")
+
+    dup = (np.diff(np.sort(balls, axis=1), axis=1) == 0).any(axis=1)
+    if dup.any():
+        raise ValueError(f"Encontradas duplicidades dentro do sorteio nas linhas: {first_labels(dup)} (mostrando até 10)")
+
+
+def _read_source(path: str) -> pd.DataFrame:
+    """Lê o arquivo de origem (CSV ou planilha Excel)."""
+    import pandas as pd
+
+    if path.lower().endswith((".xlsx", ".xls")):
+        return pd.read_excel(path)
+    return pd.read_csv(path)
+
+
+def _extract_columns(df: pd.DataFrame, n_max: int) -> Dict[str, object]:
+    """Separa e converte as colunas numéricas do DataFrame de sorteios."""
+    import pandas as pd
+
+    ball_cols = [c for c in df.columns if str(c).lower().startswith("bola")]
+    if not ball_cols:
+        raise ValueError("Nenhuma coluna de bolas (Bola1, Bola2, ...) encontrada")
+    balls = df[ball_cols].to_numpy(dtype=np.int64)
+    validate_ball_matrix(balls, n_max)
+
+    contest_col = next((c for c in _CONTEST_COLUMNS if c in df.columns), None)
+    if contest_col is not None:
+        contests = df[contest_col].to_numpy(dtype=np.int32)
+    else:
+        contests = np.arange(1, len(df) + 1, dtype=np.int32)
+
+    date_col = next((c for c in _DATE_COLUMNS if c in df.columns), None)
+    if date_col is not None:
+        dates = pd.to_datetime(df[date_col], dayfirst=True, errors="coerce").to_numpy(dtype="datetime64[D]")
+    else:
+        dates = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[D]")
+
+    money_cols = [c for c in df.columns
+                  if df[c].dtype == object or pd.api.types.is_string_dtype(df[c])]
+    money_cols = [c for c in money_cols if df[c].dropna().astype(str).str.startswith("R$").all()
+                  and df[c].notna().any()]
+    money = np.zeros((len(df), len(money_cols)), dtype=np.float64)
+    for j, col in enumerate(money_cols):
+        money[:, j] = parse_money_cents(df[col])
+
+    winner_cols = [c for c in df.columns if str(c).startswith("Ganhadores")]
+    winners = np.zeros((len(df), len(winner_cols)), dtype=np.int32)
+    for j, col in enumerate(winner_cols):
+        winners[:, j] = pd.to_numeric(df[col], errors="coerce").fillna(0).to_numpy(dtype=np.int32)
+
+    return {
+        "balls": balls.astype(np.uint8),
+        "contests": contests,
+        "dates": dates,
+        "money": money,
+        "winners": winners,
+        "ball_columns": ball_cols,
+        "money_columns": money_cols,
+        "winner_columns": winner_cols,
+    }
+
+
+def _file_sha256(path: str) -> str:
+    """Hash SHA-256 do conteúdo do arquivo."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path_for(path: str, cache_dir: str = DEFAULT_CACHE_DIR) -> str:
+    """
+    Diretório de cache de um arquivo de origem.
+
+    Args:
+        path: Arquivo de sorteios
+        cache_dir: Diretório raiz dos caches
+
+    Returns:
+        Caminho do diretório (nome do arquivo + hash do caminho absoluto)
+    """
+    key = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{os.path.basename(path)}-{key}")
+
+
+def _read_meta(meta_path: str) -> Dict[str, object] | None:
+    """Metadados do cache, ou None se ausentes/ilegíveis."""
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: str, data: Dict[str, object]) -> None:
+    """Grava JSON de forma atômica (temporário único + rename, ver atomic_io)."""
+    write_json(path, data, ensure_ascii=False, indent=2)
+
+
+def _is_fresh(meta: Dict[str, object] | None, stat: os.stat_result, path: str,
+              meta_path: str, n_max: int) -> bool:
+    """
+    Confere se o cache corresponde ao arquivo de origem.
+
+    Tamanho e mtime iguais bastam; se só o mtime mudou (arquivo tocado ou
+    copiado), compara o hash do conteúdo e atualiza os metadados.
+    """
+    if meta is None or meta.get("version") != CACHE_VERSION or meta.get("n_max") != n_max:
+        return False
+    if meta.get("size") != stat.st_size:
+        return False
+    if meta.get("mtime_ns") == stat.st_mtime_ns:
+        return True
+    if meta.get("sha256") != _file_sha256(path):
+        return False
+    meta["mtime_ns"] = stat.st_mtime_ns
+    _write_json(meta_path, meta)
+    return True
+
+
+def build_draw_cache(path: str, n_max: int = 25, cache_dir: str = DEFAULT_CACHE_DIR) -> str:
+    """
+    Converte um arquivo de sorteios para o cache binário colunar.
+
+    Args:
+        path: Arquivo CSV ou XLSX de sorteios
+        n_max: Maior número do jogo (25 na Lotofácil, 60 na Mega-Sena)
+        cache_dir: Diretório raiz dos caches
+
+    Returns:
+        Diretório do cache gerado
+
+    Raises:
+        ValueError: Se as bolas forem inválidas (ver validate_ball_matrix)
+    """
+    stat = os.stat(path)
+    columns = _extract_columns(_read_source(path), n_max)
+
+    target = cache_path_for(path, cache_dir)
+    os.makedirs(target, exist_ok=True)
+    for name in _ARRAYS:
+        final_path = os.path.join(target, f"{name}.npy")
+        with atomic_open(final_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(columns[name]))
+
+    _write_json(os.path.join(target, "meta.json"), {
+        "version": CACHE_VERSION,
+        "source": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _file_sha256(path),
+        "n_max": n_max,
+        "rows": len(columns["balls"]),
+        "ball_columns": columns["ball_columns"],
+        "money_columns": columns["money_columns"],
+        "winner_columns": columns["winner_columns"],
+    })
+    return target
+
+
+def load_draw_table(path: str, n_max: int = 25, cache_dir: str = DEFAULT_CACHE_DIR,
+                    refresh: bool = False) -> DrawTable:
+    """
+    Carrega um arquivo de sorteios pelo cache, reconstruindo-o se necessário.
+
+    O cache é reconstruído quando não existe, quando o arquivo de origem
+    mudou (tamanho/mtime e hash do conteúdo) ou com refresh=True. Os arrays
+    são abertos por memory mapping (somente leitura).
+
+    Args:
+        path: Arquivo CSV ou XLSX de sorteios
+        n_max: Maior número do jogo (25 na Lotofácil, 60 na Mega-Sena)
+        cache_dir: Diretório raiz dos caches
+        refresh: Força a reconversão do arquivo
+
+    Returns:
+        DrawTable com as colunas do arquivo
+    """
+    target = cache_path_for(path, cache_dir)
+    meta_path = os.path.join(target, "meta.json")
+    meta = _read_meta(meta_path)
+    if refresh or not _is_fresh(meta, os.stat(path), path, meta_path, n_max):
+        build_draw_cache(path, n_max, cache_dir)
+        meta = _read_meta(meta_path)
+
+    arrays = {name: np.load(os.path.join(target, f"{name}.npy"), mmap_mode="r") for name in _ARRAYS}
+    return DrawTable(
+        **arrays,
+        ball_columns=tuple(meta["ball_columns"]),
+        money_columns=tuple(meta["money_columns"]),
+        winner_columns=tuple(meta["winner_columns"]),
+    )
+
+
+def main():
+    """Pré-gera os caches dos arquivos de sorteios conhecidos."""
+    for path, n_max in DEFAULT_SOURCES.items():
+        if not os.path.exists(path):
+            continue
+        table = load_draw_table(path, n_max)
+        print(f"✓ {path}: {len(table)} sorteios → {cache_path_for(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,57 +5,194 @@ Exporta todos os dados e análises para formato Excel (.xlsx) com múltiplas aba
 facilitando a visualização e uso das análises.
 """
 
+import argparse
+import os
 import pandas as pd
 from pathlib import Path
 import json
-from openpyxl import load_workbook
+from typing import Callable, Iterable, List
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+# limite de linhas de uma aba do Excel (cabeçalho incluído)
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_SHEET_NAME = 31
+
+# modo streaming: linhas lidas por bloco dos CSVs e linhas usadas para a largura das colunas
+STREAM_CHUNK_ROWS = 50_000
+WIDTH_SAMPLE_ROWS = 1_000
+MAX_COLUMN_WIDTH = 50
+
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+
+WALK_FORWARD_GAMES = 'out/walk_forward/jogos_walk_forward.csv'
+
+
+def _games_sheet(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[['jogo_id', 'estrategia', 'numeros_str']]
+    df.columns = ['ID', 'Estratégia', 'Números']
+    return df
+
+
+def _backtesting_games_sheet(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[['jogo_id', 'strategy', 'avg_matches', 'prize_rate',
+             'prizes_11', 'prizes_12', 'prizes_13', 'prizes_14', 'prizes_15', 'numbers']]
+    df.columns = ['ID', 'Estratégia', 'Média Acertos', 'Taxa Prêmio %',
+                  '11 Acertos', '12 Acertos', '13 Acertos', '14 Acertos', '15 Acertos', 'Números']
+    return df
+
+
+def _walk_forward_sheet(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[['concurso', 'estrategia', 'jogo_id', 'numeros', 'acertos', 'premio']]
+    df.columns = ['Concurso', 'Estratégia', 'Jogo', 'Números', 'Acertos', 'Prêmio']
+    return df
+
+
+def _column_widths(header: List[str], sample: pd.DataFrame) -> List[float]:
+    """Largura de cada coluna pelo maior texto do cabeçalho e da amostra (como apply_formatting)."""
+    widths = []
+    for name, column in zip(header, sample.columns):
+        longest = max([len(str(name))] + [len(str(v)) for v in sample[column].tolist()])
+        widths.append(min(longest + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+
+class StreamingWorkbook:
+    """
+    Planilha gravada em modo write-only do openpyxl.
+
+    As linhas vão direto para o arquivo à medida que são escritas, então a
+    memória não cresce com o número de linhas. Cabeçalho, largura das
+    colunas (calculada nas primeiras WIDTH_SAMPLE_ROWS linhas) e painel
+    congelado são aplicados ao criar cada aba, e abas que passam de
+    EXCEL_MAX_ROWS linhas continuam em "<nome> (2)", "<nome> (3)", ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheetnames: List[str] = []
+
+    def __enter__(self) -> "StreamingWorkbook":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+
+    def close(self) -> None:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.workbook.save(self.path)
+
+    def _new_sheet(self, sheet_name: str, part: int, header: List[str], widths: List[float]):
+        suffix = f" ({part})" if part > 1 else ""
+        title = sheet_name[:EXCEL_MAX_SHEET_NAME - len(suffix)] + suffix
+        ws = self.workbook.create_sheet(title)
+        for i, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(i)].width = width
+        ws.freeze_panes = 'A2'
+        cells = []
+        for name in header:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.fill = HEADER_FILL
+            cell.font = HEADER_FONT
+            cell.alignment = HEADER_ALIGNMENT
+            cells.append(cell)
+        ws.append(cells)
+        self.sheetnames.append(title)
+        return ws
+
+    def write(self, frames: pd.DataFrame | Iterable[pd.DataFrame], sheet_name: str) -> int:
+        """
+        Grava uma tabela em uma ou mais abas.
+
+        Args:
+            frames: DataFrame ou blocos de DataFrame com as mesmas colunas
+            sheet_name: Nome da aba
+
+        Returns:
+            Quantidade de linhas de dados gravadas
+        """
+        if isinstance(frames, pd.DataFrame):
+            frames = [frames]
+        rows_per_sheet = EXCEL_MAX_ROWS - 1
+        ws, header, widths, part, used, total = None, None, None, 0, rows_per_sheet, 0
+        for chunk in frames:
+            if header is None:
+                header = [str(c) for c in chunk.columns]
+                widths = _column_widths(header, chunk.head(WIDTH_SAMPLE_ROWS))
+            values = chunk.astype(object).where(chunk.notna(), None)
+            for row in values.itertuples(index=False, name=None):
+                if used == rows_per_sheet:
+                    part += 1
+                    ws, used = self._new_sheet(sheet_name, part, header, widths), 0
+                ws.append(row)
+                used += 1
+            total += len(chunk)
+        if ws is None and header is not None:
+            self._new_sheet(sheet_name, 1, header, widths)
+        return total
+
 
 class ExcelExporter:
     """Exportador de análises para Excel"""
     
-    def __init__(self):
+    def __init__(self, streaming: bool = False):
+        """
+        Args:
+            streaming: Grava em modo write-only (StreamingWorkbook), lendo os
+                       CSVs grandes em blocos; a formatação é aplicada durante
+                       a gravação em vez de recarregar a planilha no fim
+        """
         self.output_file = 'out/LOTOFACIL_ANALISE_COMPLETA.xlsx'
+        self.streaming = streaming
+
+    def _write_sheet(self, writer, frames, sheet_name: str) -> None:
+        """Grava a tabela (DataFrame ou blocos) pelo writer do modo atual."""
+        if isinstance(writer, StreamingWorkbook):
+            writer.write(frames, sheet_name)
+            return
+        if not isinstance(frames, pd.DataFrame):
+            frames = pd.concat(list(frames), ignore_index=True)
+        frames.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    def _read_csv(self, path: str, transform: Callable[[pd.DataFrame], pd.DataFrame]):
+        """CSV transformado: inteiro no modo padrão, em blocos no modo streaming."""
+        if self.streaming:
+            return (transform(chunk) for chunk in pd.read_csv(path, chunksize=STREAM_CHUNK_ROWS))
+        return transform(pd.read_csv(path))
         
     def export_lotofacil_games(self, writer):
         """Exportar jogos otimizados da Lotofácil"""
         print("📄 Exportando jogos otimizados (30 jogos)...")
         
-        df = pd.read_csv('out/jogos_otimizados_combined.csv')
-        df = df[['jogo_id', 'estrategia', 'numeros_str']]
-        df.columns = ['ID', 'Estratégia', 'Números']
-        
-        df.to_excel(writer, sheet_name='Jogos Otimizados (30)', index=False)
+        df = self._read_csv('out/jogos_otimizados_combined.csv', _games_sheet)
+        self._write_sheet(writer, df, 'Jogos Otimizados (30)')
         
     def export_lotofacil_games_100(self, writer):
         """Exportar jogos adicionais (100 jogos)"""
         print("📄 Exportando jogos adicionais (100 jogos)...")
         
-        df = pd.read_csv('out/jogos_otimizados_100.csv')
-        df = df[['jogo_id', 'estrategia', 'numeros_str']]
-        df.columns = ['ID', 'Estratégia', 'Números']
-        
-        df.to_excel(writer, sheet_name='Jogos Otimizados (100)', index=False)
+        df = self._read_csv('out/jogos_otimizados_100.csv', _games_sheet)
+        self._write_sheet(writer, df, 'Jogos Otimizados (100)')
         
     def export_backtesting_results(self, writer):
         """Exportar resultados do backtesting"""
         print("📄 Exportando resultados do backtesting...")
         
         # Resultados por jogo
-        df_games = pd.read_csv('out/backtesting/resultados_por_jogo.csv')
-        df_games = df_games[['jogo_id', 'strategy', 'avg_matches', 'prize_rate', 
-                             'prizes_11', 'prizes_12', 'prizes_13', 'prizes_14', 'prizes_15', 'numbers']]
-        df_games.columns = ['ID', 'Estratégia', 'Média Acertos', 'Taxa Prêmio %', 
-                           '11 Acertos', '12 Acertos', '13 Acertos', '14 Acertos', '15 Acertos', 'Números']
-        df_games.to_excel(writer, sheet_name='Backtesting - Jogos', index=False)
+        df_games = self._read_csv('out/backtesting/resultados_por_jogo.csv', _backtesting_games_sheet)
+        self._write_sheet(writer, df_games, 'Backtesting - Jogos')
         
         # Resultados por estratégia
         df_strat = pd.read_csv('out/backtesting/resultados_por_estrategia.csv')
         df_strat.columns = ['Estratégia', 'Qtd Jogos', 'Média Acertos', 'Melhor Acerto',
                            'Taxa Prêmio %', '11 Acertos', '12 Acertos', '13 Acertos', '14 Acertos', '15 Acertos']
-        df_strat.to_excel(writer, sheet_name='Backtesting - Estratégias', index=False)
+        self._write_sheet(writer, df_strat, 'Backtesting - Estratégias')
         
     def export_lotofacil_analysis(self, writer):
         """Exportar análises da Lotofácil"""
@@ -64,23 +201,23 @@ class ExcelExporter:
         # Números quentes/frios
         df_hot = pd.read_csv('out/lotofacil/numeros_quentes_frios.csv')
         df_hot.columns = ['Número', 'Frequência', 'Esperado', 'Desvio %', 'Categoria']
-        df_hot.to_excel(writer, sheet_name='Números Quentes-Frios', index=False)
+        self._write_sheet(writer, df_hot, 'Números Quentes-Frios')
         
         # Super pares
         df_pairs = pd.read_csv('out/lotofacil/pares_forca.csv')
         df_pairs = df_pairs[df_pairs['categoria'].str.contains('Super Par|Forte', na=False)]
         df_pairs.columns = ['Número A', 'Número B', 'Aparições', 'Força %', 'Categoria']
-        df_pairs.to_excel(writer, sheet_name='Super Pares', index=False)
+        self._write_sheet(writer, df_pairs, 'Super Pares')
         
         # Frequência por linhas
         df_lines = pd.read_csv('out/lotofacil/freq_linhas.csv')
         df_lines.columns = ['Linha', 'Frequência']
-        df_lines.to_excel(writer, sheet_name='Frequência Linhas', index=False)
+        self._write_sheet(writer, df_lines, 'Frequência Linhas')
         
         # Frequência por colunas
         df_cols = pd.read_csv('out/lotofacil/freq_colunas.csv')
         df_cols.columns = ['Coluna', 'Frequência']
-        df_cols.to_excel(writer, sheet_name='Frequência Colunas', index=False)
+        self._write_sheet(writer, df_cols, 'Frequência Colunas')
         
     def export_megasena_summary(self, writer):
         """Exportar resumo da análise Mega-Sena"""
@@ -110,7 +247,7 @@ class ExcelExporter:
             })
         
         df_summary = pd.DataFrame(summary_data)
-        df_summary.to_excel(writer, sheet_name='Mega-Sena (Amostra)', index=False)
+        self._write_sheet(writer, df_summary, 'Mega-Sena (Amostra)')
         
     def export_combined_insights(self, writer):
         """Exportar insights da análise combinada"""
@@ -156,7 +293,7 @@ class ExcelExporter:
         ]
         
         df_insights = pd.DataFrame(insights_data)
-        df_insights.to_excel(writer, sheet_name='Insights Combinados', index=False)
+        self._write_sheet(writer, df_insights, 'Insights Combinados')
         
     def export_recommendations(self, writer):
         """Exportar recomendações finais"""
@@ -176,7 +313,7 @@ class ExcelExporter:
         ]
         
         df_rec = pd.DataFrame(recommendations_data)
-        df_rec.to_excel(writer, sheet_name='Recomendações', index=False)
+        self._write_sheet(writer, df_rec, 'Recomendações')
         
         # Adicionar resumo de expectativas
         expectativas_data = [
@@ -188,7 +325,7 @@ class ExcelExporter:
         ]
         
         df_exp = pd.DataFrame(expectativas_data)
-        df_exp.to_excel(writer, sheet_name='Expectativas', index=False)
+        self._write_sheet(writer, df_exp, 'Expectativas')
         
     def apply_formatting(self):
         """Aplicar formatação ao arquivo Excel"""
@@ -196,18 +333,14 @@ class ExcelExporter:
         
         wb = load_workbook(self.output_file)
         
-        # Cores
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
             
             # Formatar cabeçalho
             for cell in ws[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+                cell.fill = HEADER_FILL
+                cell.font = HEADER_FONT
+                cell.alignment = HEADER_ALIGNMENT
             
             # Ajustar largura das colunas
             for column in ws.columns:
@@ -221,7 +354,7 @@ class ExcelExporter:
                     except:
                         pass
                 
-                adjusted_width = min(max_length + 2, 50)
+                adjusted_width = min(max_length + 2, MAX_COLUMN_WIDTH)
                 ws.column_dimensions[column_letter].width = adjusted_width
             
             # Congelar primeira linha
@@ -229,24 +362,43 @@ class ExcelExporter:
         
         wb.save(self.output_file)
         
+    def export_walk_forward(self, writer):
+        """Exportar os jogos do walk-forward (um por estratégia e concurso; só no modo streaming)"""
+        print("📄 Exportando jogos do walk-forward...")
+        
+        df = self._read_csv(WALK_FORWARD_GAMES, _walk_forward_sheet)
+        self._write_sheet(writer, df, 'Walk-forward - Jogos')
+        
+    def _export_sheets(self, writer):
+        """Exportar cada aba"""
+        self.export_lotofacil_games(writer)
+        self.export_lotofacil_games_100(writer)
+        self.export_backtesting_results(writer)
+        self.export_lotofacil_analysis(writer)
+        self.export_megasena_summary(writer)
+        self.export_combined_insights(writer)
+        self.export_recommendations(writer)
+        if self.streaming and os.path.exists(WALK_FORWARD_GAMES):
+            self.export_walk_forward(writer)
+        
     def export_all(self):
         """Exportar tudo para Excel"""
         print("=" * 80)
         print("📊 EXPORTANDO ANÁLISES PARA EXCEL")
         print("=" * 80)
         
-        with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
-            # Exportar cada aba
-            self.export_lotofacil_games(writer)
-            self.export_lotofacil_games_100(writer)
-            self.export_backtesting_results(writer)
-            self.export_lotofacil_analysis(writer)
-            self.export_megasena_summary(writer)
-            self.export_combined_insights(writer)
-            self.export_recommendations(writer)
-        
-        # Aplicar formatação
-        self.apply_formatting()
+        if self.streaming:
+            # formatação aplicada durante a gravação
+            with StreamingWorkbook(self.output_file) as writer:
+                self._export_sheets(writer)
+            sheetnames = writer.sheetnames
+        else:
+            with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
+                self._export_sheets(writer)
+                sheetnames = list(writer.book.sheetnames)
+            
+            # Aplicar formatação
+            self.apply_formatting()
         
         print("\n" + "=" * 80)
         print(f"✅ EXPORTAÇÃO CONCLUÍDA!")
@@ -254,15 +406,23 @@ class ExcelExporter:
         print("=" * 80)
         
         # Listar abas criadas
-        wb = load_workbook(self.output_file)
-        print(f"\n📋 Abas criadas ({len(wb.sheetnames)}):")
-        for i, sheet_name in enumerate(wb.sheetnames, 1):
+        print(f"\n📋 Abas criadas ({len(sheetnames)}):")
+        for i, sheet_name in enumerate(sheetnames, 1):
             print(f"   {i}. {sheet_name}")
 
 
-def main():
+def main(argv=None):
     """Executar exportação"""
-    exporter = ExcelExporter()
+    parser = argparse.ArgumentParser(description="Exporta dados e análises para Excel")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Grava em modo write-only (memória constante, abas divididas em "
+                             f"{EXCEL_MAX_ROWS:,} linhas) e inclui os jogos do walk-forward")
+    parser.add_argument("--out", help="Arquivo de saída (.xlsx)")
+    args = parser.parse_args(argv)
+
+    exporter = ExcelExporter(streaming=args.streaming)
+    if args.out:
+        exporter.output_file = args.out
     exporter.export_all()
 
 
@@ -0,0 +1,186 @@
+"""
+Módulo de renderização de figuras em lote.
+Força o backend Agg (sem janela), distribui as figuras entre processos e
+pula as figuras cujo hash dos dados de entrada (e do módulo da função de
+plot) não mudou desde a última renderização. O hash de cada figura fica
+em um arquivo próprio, então processos que renderizam figuras diferentes
+ao mesmo tempo (ex.: etapas paralelas do pipeline) não disputam o estado.
+
+É importado tanto como src.figure_renderer (src/main.py) quanto como
+figure_renderer (scripts da Mega-Sena, que colocam src/ no path); por isso
+atomic_io é importado das duas formas.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import matplotlib
+import numpy as np
+
+try:
+    from .atomic_io import atomic_open
+except ImportError:  # importado como figure_renderer, sem pacote
+    from atomic_io import atomic_open
+
+matplotlib.use("Agg")
+
+DEFAULT_FIGURE_STATE_DIR = "out/state/figures"
+
+# figuras por tarefa enviada a cada processo (por processo, em média)
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class FigureJob:
+    """
+    Uma figura a renderizar.
+
+    Atributos:
+        output_path: Arquivo de saída
+        func: Função de plot de módulo (ex.: plot_heatmap_grid)
+        kwargs: Dados passados à função
+        path_arg: Nome do argumento de func que recebe output_path
+        code: Outros arquivos de código usados pela figura, além do módulo de func
+    """
+    output_path: str
+    func: Callable[..., object]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    path_arg: str = "output_path"
+    code: Sequence[str] = ()
+
+
+def _update_hash(h, obj) -> None:
+    """Alimenta o hash com o conteúdo de obj (arrays e DataFrames pelo conteúdo)."""
+    if isinstance(obj, np.ndarray):
+        h.update(f"nd{obj.dtype.str}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif type(obj).__module__.startswith("pandas"):
+        import pandas as pd
+        h.update(f"pd{type(obj).__name__}{list(getattr(obj, 'columns', []))}".encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for key in sorted(obj, key=repr):
+            _update_hash(h, key)
+            _update_hash(h, obj[key])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for item in obj:
+            _update_hash(h, item)
+        h.update(b"]")
+    else:
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+
+
+def job_hash(job: FigureJob) -> str:
+    """
+    Hash dos dados de entrada da figura e do código que a desenha.
+
+    O código é o arquivo inteiro do módulo de func (estilos, classes e
+    funções auxiliares incluídos) mais os arquivos de job.code.
+
+    Args:
+        job: Figura
+
+    Returns:
+        sha256 em hexadecimal
+    """
+    h = hashlib.sha256()
+    h.update(f"{job.func.__module__}.{job.func.__qualname__}".encode())
+    try:
+        sources = [inspect.getsourcefile(job.func)] + list(job.code)
+    except TypeError:
+        sources = list(job.code)
+    for path in sources:
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                h.update(hashlib.sha256(f.read()).digest())
+    _update_hash(h, job.kwargs)
+    return h.hexdigest()
+
+
+def _state_file(state_dir: str, output_path: str) -> str:
+    """Arquivo com o hash da figura (ex.: out/heatmap_grid.png -> out__heatmap_grid.png.sha256)."""
+    name = os.path.normpath(output_path).replace(os.sep, "__").replace(":", "_")
+    return os.path.join(state_dir, name + ".sha256")
+
+
+def _load_hash(state_dir: str, output_path: str) -> str | None:
+    try:
+        with open(_state_file(state_dir, output_path), encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _save_hash(state_dir: str, output_path: str, digest: str) -> None:
+    """Grava o hash de uma figura de forma atômica (ver atomic_io)."""
+    os.makedirs(state_dir, exist_ok=True)
+    with atomic_open(_state_file(state_dir, output_path), "w", encoding="utf-8") as f:
+        f.write(digest + "\n")
+
+
+def _render_chunk(jobs: Sequence[FigureJob]) -> List[Tuple[str, str | None]]:
+    """Renderiza figuras em sequência no processo atual; retorna (caminho, erro ou None)."""
+    import matplotlib.pyplot as plt
+    out = []
+    for job in jobs:
+        os.makedirs(os.path.dirname(job.output_path) or ".", exist_ok=True)
+        try:
+            job.func(**job.kwargs, **{job.path_arg: job.output_path})
+            out.append((job.output_path, None))
+        except Exception as exc:
+            out.append((job.output_path, f"{type(exc).__name__}: {exc}"))
+        finally:
+            plt.close("all")
+    return out
+
+
+def render_figures(jobs: Sequence[FigureJob], workers: int = 1, force: bool = False,
+                   state_dir: str = DEFAULT_FIGURE_STATE_DIR) -> Dict[str, int]:
+    """
+    Renderiza as figuras desatualizadas, em paralelo quando workers > 1.
+
+    Cada processo importa o matplotlib uma vez e renderiza um bloco de
+    figuras em sequência, então o custo de inicialização é pago por
+    processo e não por figura; funções que reaproveitam uma figura entre
+    chamadas (ex.: render_draw_grid) a reaproveitam dentro do bloco.
+
+    Args:
+        jobs: Figuras
+        workers: Processos usados (1 = no próprio processo)
+        force: Renderiza mesmo as figuras atualizadas
+        state_dir: Diretório com o hash de cada figura renderizada (um arquivo por figura)
+
+    Returns:
+        Dicionário com 'renderizadas' e 'puladas'
+
+    Raises:
+        RuntimeError: Se alguma figura falhar (as demais são gravadas e registradas)
+    """
+    hashes = {job.output_path: job_hash(job) for job in jobs}
+    pending = [job for job in jobs
+               if force or _load_hash(state_dir, job.output_path) != hashes[job.output_path]
+               or not os.path.exists(job.output_path)]
+
+    if workers <= 1 or len(pending) <= 1:
+        results = _render_chunk(pending)
+    else:
+        size = max(1, -(-len(pending) // (workers * CHUNKS_PER_WORKER)))
+        chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [item for part in pool.map(_render_chunk, chunks) for item in part]
+
+    errors = [f"{path}: {error}" for path, error in results if error is not None]
+    for path, error in results:
+        if error is None:
+            _save_hash(state_dir, path, hashes[path])
+    if errors:
+        raise RuntimeError("Falha ao renderizar figuras:\n" + "\n".join(errors))
+    return {'renderizadas': len(pending), 'puladas': len(jobs) - len(pending)}
@@ -1,16 +1,22 @@
-import pandas as pd
+import os
+import sys
 import numpy as np
 from pathlib import Path
-from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+from src.pool_search import search_pools
 
 def find_optimal_18_pool():
-    # Carregar sorteios
-    df = pd.read_csv('data/lotofacil_sorteios.csv')
+    # Carregar sorteios (bitmasks compartilhados)
+    store = load_draw_store()
+    numeros_por_sorteio = store.numbers()
     
     print("=" * 140)
     print("BUSCA PELO POOL ÓTIMO DE 18 NÚMEROS (MÁXIMO DE JOGOS PERFEITOS)")
     print("=" * 140)
-    print(f"\nTotal de sorteios históricos: {len(df)}")
+    print(f"\nTotal de sorteios históricos: {len(store)}")
     
     # ETAPA 1: Encontrar TODOS os jogos perfeitos possíveis (testando pools)
     # Como temos 25 números, vamos analisar a frequência de cada número nos sorteios históricos
@@ -22,26 +28,18 @@ def find_optimal_18_pool():
     # Para cada sorteio, os 15 números que saíram são um "jogo perfeito" potencial
     # Vamos contar quantas vezes cada número apareceu em sorteios
     
-    freq_em_sorteios = {}
-    
-    for numero in range(1, 26):
-        count = 0
-        for idx, row in df.iterrows():
-            numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-            if numero in numeros_sorteados:
-                count += 1
-        
-        freq_em_sorteios[numero] = count
+    freq = store.frequencies()
+    freq_em_sorteios = {numero: int(freq[numero]) for numero in range(1, 26)}
     
     # Ordenar números por frequência
     numeros_ordenados = sorted(freq_em_sorteios.items(), key=lambda x: x[1], reverse=True)
     
-    print(f"\nFREQUÊNCIA DE CADA NÚMERO NOS {len(df)} SORTEIOS:")
+    print(f"\nFREQUÊNCIA DE CADA NÚMERO NOS {len(store)} SORTEIOS:")
     print(f"\n{'Rank':>5} | {'Número':>8} | {'Aparições':>12} | {'Frequência':>12}")
     print("-" * 50)
     
     for rank, (numero, count) in enumerate(numeros_ordenados, 1):
-        freq_pct = (count / len(df)) * 100
+        freq_pct = (count / len(store)) * 100
         destaque = "👉" if rank <= 18 else "  "
         print(f"{destaque}{rank:4d} | {numero:8d} | {count:12d} | {freq_pct:11.2f}%")
     
@@ -62,17 +60,14 @@ def find_optimal_18_pool():
     print("=" * 140)
     
     jogos_perfeitos = []
+    acertos_top_18 = store.hits(top_18_numeros)
     
-    for idx, row in df.iterrows():
-        numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-        acertos = len([n for n in numeros_sorteados if n in top_18_numeros])
-        
-        if acertos == 15:
-            jogos_perfeitos.append({
-                'Concurso': row['Concurso'],
-                'Data': row['Data Sorteio'],
-                'Numeros': numeros_sorteados
-            })
+    for idx in np.flatnonzero(acertos_top_18 == 15):
+        jogos_perfeitos.append({
+            'Concurso': int(store.contests[idx]),
+            'Data': store.format_date(idx),
+            'Numeros': numeros_por_sorteio[idx].tolist()
+        })
     
     print(f"\n🎯 JOGOS PERFEITOS ENCONTRADOS: {len(jogos_perfeitos)}")
     
@@ -88,69 +83,57 @@ def find_optimal_18_pool():
     print("ETAPA 4: DISTRIBUIÇÃO DE ACERTOS COM ESTE POOL")
     print("=" * 140)
     
-    distribuicao = {i: 0 for i in range(16)}
-    
-    for idx, row in df.iterrows():
-        numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-        acertos = len([n for n in numeros_sorteados if n in top_18_numeros])
-        distribuicao[acertos] += 1
+    contagem = np.bincount(acertos_top_18, minlength=16)
+    distribuicao = {i: int(contagem[i]) for i in range(16)}
     
     print(f"\n{'Acertos':>10} | {'Quantidade':>15} | {'Percentual':>15}")
     print("-" * 45)
     
     for acertos in range(15, 8, -1):
-        pct = (distribuicao[acertos] / len(df)) * 100
+        pct = (distribuicao[acertos] / len(store)) * 100
         print(f"{acertos:>10} | {distribuicao[acertos]:>15} | {pct:>14.2f}%")
     
     total_13_plus = distribuicao[13] + distribuicao[14] + distribuicao[15]
-    pct_13_plus = (total_13_plus / len(df)) * 100
+    pct_13_plus = (total_13_plus / len(store)) * 100
     
     print("-" * 45)
     print(f"{'13+ total':>10} | {total_13_plus:>15} | {pct_13_plus:>14.2f}%")
     
-    # ETAPA 5: Testar variações (remover 1 dos 18 e adicionar outro dos 7 restantes)
+    # ETAPA 5: Busca exata entre todos os C(25, 18) = 480.700 pools
     print("\n" + "=" * 140)
-    print("ETAPA 5: TESTANDO VARIAÇÕES (TROCAR 1 NÚMERO DOS 18)")
+    print("ETAPA 5: BUSCA EXATA EM TODOS OS POOLS DE 18 NÚMEROS")
     print("=" * 140)
     
     numeros_fora = [num for num, _ in numeros_ordenados[18:]]
     
     print(f"\nNúmeros FORA do top 18: {numeros_fora}")
-    print(f"\nTestando se alguma troca melhora o resultado...\n")
+    print(f"\nAvaliando todos os pools (critério: perfeitos, depois 14+ e 13+)...\n")
     
     melhor_pool = top_18_numeros.copy()
     melhor_perfeitos = len(jogos_perfeitos)
     
     melhores_alternativas = []
     
-    for num_remover in top_18_numeros:
-        for num_adicionar in numeros_fora:
-            pool_teste = [n for n in top_18_numeros if n != num_remover]
-            pool_teste.append(num_adicionar)
-            pool_teste.sort()
-            
-            # Contar perfeitos
-            count_perfeitos = 0
-            for idx, row in df.iterrows():
-                numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-                acertos = len([n for n in numeros_sorteados if n in pool_teste])
-                if acertos == 15:
-                    count_perfeitos += 1
-            
-            if count_perfeitos > melhor_perfeitos:
-                melhor_perfeitos = count_perfeitos
-                melhor_pool = pool_teste.copy()
-                melhores_alternativas.append({
-                    'pool': pool_teste.copy(),
-                    'perfeitos': count_perfeitos,
-                    'troca': f"Remover {num_remover}, Adicionar {num_adicionar}"
-                })
-                print(f"✅ MELHORIA ENCONTRADA: {count_perfeitos} perfeitos")
-                print(f"   Troca: Remover {num_remover}, Adicionar {num_adicionar}")
-                print(f"   Novo pool: {pool_teste}\n")
-    
-    if not melhores_alternativas:
-        print("✅ Nenhuma troca simples melhora o resultado!")
+    ranking = search_pools(store, 18, top=10, order="15")
+    for _, row in ranking.iterrows():
+        if row['jogos_15'] > melhor_perfeitos and row['pool'] != top_18_numeros:
+            melhores_alternativas.append({
+                'pool': row['pool'],
+                'perfeitos': int(row['jogos_15']),
+                'troca': f"Remover {sorted(set(top_18_numeros) - set(row['pool']))}, "
+                         f"Adicionar {sorted(set(row['pool']) - set(top_18_numeros))}"
+            })
+    
+    if melhores_alternativas:
+        melhor = melhores_alternativas[0]
+        melhor_pool = melhor['pool']
+        melhor_perfeitos = melhor['perfeitos']
+        for alt in melhores_alternativas:
+            print(f"✅ {alt['perfeitos']} perfeitos")
+            print(f"   Troca: {alt['troca']}")
+            print(f"   Pool: {alt['pool']}\n")
+    else:
+        print("✅ Nenhum pool tem mais jogos perfeitos!")
         print("   O pool top 18 por frequência já é ótimo.\n")
     
     # ETAPA 6: Análise nos últimos 50 sorteios
@@ -158,12 +141,9 @@ def find_optimal_18_pool():
     print("ETAPA 6: DESEMPENHO NOS ÚLTIMOS 50 SORTEIOS")
     print("=" * 140)
     
-    ultimos_50 = df.tail(50)
+    ultimos_50 = store.tail(50)
     
-    total_acertos = 0
-    for idx, row in ultimos_50.iterrows():
-        numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-        total_acertos += len([n for n in numeros_sorteados if n in melhor_pool])
+    total_acertos = int(ultimos_50.hits(melhor_pool).sum())
     
     media_50 = total_acertos / 50
     
@@ -175,17 +155,8 @@ def find_optimal_18_pool():
     pool_13_21 = [1, 2, 3, 4, 5, 6, 8, 9, 11, 12, 13, 15, 16, 18, 19, 20, 21, 23, 25]
     
     # Contar perfeitos dos pools anteriores
-    perfeitos_original = 0
-    perfeitos_13_21 = 0
-    
-    for idx, row in df.iterrows():
-        numeros_sorteados = [row[f'Bola{i}'] for i in range(1, 16)]
-        
-        if len([n for n in numeros_sorteados if n in pool_original]) == 15:
-            perfeitos_original += 1
-        
-        if len([n for n in numeros_sorteados if n in pool_13_21]) == 15:
-            perfeitos_13_21 += 1
+    perfeitos_original = int((store.hits(pool_original) == 15).sum())
+    perfeitos_13_21 = int((store.hits(pool_13_21) == 15).sum())
     
     print("\n" + "=" * 140)
     print("📊 COMPARAÇÃO COM POOLS ANTERIORES")
@@ -219,7 +190,7 @@ def find_optimal_18_pool():
     
     for num in numeros_fora_final:
         freq = freq_em_sorteios[num]
-        freq_pct = (freq / len(df)) * 100
+        freq_pct = (freq / len(store)) * 100
         print(f"   • {num:2d}: {freq:4d} aparições ({freq_pct:.2f}%)")
     
     # Salvar resultados
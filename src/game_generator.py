@@ -7,7 +7,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 from typing import List, Set, Tuple, Dict
-from .grid_mapping import build_number_coord_map, GridSpec
+from .bitmask import mask_to_numbers
+from .grid_mapping import GRID, GridSpec
 
 
 class LotofacilGameGenerator:
@@ -28,7 +29,6 @@ class LotofacilGameGenerator:
         self.pairs = pairs_df
         self.trends = trends_df
         self.bias = bias
-        self.n2c = build_number_coord_map()
         
         # Pré-processa dados para otimização
         self._build_weights()
@@ -92,12 +92,16 @@ class LotofacilGameGenerator:
         hot_count = int(n_numbers * 0.7)
         hot_numbers = self.hot_cold.head(hot_count)['numero'].tolist()
         
-        # Completa com números médios aleatórios
+        # Completa com números médios aleatórios que ainda não estão no jogo
+        # (com poucos quentes, os primeiros da tabela podem ser médios)
         medium = self.hot_cold[
-            (self.hot_cold['categoria'] == '🌡️ Médio')
+            (self.hot_cold['categoria'] == '🌡️ Médio') & ~self.hot_cold['numero'].isin(hot_numbers)
         ]['numero'].tolist()
         
         remaining = n_numbers - len(hot_numbers)
+        if remaining > len(medium):
+            # médios insuficientes: completa com os demais números fora do jogo
+            medium += self.hot_cold[~self.hot_cold['numero'].isin(hot_numbers + medium)]['numero'].tolist()
         if remaining > 0:
             selected_medium = np.random.choice(medium, size=remaining, replace=False)
             hot_numbers.extend(selected_medium.tolist())
@@ -160,15 +164,8 @@ class LotofacilGameGenerator:
         center_target = n_numbers - edge_target
         
         # Separa números em bordas e centro
-        edge_nums = []
-        center_nums = []
-        
-        for num in range(1, 26):
-            r, c = self.n2c[num]
-            if r == 0 or r == 4 or c == 0 or c == 4:
-                edge_nums.append(num)
-            else:
-                center_nums.append(num)
+        edge_nums = mask_to_numbers(GRID.edge_mask)
+        center_nums = mask_to_numbers(GRID.center_mask)
         
         # Seleciona baseado em peso
         edge_weights = [self.weights[n] for n in edge_nums]
@@ -0,0 +1,138 @@
+"""
+Módulo de critérios de qualidade de jogos, vetorizados sobre bitmasks.
+Cada função recebe um array de bitmasks (bit n-1 = número n) e devolve
+um valor por jogo, usando as tabelas pré-calculadas de grid_mapping.
+"""
+from __future__ import annotations
+
+import numpy as np
+from typing import Iterable, Tuple
+
+from .bitmask import masks_to_incidence, numbers_to_mask, popcount
+from .grid_mapping import GRID
+
+# coordenadas (linha, coluna) de cada número, indexadas por n-1
+NUMBER_ROWS = GRID.coords[1:, 0].astype(np.int64)
+NUMBER_COLS = GRID.coords[1:, 1].astype(np.int64)
+
+
+def mean_distance_to_centroid(masks: np.ndarray) -> np.ndarray:
+    """
+    Distância euclidiana média de cada número do jogo ao centroide.
+
+    Args:
+        masks: Array (M,) de bitmasks
+
+    Returns:
+        Array (M,) float64 com a dispersão de cada jogo
+    """
+    incidence = masks_to_incidence(masks).astype(np.float64)
+    counts = incidence.sum(axis=1)
+    counts[counts == 0] = 1.0
+
+    centroid_row = incidence @ NUMBER_ROWS / counts
+    centroid_col = incidence @ NUMBER_COLS / counts
+    distances = np.sqrt((NUMBER_ROWS - centroid_row[:, np.newaxis]) ** 2
+                        + (NUMBER_COLS - centroid_col[:, np.newaxis]) ** 2)
+    return (incidence * distances).sum(axis=1) / counts
+
+
+def adjacent_pair_counts(masks: np.ndarray) -> np.ndarray:
+    """
+    Conta pares de números vizinhos (4-vizinhança) em cada jogo.
+
+    Args:
+        masks: Array (M,) de bitmasks
+
+    Returns:
+        Array (M,) int64 com o número de pares adjacentes
+    """
+    masks = np.asarray(masks, dtype=np.uint32)
+    horizontal = masks & (masks >> 1) & np.uint32(GRID.right_neighbor_mask)
+    vertical = masks & (masks >> GRID.spec.cols)
+    return popcount(horizontal).astype(np.int64) + popcount(vertical)
+
+
+def contains_any_pair(masks: np.ndarray, pairs: Iterable[Tuple[int, int]]) -> np.ndarray:
+    """
+    Indica quais jogos contêm pelo menos um dos pares dados.
+
+    Args:
+        masks: Array (M,) de bitmasks
+        pairs: Pares (a, b) de números
+
+    Returns:
+        Array (M,) bool
+    """
+    masks = np.asarray(masks, dtype=np.uint32)
+    found = np.zeros(masks.shape[0], dtype=bool)
+    for a, b in pairs:
+        pair_mask = np.uint32(numbers_to_mask((a, b)))
+        found |= (masks & pair_mask) == pair_mask
+    return found
+
+
+def line_counts(masks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantidade de números por linha e por coluna do volante.
+
+    Args:
+        masks: Array (M,) de bitmasks
+
+    Returns:
+        Tupla (linhas, colunas) de arrays (M, 5) uint8
+    """
+    masks = np.asarray(masks, dtype=np.uint32)[:, np.newaxis]
+    return popcount(masks & GRID.row_masks), popcount(masks & GRID.col_masks)
+
+
+def regional_balance(masks: np.ndarray, min_per_line: int = 1, max_per_line: int = 5) -> np.ndarray:
+    """
+    Indica quais jogos têm entre min e max números em toda linha e coluna.
+
+    Args:
+        masks: Array (M,) de bitmasks
+        min_per_line: Mínimo de números por linha/coluna
+        max_per_line: Máximo de números por linha/coluna
+
+    Returns:
+        Array (M,) bool
+    """
+    rows, cols = line_counts(masks)
+    rows_ok = ((rows >= min_per_line) & (rows <= max_per_line)).all(axis=1)
+    cols_ok = ((cols >= min_per_line) & (cols <= max_per_line)).all(axis=1)
+    return rows_ok & cols_ok
+
+
+def quality_scores(masks: np.ndarray, super_pairs: Iterable[Tuple[int, int]] = ()) -> dict:
+    """
+    Pontua jogos pelos critérios de qualidade do otimizador de combinações.
+
+    Mesmas faixas de CombinationOptimizer.score_game: dispersão (0-3),
+    baixa contiguidade (0-3), super par (0-2) e equilíbrio regional (0-2).
+
+    Args:
+        masks: Array (M,) de bitmasks
+        super_pairs: Pares (a, b) considerados super pares
+
+    Returns:
+        Dicionário de arrays (M,): score, dispersion, adjacent_pairs,
+        has_super_pair, balanced
+    """
+    dispersion = mean_distance_to_centroid(masks)
+    adjacent = adjacent_pair_counts(masks)
+    has_super_pair = contains_any_pair(masks, super_pairs)
+    balanced = regional_balance(masks)
+
+    score = np.select([dispersion >= 2.2, dispersion >= 1.8, dispersion >= 1.5], [3, 2, 1], 0)
+    score += np.select([adjacent <= 1, adjacent <= 2, adjacent <= 3], [3, 2, 1], 0)
+    score += np.where(has_super_pair, 2, 0)
+    score += np.where(balanced, 2, 0)
+
+    return {
+        'score': score,
+        'dispersion': dispersion,
+        'adjacent_pairs': adjacent,
+        'has_super_pair': has_super_pair,
+        'balanced': balanced,
+    }
@@ -6,11 +6,20 @@ Gera jogos adicionais usando as melhores estratégias identificadas no backtesti
 - Equilíbrio Regional (segundo melhor: 10.43%)
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 import random
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bitmask import numbers_to_mask
+from src.combinatorics import rank_masks
+from src.game_scoring import adjacent_pair_counts, regional_balance
+from src.grid_mapping import GRID, coord_to_number, number_to_coord
+
 
 class OptimizedGameGenerator:
     """Gerador de jogos otimizados para Lotofácil"""
@@ -39,69 +48,33 @@ class OptimizedGameGenerator:
         
     def number_to_coord(self, num):
         """Converter número (1-25) para coordenadas (linha, coluna)"""
-        num = num - 1  # Ajustar para índice 0
-        linha = num // 5
-        coluna = num % 5
-        return (linha, coluna)
+        return number_to_coord(num)
     
     def coord_to_number(self, linha, coluna):
         """Converter coordenadas para número"""
-        return linha * 5 + coluna + 1
+        return coord_to_number(linha, coluna)
     
     def calculate_dispersion(self, numbers):
         """Calcular dispersão espacial do jogo"""
-        coords = [self.number_to_coord(n) for n in numbers]
+        coords = GRID.coords[list(numbers)]
         
         # Calcular centróide
-        centroid_row = np.mean([c[0] for c in coords])
-        centroid_col = np.mean([c[1] for c in coords])
+        centroid_row = np.mean(coords[:, 0])
+        centroid_col = np.mean(coords[:, 1])
         
         # Distância média ao centróide
-        distances = [np.sqrt((c[0] - centroid_row)**2 + (c[1] - centroid_col)**2) 
-                    for c in coords]
+        distances = np.sqrt((coords[:, 0] - centroid_row)**2 + (coords[:, 1] - centroid_col)**2)
         
         return np.mean(distances)
     
     def check_regional_balance(self, numbers):
         """Verificar equilíbrio por linhas e colunas"""
-        coords = [self.number_to_coord(n) for n in numbers]
-        
-        # Contar por linha
-        line_counts = [0] * 5
-        for linha, _ in coords:
-            line_counts[linha] += 1
-        
-        # Contar por coluna
-        col_counts = [0] * 5
-        for _, coluna in coords:
-            col_counts[coluna] += 1
-        
-        # Verificar se está balanceado (3 números por linha idealmente)
-        line_balanced = all(2 <= count <= 4 for count in line_counts)
-        col_balanced = all(2 <= count <= 4 for count in col_counts)
-        
-        return line_balanced and col_balanced
+        # Balanceado: 2 a 4 números por linha e por coluna (3 idealmente)
+        return bool(regional_balance([numbers_to_mask(numbers)], 2, 4)[0])
     
     def count_adjacent_pairs(self, numbers):
         """Contar pares de números adjacentes"""
-        coords = set(self.number_to_coord(n) for n in numbers)
-        adjacent_count = 0
-        
-        for linha, coluna in coords:
-            # Verificar vizinhos (cima, baixo, esquerda, direita)
-            neighbors = [
-                (linha - 1, coluna),
-                (linha + 1, coluna),
-                (linha, coluna - 1),
-                (linha, coluna + 1)
-            ]
-            
-            for neighbor in neighbors:
-                if neighbor in coords:
-                    adjacent_count += 1
-        
-        # Cada par é contado duas vezes
-        return adjacent_count // 2
+        return int(adjacent_pair_counts([numbers_to_mask(numbers)])[0])
     
     def generate_dispersed_game(self):
         """Estratégia 1: Dispersão Máxima"""
@@ -240,13 +213,27 @@ class OptimizedGameGenerator:
         return games
     
     def save_games(self, games, filename='jogos_otimizados_100.csv'):
-        """Salvar jogos em CSV"""
+        """
+        Salvar jogos em CSV, sem repetições.
+
+        Cada jogo ganha a coluna indice_combinatorio (posição colexicográfica,
+        ver combinatorics.rank_masks), um ID de 4 bytes que permite cruzar
+        estes jogos com os resultados do backtesting.
+        """
         df = pd.DataFrame(games)
         
+        masks = np.array([numbers_to_mask(game) for game in df['numeros']], dtype=np.uint32)
+        duplicated = pd.Series(masks).duplicated().to_numpy()
+        if duplicated.any():
+            print(f"\n♻️ {int(duplicated.sum())} jogos repetidos removidos")
+            df = df[~duplicated]
+            masks = masks[~duplicated]
+        df['indice_combinatorio'] = rank_masks(masks)
+        
         output_path = f'out/{filename}'
         df.to_csv(output_path, index=False)
         
-        print(f"\n✅ {len(games)} jogos salvos em: {output_path}")
+        print(f"\n✅ {len(df)} jogos salvos em: {output_path}")
         
         # Estatísticas
         print(f"\n📊 Distribuição por estratégia:")
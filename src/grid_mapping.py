@@ -1,10 +1,13 @@
 """
 Módulo de mapeamento do grid 5x5 da Lotofácil.
-Converte números (1..25) em coordenadas (linha, coluna) e vice-versa.
+Converte números (1..25) em coordenadas (linha, coluna) e vice-versa, e
+expõe tabelas pré-calculadas do grid (distâncias, vizinhanças e máscaras).
 """
 from __future__ import annotations
 
+import numpy as np
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple
 
 GridCoord = Tuple[int, int]  # (row, col) 0-based
@@ -42,10 +45,8 @@ def number_to_coord(n: int, spec: GridSpec = GridSpec()) -> GridCoord:
     """
     if not (spec.n_min <= n <= spec.n_max):
         raise ValueError(f"Número fora do intervalo: {n}")
-    idx = n - spec.n_min  # 0..24
-    r = idx // spec.cols
-    c = idx % spec.cols
-    return r, c
+    r, c = grid_tables(spec).coords[n]
+    return int(r), int(c)
 
 
 def coord_to_number(r: int, c: int, spec: GridSpec = GridSpec()) -> int:
@@ -79,4 +80,120 @@ def build_number_coord_map(spec: GridSpec = GridSpec()) -> Dict[int, GridCoord]:
     Returns:
         Dicionário {número: (linha, coluna)}
     """
-    return {n: number_to_coord(n, spec) for n in range(spec.n_min, spec.n_max + 1)}
+    coords = grid_tables(spec).coords
+    return {n: (int(coords[n, 0]), int(coords[n, 1])) for n in range(spec.n_min, spec.n_max + 1)}
+
+
+@dataclass(frozen=True)
+class GridTables:
+    """
+    Tabelas pré-calculadas de um grid, indexadas pelo próprio número.
+
+    Linhas abaixo de n_min não são usadas. As máscaras usam o bit n-n_min
+    para o número n (o mesmo layout de bitmask.py na Lotofácil).
+
+    Atributos:
+        spec: Especificação do grid
+        numbers: Array (K,) com os números do grid, em ordem
+        coords: Array (n_max+1, 2) int16 número -> (linha, coluna)
+        manhattan: Matriz (n_max+1, n_max+1) int16 de distâncias de Manhattan
+        chebyshev: Matriz (n_max+1, n_max+1) int16 de distâncias de Chebyshev
+        neighbors4: Array (n_max+1,) com a máscara dos vizinhos ortogonais
+        neighbors8: Array (n_max+1,) com a máscara dos vizinhos incluindo diagonais
+        row_masks: Array (rows,) com a máscara de cada linha
+        col_masks: Array (cols,) com a máscara de cada coluna
+        quadrant_masks: Array (4,) com as máscaras dos quadrantes (superior
+                        esquerdo, superior direito, inferior esquerdo, inferior
+                        direito); em grids ímpares a linha/coluna do meio fica fora
+        edge_mask: Máscara dos números na borda (primeira/última linha ou coluna)
+        center_mask: Máscara dos números fora da borda
+        right_neighbor_mask: Máscara dos números que têm vizinho à direita
+    """
+    spec: GridSpec
+    numbers: np.ndarray
+    coords: np.ndarray
+    manhattan: np.ndarray
+    chebyshev: np.ndarray
+    neighbors4: np.ndarray
+    neighbors8: np.ndarray
+    row_masks: np.ndarray
+    col_masks: np.ndarray
+    quadrant_masks: np.ndarray
+    edge_mask: int
+    center_mask: int
+    right_neighbor_mask: int
+
+    @property
+    def mask_dtype(self) -> np.dtype:
+        """Tipo inteiro das máscaras (uint32 até 32 casas)."""
+        return self.row_masks.dtype
+
+
+@lru_cache(maxsize=None)
+def grid_tables(spec: GridSpec = GridSpec()) -> GridTables:
+    """
+    Tabelas do grid, calculadas uma vez por GridSpec (arrays somente leitura).
+
+    Args:
+        spec: Especificação do grid
+
+    Returns:
+        GridTables do grid
+    """
+    numbers = np.arange(spec.n_min, spec.n_max + 1)
+    idx = numbers - spec.n_min
+    rows = idx // spec.cols
+    cols = idx % spec.cols
+    dtype = np.uint32 if numbers.size <= 32 else np.uint64
+    bits = np.left_shift(np.ones(numbers.size, dtype=dtype), idx.astype(dtype))
+
+    coords = np.zeros((spec.n_max + 1, 2), dtype=np.int16)
+    coords[numbers, 0] = rows
+    coords[numbers, 1] = cols
+
+    d_row = np.abs(coords[:, np.newaxis, 0] - coords[np.newaxis, :, 0])
+    d_col = np.abs(coords[:, np.newaxis, 1] - coords[np.newaxis, :, 1])
+    valid = np.zeros(spec.n_max + 1, dtype=bool)
+    valid[numbers] = True
+    pair_valid = valid[:, np.newaxis] & valid[np.newaxis, :]
+    manhattan = np.where(pair_valid, d_row + d_col, 0).astype(np.int16)
+    chebyshev = np.where(pair_valid, np.maximum(d_row, d_col), 0).astype(np.int16)
+
+    def mask_of(selected: np.ndarray) -> int:
+        return int(np.bitwise_or.reduce(bits[selected], initial=dtype(0)))
+
+    neighbors4 = np.zeros(spec.n_max + 1, dtype=dtype)
+    neighbors8 = np.zeros(spec.n_max + 1, dtype=dtype)
+    for n in numbers:
+        neighbors4[n] = mask_of(manhattan[n, numbers] == 1)
+        neighbors8[n] = mask_of(chebyshev[n, numbers] == 1)
+
+    half_r, half_c = spec.rows // 2, spec.cols // 2
+    top, bottom = rows < half_r, rows >= spec.rows - half_r
+    left, right = cols < half_c, cols >= spec.cols - half_c
+    edge = (rows == 0) | (rows == spec.rows - 1) | (cols == 0) | (cols == spec.cols - 1)
+
+    tables = GridTables(
+        spec=spec,
+        numbers=numbers,
+        coords=coords,
+        manhattan=manhattan,
+        chebyshev=chebyshev,
+        neighbors4=neighbors4,
+        neighbors8=neighbors8,
+        row_masks=np.array([mask_of(rows == r) for r in range(spec.rows)], dtype=dtype),
+        col_masks=np.array([mask_of(cols == c) for c in range(spec.cols)], dtype=dtype),
+        quadrant_masks=np.array([mask_of(top & left), mask_of(top & right),
+                                 mask_of(bottom & left), mask_of(bottom & right)], dtype=dtype),
+        edge_mask=mask_of(edge),
+        center_mask=mask_of(~edge),
+        right_neighbor_mask=mask_of(cols < spec.cols - 1),
+    )
+    for arr in (numbers, coords, manhattan, chebyshev, neighbors4, neighbors8,
+                tables.row_masks, tables.col_masks, tables.quadrant_masks):
+        arr.flags.writeable = False
+    return tables
+
+
+# tabelas do volante padrão da Lotofácil
+GRID = grid_tables()
@@ -7,7 +7,7 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 from typing import List, Dict
-from .grid_mapping import build_number_coord_map, GridSpec
+from .grid_mapping import GridSpec, grid_tables
 
 
 def compute_heatmap(df: pd.DataFrame, ball_cols: List[str], spec: GridSpec = GridSpec()) -> Dict[str, object]:
@@ -29,13 +29,28 @@ def compute_heatmap(df: pd.DataFrame, ball_cols: List[str], spec: GridSpec = Gri
         - row_df: DataFrame com frequência por linha
         - col_df: DataFrame com frequência por coluna
     """
-    n2c = build_number_coord_map(spec)
-    heat = np.zeros((spec.rows, spec.cols), dtype=int)
-
     # conta ocorrências de cada número
-    for n in df[ball_cols].to_numpy().ravel():
-        r, c = n2c[int(n)]
-        heat[r, c] += 1
+    freq = np.bincount(df[ball_cols].to_numpy(dtype=np.int64).ravel(), minlength=spec.n_max + 1)
+    return heatmap_from_frequencies(freq, spec)
+
+
+def heatmap_from_frequencies(freq: np.ndarray, spec: GridSpec = GridSpec()) -> Dict[str, object]:
+    """
+    Monta o heatmap a partir do vetor de frequências por número.
+
+    Usado por compute_heatmap e pelo estado incremental (AnalysisState),
+    que mantém as frequências sem reler o histórico.
+
+    Args:
+        freq: Array indexado pelo número (índice 0 não é usado)
+        spec: Especificação do grid
+
+    Returns:
+        Mesmo dicionário de compute_heatmap
+    """
+    tables = grid_tables(spec)
+    heat = np.zeros((spec.rows, spec.cols), dtype=int)
+    heat[tables.coords[tables.numbers, 0], tables.coords[tables.numbers, 1]] = np.asarray(freq)[tables.numbers]
 
     # agrega por linha e coluna
     row_sum = heat.sum(axis=1)
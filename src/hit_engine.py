@@ -0,0 +1,239 @@
+"""
+Motor vetorizado de contagem de acertos (apostas × sorteios).
+Calcula a matriz de acertos com AND de bitmasks + popcount, em blocos,
+para que milhões de apostas caibam em memória limitada.
+"""
+from __future__ import annotations
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Sequence, Tuple, Union
+
+from .bitmask import numbers_to_mask, numbers_array_to_masks, popcount
+from .io_data import DrawStore
+
+MAX_HITS = 15
+PRIZE_TIERS = (11, 12, 13, 14, 15)
+
+# elementos (apostas × sorteios) processados por bloco (~16 MB em uint8)
+DEFAULT_BLOCK_ELEMENTS = 1 << 24
+
+BetsLike = Union[np.ndarray, Sequence[Sequence[int]]]
+DrawsLike = Union[DrawStore, np.ndarray]
+
+
+def bets_to_masks(bets: BetsLike) -> np.ndarray:
+    """
+    Normaliza apostas para um array de bitmasks.
+
+    Aceita um array 1-D uint32/uint64 de bitmasks, uma matriz (N, k) de
+    números, uma única aposta (lista ou array 1-D de outro tipo inteiro,
+    ex.: uma linha uint8 de numbers_array) ou uma lista de apostas de
+    tamanhos variados (15 a 20 números).
+
+    Args:
+        bets: Apostas em qualquer um dos formatos acima
+
+    Returns:
+        Array (N,) uint32 com um bitmask por aposta
+
+    Raises:
+        ValueError: Se algum número estiver fora de 1..25
+    """
+    if isinstance(bets, np.ndarray):
+        if bets.ndim == 1 and bets.dtype in (np.uint32, np.uint64):
+            return bets.astype(np.uint32, copy=False)
+        if bets.ndim == 2:
+            return numbers_array_to_masks(bets)
+    bets = list(bets)
+    if bets and isinstance(bets[0], (int, np.integer)):
+        # uma única aposta passada como lista de números
+        bets = [bets]
+    return np.fromiter((numbers_to_mask(b) for b in bets), dtype=np.uint32, count=len(bets))
+
+
+def _draw_masks(draws: DrawsLike) -> np.ndarray:
+    """Extrai o array de bitmasks de um DrawStore (ou usa o array dado)."""
+    if isinstance(draws, DrawStore):
+        return draws.masks
+    return np.asarray(draws, dtype=np.uint32)
+
+
+def _rows_per_block(n_draws: int, block_elements: int) -> int:
+    return max(1, block_elements // max(n_draws, 1))
+
+
+def iter_hit_blocks(bets: BetsLike, draws: DrawsLike,
+                    block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Gera a matriz de acertos em blocos de linhas (apostas).
+
+    Args:
+        bets: Apostas (ver bets_to_masks)
+        draws: DrawStore ou array de bitmasks dos sorteios
+        block_elements: Tamanho máximo de cada bloco (apostas × sorteios)
+
+    Yields:
+        Tuplas (linha_inicial, bloco) com bloco (n, M) uint8
+    """
+    bet_masks = bets_to_masks(bets)
+    draw_masks = _draw_masks(draws)
+    step = _rows_per_block(draw_masks.shape[0], block_elements)
+
+    for start in range(0, bet_masks.shape[0], step):
+        block = bet_masks[start:start + step, np.newaxis] & draw_masks[np.newaxis, :]
+        yield start, popcount(block)
+
+
+def _for_each_block(func: Callable[[int, np.ndarray], None], bet_masks: np.ndarray,
+                    draw_masks: np.ndarray, block_elements: int, workers: int) -> None:
+    """
+    Aplica func(linha_inicial, bloco) a cada bloco da matriz de acertos.
+
+    Com workers > 1 os blocos são distribuídos entre threads; as operações
+    numpy liberam o GIL, então os blocos rodam de fato em paralelo.
+    """
+    step = _rows_per_block(draw_masks.shape[0], block_elements)
+
+    def run(start: int) -> None:
+        block = bet_masks[start:start + step, np.newaxis] & draw_masks[np.newaxis, :]
+        func(start, popcount(block))
+
+    starts = range(0, bet_masks.shape[0], step)
+    if workers <= 1:
+        for start in starts:
+            run(start)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run, starts))
+
+
+def map_hit_blocks(func: Callable[[int, np.ndarray], None], bets: BetsLike, draws: DrawsLike,
+                   block_elements: int = DEFAULT_BLOCK_ELEMENTS, workers: int = 1) -> None:
+    """
+    Aplica uma redução própria a cada bloco da matriz de acertos.
+
+    Útil quando a estatística desejada não é coberta por hit_histogram ou
+    hit_summary: func recebe (linha_inicial, bloco (n, M) uint8) e deve
+    gravar seu resultado nas linhas [linha_inicial, linha_inicial + n).
+
+    Args:
+        func: Função chamada para cada bloco
+        bets: Apostas (ver bets_to_masks)
+        draws: DrawStore ou array de bitmasks dos sorteios
+        block_elements: Tamanho máximo de cada bloco (apostas × sorteios)
+        workers: Threads usadas para processar os blocos
+    """
+    _for_each_block(func, bets_to_masks(bets), _draw_masks(draws), block_elements, workers)
+
+
+def hit_matrix(bets: BetsLike, draws: DrawsLike,
+               block_elements: int = DEFAULT_BLOCK_ELEMENTS,
+               out: np.ndarray | None = None, workers: int = 1) -> np.ndarray:
+    """
+    Calcula a matriz de acertos entre N apostas e M sorteios.
+
+    Args:
+        bets: Apostas (ver bets_to_masks)
+        draws: DrawStore ou array de bitmasks dos sorteios
+        block_elements: Tamanho máximo de cada bloco (apostas × sorteios)
+        out: Array (N, M) uint8 opcional para receber o resultado
+             (ex.: np.memmap para matrizes maiores que a RAM)
+        workers: Threads usadas para processar os blocos
+
+    Returns:
+        Array (N, M) uint8 onde [i, j] = acertos da aposta i no sorteio j
+    """
+    bet_masks = bets_to_masks(bets)
+    draw_masks = _draw_masks(draws)
+    if out is None:
+        out = np.empty((bet_masks.shape[0], draw_masks.shape[0]), dtype=np.uint8)
+
+    def store(start: int, block: np.ndarray) -> None:
+        out[start:start + block.shape[0]] = block
+
+    _for_each_block(store, bet_masks, draw_masks, block_elements, workers)
+    return out
+
+
+def hit_histogram(bets: BetsLike, draws: DrawsLike,
+                  block_elements: int = DEFAULT_BLOCK_ELEMENTS, workers: int = 1) -> np.ndarray:
+    """
+    Distribuição de acertos de cada aposta contra todos os sorteios.
+
+    Reduz cada bloco da matriz de acertos imediatamente, então a memória
+    usada não depende do número de apostas.
+
+    Args:
+        bets: Apostas (ver bets_to_masks)
+        draws: DrawStore ou array de bitmasks dos sorteios
+        block_elements: Tamanho máximo de cada bloco (apostas × sorteios)
+        workers: Threads usadas para processar os blocos
+
+    Returns:
+        Array (N, 16) int64 onde [i, h] = quantos sorteios tiveram h acertos
+    """
+    bet_masks = bets_to_masks(bets)
+    hist = np.zeros((bet_masks.shape[0], MAX_HITS + 1), dtype=np.int64)
+    width = MAX_HITS + 1
+
+    def reduce(start: int, block: np.ndarray) -> None:
+        n = block.shape[0]
+        offsets = (np.arange(n, dtype=np.int64) * width)[:, np.newaxis]
+        counts = np.bincount((block + offsets).ravel(), minlength=n * width)
+        hist[start:start + n] = counts.reshape(n, width)
+
+    _for_each_block(reduce, bet_masks, _draw_masks(draws), block_elements, workers)
+    return hist
+
+
+def hit_summary(bets: BetsLike, draws: DrawsLike,
+                block_elements: int = DEFAULT_BLOCK_ELEMENTS, workers: int = 1) -> dict:
+    """
+    Estatísticas de acertos por aposta contra todos os sorteios.
+
+    Mais barato que hit_histogram quando só interessam as faixas premiadas:
+    cada bloco é reduzido com somas e comparações uint8, sem bincount.
+
+    Args:
+        bets: Apostas (ver bets_to_masks)
+        draws: DrawStore ou array de bitmasks dos sorteios
+        block_elements: Tamanho máximo de cada bloco (apostas × sorteios)
+        workers: Threads usadas para processar os blocos
+
+    Returns:
+        Dicionário de arrays (N,):
+        - total_acertos: soma de acertos em todos os sorteios
+        - media_acertos: média de acertos por sorteio
+        - max_acertos: maior quantidade de acertos em um sorteio
+        - premios_11 .. premios_15: sorteios com exatamente 11..15 acertos
+        - total_premios: sorteios premiados (11+ acertos)
+    """
+    bet_masks = bets_to_masks(bets)
+    draw_masks = _draw_masks(draws)
+    n_bets = bet_masks.shape[0]
+    n_draws = draw_masks.shape[0]
+
+    total = np.zeros(n_bets, dtype=np.int64)
+    best = np.zeros(n_bets, dtype=np.uint8)
+    tiers = {tier: np.zeros(n_bets, dtype=np.int64) for tier in PRIZE_TIERS}
+
+    def reduce(start: int, block: np.ndarray) -> None:
+        stop = start + block.shape[0]
+        total[start:stop] = block.sum(axis=1, dtype=np.uint32)
+        if n_draws:
+            best[start:stop] = block.max(axis=1)
+        for tier, counts in tiers.items():
+            counts[start:stop] = (block == tier).view(np.uint8).sum(axis=1, dtype=np.uint32)
+
+    _for_each_block(reduce, bet_masks, draw_masks, block_elements, workers)
+
+    summary = {
+        'total_acertos': total,
+        'media_acertos': total / max(n_draws, 1),
+        'max_acertos': best,
+    }
+    for tier in PRIZE_TIERS:
+        summary[f'premios_{tier}'] = tiers[tier]
+    summary['total_premios'] = sum(tiers.values())
+    return summary
@@ -0,0 +1,285 @@
+"""
+Módulo de estado incremental das análises da Lotofácil.
+Mantém frequências, co-ocorrência, estado de ciclos (gaps/latência) e
+contagens de backtest de apostas salvas, persistidos em disco e avançados
+apenas com os sorteios novos quando um concurso é publicado.
+"""
+from __future__ import annotations
+
+import os
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Dict
+
+from .atomic_io import atomic_open
+from .bitmask import N_NUMBERS, mask_to_numbers, masks_to_incidence
+from .combinatorics import rank_masks
+from .cooccurrence import cooccurrence_from_incidence
+from .grid_mapping import GridSpec
+from .heatmap_analysis import heatmap_from_frequencies
+from .hit_engine import MAX_HITS, PRIZE_TIERS, BetsLike, bets_to_masks, hit_histogram
+from .io_data import DrawStore
+
+DEFAULT_STATE_PATH = "out/state/analysis_state.npz"
+
+# largura inicial do histograma de gaps (cresce se aparecer gap maior)
+_INITIAL_GAP_BINS = 32
+
+
+@dataclass
+class AnalysisState:
+    """
+    Estatísticas acumuladas sobre os N primeiros sorteios do histórico.
+
+    Todas as contagens são aditivas, então avançar o estado com k sorteios
+    novos custa O(k) e dá o mesmo resultado que recalcular do zero.
+
+    Atributos:
+        n_draws: Quantidade de sorteios já incorporados
+        last_contest: Número do último concurso incorporado (-1 se vazio)
+        freq: Array (26,) com a frequência de cada número (índice 0 não usado)
+        cooc: Matriz (26, 26) de co-ocorrência, como cooccurrence_matrix
+        last_seen: Array (26,) com a posição da última aparição (-1 = nunca)
+        gap_hist: Matriz (26, G) onde [n, g] = vezes que o número n voltou
+                  após g sorteios (gap entre aparições consecutivas)
+        bet_masks: Array (B,) uint32 das apostas acompanhadas
+        bet_hits: Matriz (B, 16) com a distribuição de acertos de cada aposta
+    """
+    n_draws: int = 0
+    last_contest: int = -1
+    freq: np.ndarray = field(default_factory=lambda: np.zeros(N_NUMBERS + 1, dtype=np.int64))
+    cooc: np.ndarray = field(default_factory=lambda: np.zeros((N_NUMBERS + 1, N_NUMBERS + 1), dtype=np.int64))
+    last_seen: np.ndarray = field(default_factory=lambda: np.full(N_NUMBERS + 1, -1, dtype=np.int64))
+    gap_hist: np.ndarray = field(default_factory=lambda: np.zeros((N_NUMBERS + 1, _INITIAL_GAP_BINS), dtype=np.int64))
+    bet_masks: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.uint32))
+    bet_hits: np.ndarray = field(default_factory=lambda: np.zeros((0, MAX_HITS + 1), dtype=np.int64))
+
+    @classmethod
+    def from_store(cls, store: DrawStore, bets: BetsLike | None = None) -> "AnalysisState":
+        """
+        Constrói o estado do zero a partir de um histórico completo.
+
+        Args:
+            store: Histórico de sorteios
+            bets: Apostas a acompanhar no backtest (opcional)
+
+        Returns:
+            Estado com todos os sorteios do store incorporados
+        """
+        state = cls()
+        if bets is not None:
+            state.track_bets(bets, store)
+        state.advance(store)
+        return state
+
+    def advance(self, new_draws: DrawStore) -> int:
+        """
+        Incorpora sorteios novos (posteriores ao último já incorporado).
+
+        Args:
+            new_draws: Apenas os sorteios novos, em ordem cronológica
+
+        Returns:
+            Quantidade de sorteios incorporados
+        """
+        k = len(new_draws)
+        if k == 0:
+            return 0
+
+        incidence = masks_to_incidence(new_draws.masks).astype(np.int64)
+        self.freq[1:] += incidence.sum(axis=0)
+
+        self.cooc += cooccurrence_from_incidence(incidence)
+
+        self._advance_gaps(incidence)
+
+        if self.bet_masks.size:
+            self.bet_hits += hit_histogram(self.bet_masks, new_draws.masks)
+
+        self.n_draws += k
+        self.last_contest = int(new_draws.contests[-1])
+        return k
+
+    def _advance_gaps(self, incidence: np.ndarray) -> None:
+        """Atualiza última aparição e histograma de gaps de cada número."""
+        for n in range(1, N_NUMBERS + 1):
+            positions = np.flatnonzero(incidence[:, n - 1]) + self.n_draws
+            if positions.size == 0:
+                continue
+            if self.last_seen[n] >= 0:
+                positions_with_last = np.concatenate(([self.last_seen[n]], positions))
+            else:
+                positions_with_last = positions
+            gaps = np.diff(positions_with_last)
+            if gaps.size:
+                if gaps.max() >= self.gap_hist.shape[1]:
+                    grown = np.zeros((self.gap_hist.shape[0], int(gaps.max()) * 2), dtype=np.int64)
+                    grown[:, :self.gap_hist.shape[1]] = self.gap_hist
+                    self.gap_hist = grown
+                np.add.at(self.gap_hist[n], gaps, 1)
+            self.last_seen[n] = positions[-1]
+
+    def update(self, store: DrawStore) -> int:
+        """
+        Avança o estado até o fim de um histórico que o estende.
+
+        Args:
+            store: Histórico completo atualizado (ex.: load_draw_store())
+
+        Returns:
+            Quantidade de sorteios novos incorporados
+
+        Raises:
+            ValueError: Se o histórico não for uma extensão do já incorporado
+                        (ex.: concursos removidos ou reordenados)
+        """
+        if len(store) < self.n_draws or (
+                self.n_draws and int(store.contests[self.n_draws - 1]) != self.last_contest):
+            raise ValueError("Histórico não estende o estado salvo; reconstrua com AnalysisState.from_store")
+        return self.advance(store.slice(self.n_draws, None))
+
+    def track_bets(self, bets: BetsLike, store: DrawStore) -> None:
+        """
+        Passa a acompanhar apostas, contando seus acertos no histórico já incorporado.
+
+        Apostas já acompanhadas são ignoradas.
+
+        Args:
+            bets: Apostas (ver hit_engine.bets_to_masks)
+            store: Histórico que contém os sorteios já incorporados
+        """
+        masks = np.unique(bets_to_masks(bets))
+        masks = masks[~np.isin(masks, self.bet_masks)]
+        if masks.size == 0:
+            return
+        hits = hit_histogram(masks, store.masks[:self.n_draws])
+        self.bet_masks = np.concatenate([self.bet_masks, masks])
+        self.bet_hits = np.concatenate([self.bet_hits, hits])
+
+    def heatmap(self, spec: GridSpec = GridSpec()) -> Dict[str, object]:
+        """
+        Heatmap do grid no mesmo formato de compute_heatmap.
+
+        Args:
+            spec: Especificação do grid
+
+        Returns:
+            Dicionário com heatmap_matrix, heatmap_df, row_df e col_df
+        """
+        return heatmap_from_frequencies(self.freq, spec)
+
+    def gap_stats(self) -> Dict[int, Dict[str, float]]:
+        """
+        Estatísticas de ciclo por número, como em analyze_cycles.
+
+        Returns:
+            Dicionário número -> total_aparicoes, gap_medio, gap_mediano,
+            gap_min, gap_max, desvio_gap, ultimo_concurso (posição da última
+            aparição) e latencia_atual. Números sem gap registrado são omitidos.
+        """
+        stats = {}
+        values = np.arange(self.gap_hist.shape[1])
+        for n in range(1, N_NUMBERS + 1):
+            counts = self.gap_hist[n]
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            present = np.flatnonzero(counts)
+            mean = float((values * counts).sum() / total)
+            cumulative = np.cumsum(counts)
+            lower = int(np.searchsorted(cumulative, (total - 1) // 2, side='right'))
+            upper = int(np.searchsorted(cumulative, total // 2, side='right'))
+            stats[n] = {
+                'total_aparicoes': int(self.freq[n]),
+                'gap_medio': mean,
+                'gap_mediano': (lower + upper) / 2,
+                'gap_min': int(present[0]),
+                'gap_max': int(present[-1]),
+                'desvio_gap': float(np.sqrt((counts * (values - mean) ** 2).sum() / total)),
+                'ultimo_concurso': int(self.last_seen[n]),
+                'latencia_atual': self.n_draws - int(self.last_seen[n]) - 1,
+            }
+        return stats
+
+    def backtest_frame(self) -> pd.DataFrame:
+        """
+        Contagens de acertos das apostas acompanhadas.
+
+        Returns:
+            DataFrame com números, indice_combinatorio, acertos_11..15,
+            total_premios e media_acertos por aposta
+        """
+        frame = pd.DataFrame({
+            'numeros': [','.join(map(str, mask_to_numbers(m))) for m in self.bet_masks],
+            'indice_combinatorio': rank_masks(self.bet_masks),
+        })
+        for tier in sorted(PRIZE_TIERS, reverse=True):
+            frame[f'acertos_{tier}'] = self.bet_hits[:, tier]
+        frame['total_premios'] = self.bet_hits[:, min(PRIZE_TIERS):].sum(axis=1)
+        frame['media_acertos'] = (self.bet_hits @ np.arange(MAX_HITS + 1)) / max(self.n_draws, 1)
+        return frame
+
+    def save(self, path: str = DEFAULT_STATE_PATH) -> None:
+        """
+        Persiste o estado em um .npz (escrita atômica via arquivo temporário).
+
+        Args:
+            path: Caminho do arquivo
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with atomic_open(path, 'wb') as f:
+            np.savez(f, n_draws=self.n_draws, last_contest=self.last_contest, freq=self.freq,
+                     cooc=self.cooc, last_seen=self.last_seen, gap_hist=self.gap_hist,
+                     bet_masks=self.bet_masks, bet_hits=self.bet_hits)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_STATE_PATH) -> "AnalysisState":
+        """
+        Carrega um estado salvo com save().
+
+        Args:
+            path: Caminho do arquivo
+
+        Returns:
+            Estado restaurado
+        """
+        with np.load(path) as data:
+            return cls(
+                n_draws=int(data['n_draws']),
+                last_contest=int(data['last_contest']),
+                freq=data['freq'].copy(),
+                cooc=data['cooc'].copy(),
+                last_seen=data['last_seen'].copy(),
+                gap_hist=data['gap_hist'].copy(),
+                bet_masks=data['bet_masks'].copy(),
+                bet_hits=data['bet_hits'].copy(),
+            )
+
+
+def load_or_build_state(store: DrawStore, path: str = DEFAULT_STATE_PATH,
+                        bets: BetsLike | None = None) -> AnalysisState:
+    """
+    Carrega o estado salvo e o avança até o fim do histórico.
+
+    Reconstrói do zero se não houver estado salvo ou se o histórico não
+    estender o estado salvo.
+
+    Args:
+        store: Histórico completo atualizado
+        path: Caminho do estado persistido
+        bets: Apostas a acompanhar (adicionadas se ainda não estiverem)
+
+    Returns:
+        Estado atualizado (não é salvo automaticamente)
+    """
+    if os.path.exists(path):
+        state = AnalysisState.load(path)
+        try:
+            state.update(store)
+            if bets is not None:
+                state.track_bets(bets, store)
+            return state
+        except ValueError:
+            pass
+    return AnalysisState.from_store(store, bets)
@@ -4,13 +4,54 @@ Lê arquivos CSV e valida os dados.
 """
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-from typing import List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from .bitmask import (
+    N_NUMBERS, numbers_to_mask, numbers_array_to_masks, masks_to_incidence,
+    masks_to_numbers_array, popcount
+)
+from .draw_cache import load_draw_table, validate_ball_matrix
 
 DEFAULT_BALL_COLS = [f"Bola{i}" for i in range(1, 16)]  # Bola1..Bola15
+DEFAULT_DRAWS_PATH = "data/lotofacil_sorteios.csv"
 
 
-def load_draws_csv(path: str, ball_cols: List[str] | None = None) -> Tuple[pd.DataFrame, List[str]]:
+def _detect_ball_cols(df: pd.DataFrame) -> List[str]:
+    """
+    Detecta as 15 colunas de bolas de um DataFrame de sorteios.
+
+    Args:
+        df: DataFrame (ou amostra dele) com o cabeçalho do arquivo
+
+    Returns:
+        Lista de nomes das colunas de bolas
+    """
+    # tenta detectar colunas Bola1..Bola15
+    ball_cols = [c for c in DEFAULT_BALL_COLS if c in df.columns]
+    
+    # tenta formato alternativo b1..b15
+    if len(ball_cols) != 15:
+        alt_cols = [f"b{i}" for i in range(1, 16)]
+        ball_cols = [c for c in alt_cols if c in df.columns]
+    
+    # fallback: procura qualquer coluna que comece com "Bola" ou "bola"
+    if len(ball_cols) != 15:
+        ball_cols = [c for c in df.columns if c.lower().startswith('bola')]
+    
+    # último recurso: últimas 15 colunas numéricas
+    if len(ball_cols) != 15:
+        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        ball_cols = numeric_cols[-15:] if len(numeric_cols) >= 15 else list(df.columns[-15:])
+
+    return ball_cols
+
+
+def load_draws_csv(path: str, ball_cols: List[str] | None = None, compact: bool = False,
+                   usecols: List[str] | None = None) -> Tuple[pd.DataFrame, List[str]]:
     """
     Carrega sorteios da Lotofácil de um arquivo CSV.
     
@@ -20,49 +61,214 @@ def load_draws_csv(path: str, ball_cols: List[str] | None = None) -> Tuple[pd.Da
     - Colunas padrão: Bola1, Bola2, ..., Bola15 (ou b1, b2, ..., b15)
     - Pode conter outras colunas (concurso, data, etc.)
     
+    No modo compacto só são lidas as colunas de bolas, concurso, data e as
+    de usecols; as bolas ficam em uint8 e as colunas de texto como
+    categóricas, o que reduz a memória em históricos grandes.
+    
     Args:
         path: Caminho do arquivo CSV
         ball_cols: Lista de nomes das colunas de bolas. Se None, tenta detectar automaticamente.
+        compact: Ativa o modo compacto (projeção de colunas, uint8, categóricas)
+        usecols: Colunas extras a manter no modo compacto
         
     Returns:
-        Tupla (DataFrame completo, lista de colunas de bolas)
+        Tupla (DataFrame, lista de colunas de bolas)
         
     Raises:
         ValueError: Se houver números fora do intervalo 1-25 ou duplicados no sorteio
     """
-    df = pd.read_csv(path)
+    if compact:
+        sample = pd.read_csv(path, nrows=100)
+        if ball_cols is None:
+            ball_cols = _detect_ball_cols(sample)
+        keep = [c for c in ("Concurso", "concurso", "Data Sorteio", "data") if c in sample.columns]
+        keep += [c for c in ball_cols if c not in keep]
+        keep += [c for c in (usecols or []) if c not in keep]
+        dtypes = {c: np.int16 for c in ball_cols}
+        dtypes.update({c: "category" for c in keep
+                       if c not in dtypes and not pd.api.types.is_numeric_dtype(sample[c])})
+        df = pd.read_csv(path, usecols=keep, dtype=dtypes)[keep]
+    else:
+        df = pd.read_csv(path)
+        if ball_cols is None:
+            ball_cols = _detect_ball_cols(df)
 
-    if ball_cols is None:
-        # tenta detectar colunas Bola1..Bola15
-        ball_cols = [c for c in DEFAULT_BALL_COLS if c in df.columns]
-        
-        # tenta formato alternativo b1..b15
-        if len(ball_cols) != 15:
-            alt_cols = [f"b{i}" for i in range(1, 16)]
-            ball_cols = [c for c in alt_cols if c in df.columns]
-        
-        # fallback: procura qualquer coluna que comece com "Bola" ou "bola"
-        if len(ball_cols) != 15:
-            ball_cols = [c for c in df.columns if c.lower().startswith('bola')]
-        
-        # último recurso: últimas 15 colunas numéricas
-        if len(ball_cols) != 15:
-            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-            ball_cols = numeric_cols[-15:] if len(numeric_cols) >= 15 else list(df.columns[-15:])
-
-    # garante int
-    df[ball_cols] = df[ball_cols].astype(int)
-
-    # valida faixas 1..25
-    bad = (df[ball_cols] < 1).any(axis=1) | (df[ball_cols] > 25).any(axis=1)
-    if bad.any():
-        idxs = df.index[bad].tolist()[:10]
-        raise ValueError(f"Encontrados números fora de 1..25 nas linhas: {idxs} (mostrando até 10)")
-
-    # valida duplicidade dentro do sorteio
-    dup = df[ball_cols].apply(lambda row: len(set(row.tolist())) != len(row.tolist()), axis=1)
-    if dup.any():
-        idxs = df.index[dup].tolist()[:10]
-        raise ValueError(f"Encontradas duplicidades dentro do sorteio nas linhas: {idxs} (mostrando até 10)")
+        # garante int
+        df[ball_cols] = df[ball_cols].astype(int)
+
+    # valida faixas 1..25 e duplicidade dentro do sorteio (ordenação + diferença)
+    balls = df[ball_cols].to_numpy()
+    validate_ball_matrix(balls, N_NUMBERS, labels=df.index)
+
+    if compact:
+        df[ball_cols] = balls.astype(np.uint8)
 
     return df, ball_cols
+
+
+@dataclass(frozen=True)
+class DrawStore:
+    """
+    Armazenamento compacto e somente leitura do histórico de sorteios.
+
+    Cada sorteio é um bitmask uint32 (bit n-1 = número n), guardado num único
+    array contíguo; concurso e data ficam em arrays paralelos. Com ~3.600
+    sorteios o histórico inteiro ocupa ~14 KB.
+
+    Atributos:
+        masks: Array (M,) uint32 com um bitmask por sorteio
+        contests: Array (M,) int32 com o número do concurso
+        dates: Array (M,) datetime64[D] com a data do sorteio (NaT se ausente)
+    """
+    masks: np.ndarray
+    contests: np.ndarray
+    dates: np.ndarray
+
+    def __post_init__(self):
+        for arr in (self.masks, self.contests, self.dates):
+            arr.flags.writeable = False
+
+    def __len__(self) -> int:
+        return int(self.masks.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados pelos bitmasks dos sorteios."""
+        return int(self.masks.nbytes)
+
+    def hits(self, numbers: Iterable[int]) -> np.ndarray:
+        """
+        Conta acertos de uma aposta contra todos os sorteios.
+
+        Args:
+            numbers: Números da aposta (15 a 20 números)
+
+        Returns:
+            Array (M,) uint8 com a quantidade de acertos em cada sorteio
+        """
+        bet = np.uint32(numbers_to_mask(numbers))
+        return popcount(self.masks & bet)
+
+    def frequencies(self) -> np.ndarray:
+        """
+        Frequência de cada número no histórico.
+
+        Returns:
+            Array (26,) int com a frequência de cada número (índice 0 não é usado)
+        """
+        freq = np.zeros(26, dtype=int)
+        freq[1:] = self.incidence().sum(axis=0)
+        return freq
+
+    def incidence(self) -> np.ndarray:
+        """
+        Matriz de incidência dos sorteios.
+
+        Returns:
+            Array (M, 25) uint8 onde [i, n-1] = 1 se o número n saiu no sorteio i
+        """
+        return masks_to_incidence(self.masks)
+
+    def numbers(self) -> np.ndarray:
+        """
+        Números sorteados em ordem crescente.
+
+        Returns:
+            Array (M, 15) uint8 com os números de cada sorteio
+        """
+        return masks_to_numbers_array(self.masks, 15)
+
+    def format_date(self, i: int) -> str:
+        """
+        Data do sorteio na posição i no formato do CSV original (dd/mm/aaaa).
+
+        Args:
+            i: Posição do sorteio
+
+        Returns:
+            Data formatada, ou string vazia se ausente
+        """
+        date = self.dates[i].item()
+        return date.strftime("%d/%m/%Y") if date is not None else ""
+
+    def slice(self, start: int | None = None, stop: int | None = None) -> "DrawStore":
+        """
+        Retorna um intervalo de sorteios (por posição) sem copiar os dados.
+
+        Args:
+            start: Posição inicial (inclusiva)
+            stop: Posição final (exclusiva)
+
+        Returns:
+            Novo DrawStore com as visões dos arrays
+        """
+        sl = slice(start, stop)
+        return DrawStore(self.masks[sl], self.contests[sl], self.dates[sl])
+
+    def tail(self, n: int) -> "DrawStore":
+        """
+        Retorna os últimos N sorteios.
+
+        Args:
+            n: Quantidade de sorteios
+
+        Returns:
+            DrawStore com os N sorteios mais recentes
+        """
+        return self.slice(max(len(self) - n, 0), None)
+
+
+def build_draw_store(df: pd.DataFrame, ball_cols: List[str]) -> DrawStore:
+    """
+    Constrói o DrawStore a partir do DataFrame retornado por load_draws_csv.
+
+    Args:
+        df: DataFrame com os sorteios
+        ball_cols: Lista de colunas contendo os números sorteados
+
+    Returns:
+        DrawStore com bitmasks, concursos e datas
+    """
+    masks = numbers_array_to_masks(df[ball_cols].to_numpy())
+
+    contest_col = next((c for c in ("Concurso", "concurso") if c in df.columns), None)
+    if contest_col is not None:
+        contests = df[contest_col].to_numpy(dtype=np.int32)
+    else:
+        contests = np.arange(1, len(df) + 1, dtype=np.int32)
+
+    date_col = next((c for c in ("Data Sorteio", "data") if c in df.columns), None)
+    if date_col is not None:
+        dates = pd.to_datetime(df[date_col], dayfirst=True, errors="coerce")
+        dates = dates.to_numpy(dtype="datetime64[D]")
+    else:
+        dates = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[D]")
+
+    return DrawStore(
+        masks=np.ascontiguousarray(masks, dtype=np.uint32),
+        contests=np.ascontiguousarray(contests, dtype=np.int32),
+        dates=np.ascontiguousarray(dates),
+    )
+
+
+@lru_cache(maxsize=None)
+def load_draw_store(path: str = DEFAULT_DRAWS_PATH) -> DrawStore:
+    """
+    Carrega o histórico uma única vez e o compartilha entre as análises.
+
+    Chamadas repetidas com o mesmo caminho retornam o mesmo objeto
+    (somente leitura). Os dados vêm do cache binário de draw_cache, então
+    o CSV só é interpretado de novo quando o arquivo muda.
+
+    Args:
+        path: Caminho do arquivo CSV (ou XLSX)
+
+    Returns:
+        DrawStore do arquivo
+    """
+    table = load_draw_table(path, n_max=N_NUMBERS)
+    return DrawStore(
+        masks=numbers_array_to_masks(table.balls),
+        contests=np.asarray(table.contests),
+        dates=np.asarray(table.dates),
+    )
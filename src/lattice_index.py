@@ -0,0 +1,244 @@
+"""
+Módulo de índice de contagens sobre o reticulado dos 2^25 conjuntos de números.
+Guarda, para todo conjunto S, quantos sorteios contêm S inteiro e quantos
+não têm nenhum número de S (transformada zeta de superconjuntos), em dois
+arrays uint16 de 64 MB lidos por memory mapping: qualquer pergunta do tipo
+"sorteios que tiveram 10, 13 e 21" ou "sorteios sem nenhum frio" vira uma
+única leitura. O índice é avançado só com os sorteios novos.
+"""
+from __future__ import annotations
+
+import json
+import os
+import numpy as np
+from dataclasses import dataclass
+from typing import Iterable
+
+from .atomic_io import atomic_open, write_json
+from .bitmask import FULL_MASK, N_NUMBERS, mask_to_numbers, numbers_to_mask
+from .combinatorics import index_masks_to_number_masks
+from .io_data import DrawStore
+
+DEFAULT_LATTICE_DIR = "out/state/lattice"
+SUPERSET_FILE = "superset.npy"
+DISJOINT_FILE = "disjoint.npy"
+META_FILE = "lattice.json"
+
+LATTICE_DTYPE = np.uint16
+LATTICE_SIZE = FULL_MASK + 1
+
+
+def superset_counts(masks: np.ndarray) -> np.ndarray:
+    """
+    Transformada zeta de superconjuntos dos bitmasks dados.
+
+    Parte da contagem exata de cada bitmask e, bit a bit, soma em cada
+    conjunto sem o bit a contagem do mesmo conjunto com o bit (25 passadas
+    sobre o array).
+
+    Args:
+        masks: Array (M,) de bitmasks
+
+    Returns:
+        Array (2^25,) uint16 onde [S] = quantos bitmasks contêm S
+
+    Raises:
+        ValueError: Se houver bitmasks demais para contagens uint16
+    """
+    masks = np.asarray(masks, dtype=np.uint32)
+    if masks.size > np.iinfo(LATTICE_DTYPE).max:
+        raise ValueError(f"Histórico grande demais para contagens uint16: {masks.size} sorteios")
+    counts = np.bincount(masks, minlength=LATTICE_SIZE).astype(LATTICE_DTYPE)
+    for bit in range(N_NUMBERS):
+        view = counts.reshape(-1, 2, 1 << bit)
+        view[:, 0, :] += view[:, 1, :]
+    return counts
+
+
+def _submasks(mask: int) -> np.ndarray:
+    """Todos os 2^|mask| subconjuntos de um bitmask."""
+    numbers = mask_to_numbers(mask)
+    return index_masks_to_number_masks(np.arange(1 << len(numbers), dtype=np.uint32), numbers)
+
+
+def _write_meta(output_dir: str, meta: dict) -> None:
+    """Grava os metadados de forma atômica (temporário único + rename, ver atomic_io)."""
+    write_json(os.path.join(output_dir, META_FILE), meta, indent=2)
+
+
+@dataclass
+class LatticeIndex:
+    """
+    Contagens de superconjuntos dos sorteios e dos números ausentes.
+
+    superset[S] = sorteios que contêm todos os números de S, e
+    disjoint[S] = sorteios sem nenhum número de S (os 10 ausentes contêm S).
+
+    Atributos:
+        superset: Array (2^25,) uint16 (memmap ou em memória)
+        disjoint: Array (2^25,) uint16
+        n_draws: Quantidade de sorteios incorporados
+        last_contest: Número do último concurso incorporado (-1 se vazio)
+    """
+    superset: np.ndarray
+    disjoint: np.ndarray
+    n_draws: int = 0
+    last_contest: int = -1
+
+    @classmethod
+    def from_store(cls, store: DrawStore) -> "LatticeIndex":
+        """
+        Constrói o índice do zero a partir de um histórico completo.
+
+        Args:
+            store: Histórico de sorteios
+
+        Returns:
+            Índice em memória com todos os sorteios do store
+        """
+        return cls(
+            superset=superset_counts(store.masks),
+            disjoint=superset_counts(FULL_MASK ^ np.asarray(store.masks, dtype=np.uint32)),
+            n_draws=len(store),
+            last_contest=int(store.contests[-1]) if len(store) else -1,
+        )
+
+    def containing(self, numbers: Iterable[int]) -> int:
+        """
+        Sorteios que tiveram todos os números dados.
+
+        Args:
+            numbers: Números do conjunto (vazio = todos os sorteios)
+
+        Returns:
+            Quantidade de sorteios
+        """
+        return int(self.superset[numbers_to_mask(numbers)])
+
+    def avoiding(self, numbers: Iterable[int]) -> int:
+        """
+        Sorteios que não tiveram nenhum dos números dados.
+
+        Args:
+            numbers: Números do conjunto
+
+        Returns:
+            Quantidade de sorteios
+        """
+        return int(self.disjoint[numbers_to_mask(numbers)])
+
+    def advance(self, new_draws: DrawStore) -> int:
+        """
+        Incorpora sorteios novos somando 1 aos 2^15 subconjuntos de cada
+        sorteio e aos 2^10 subconjuntos dos seus ausentes.
+
+        Args:
+            new_draws: Apenas os sorteios novos, em ordem cronológica
+
+        Returns:
+            Quantidade de sorteios incorporados
+
+        Raises:
+            ValueError: Se as contagens passarem do limite de uint16
+        """
+        k = len(new_draws)
+        if k == 0:
+            return 0
+        if self.n_draws + k > np.iinfo(LATTICE_DTYPE).max:
+            raise ValueError(f"Histórico grande demais para contagens uint16: {self.n_draws + k} sorteios")
+        for mask in new_draws.masks.tolist():
+            self.superset[_submasks(mask)] += 1
+            self.disjoint[_submasks(FULL_MASK ^ mask)] += 1
+        self.n_draws += k
+        self.last_contest = int(new_draws.contests[-1])
+        return k
+
+    def update(self, store: DrawStore) -> int:
+        """
+        Avança o índice até o fim do histórico.
+
+        Args:
+            store: Histórico completo atualizado (ex.: load_draw_store())
+
+        Returns:
+            Quantidade de sorteios novos incorporados
+
+        Raises:
+            ValueError: Se o histórico não estender o índice (reconstrua com from_store)
+        """
+        if len(store) < self.n_draws or (
+                self.n_draws and int(store.contests[self.n_draws - 1]) != self.last_contest):
+            raise ValueError("Histórico não corresponde ao índice salvo; reconstrua o índice")
+        return self.advance(store.slice(self.n_draws, None))
+
+    def save(self, output_dir: str = DEFAULT_LATTICE_DIR) -> None:
+        """
+        Grava os arrays (.npy) e os metadados; cada arquivo é escrito em um
+        temporário e renomeado.
+
+        Args:
+            output_dir: Diretório de saída
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        for name, array in ((SUPERSET_FILE, self.superset), (DISJOINT_FILE, self.disjoint)):
+            path = os.path.join(output_dir, name)
+            if isinstance(array, np.memmap) and os.path.abspath(array.filename) == os.path.abspath(path):
+                array.flush()
+                continue
+            with atomic_open(path, 'wb') as f:
+                np.save(f, array)
+        _write_meta(output_dir, {'n_draws': self.n_draws, 'last_contest': self.last_contest})
+
+    @classmethod
+    def load(cls, output_dir: str = DEFAULT_LATTICE_DIR, writable: bool = False) -> "LatticeIndex":
+        """
+        Abre um índice salvo por memory mapping (nada é lido até a consulta).
+
+        Args:
+            output_dir: Diretório do índice
+            writable: Abre em modo r+ para avançar o índice no próprio arquivo
+
+        Returns:
+            Índice com os arrays mapeados
+
+        Raises:
+            ValueError: Se uma atualização no próprio arquivo foi interrompida
+        """
+        mode = 'r+' if writable else 'r'
+        with open(os.path.join(output_dir, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get('updating'):
+            raise ValueError("Atualização do índice interrompida; reconstrua o índice")
+        return cls(
+            superset=np.load(os.path.join(output_dir, SUPERSET_FILE), mmap_mode=mode),
+            disjoint=np.load(os.path.join(output_dir, DISJOINT_FILE), mmap_mode=mode),
+            n_draws=int(meta['n_draws']),
+            last_contest=int(meta['last_contest']),
+        )
+
+
+def load_or_build_lattice(store: DrawStore, output_dir: str = DEFAULT_LATTICE_DIR) -> LatticeIndex:
+    """
+    Abre o índice salvo, avança-o até o fim do histórico e o regrava.
+
+    Reconstrói do zero se não houver índice salvo ou se o histórico não
+    estender o índice salvo.
+
+    Args:
+        store: Histórico completo atualizado
+        output_dir: Diretório do índice
+
+    Returns:
+        Índice atualizado (somente leitura, por memory mapping)
+    """
+    try:
+        index = LatticeIndex.load(output_dir, writable=True)
+        if len(store) != index.n_draws:
+            # arquivos alterados no lugar: marcados até a gravação terminar
+            _write_meta(output_dir, {'n_draws': index.n_draws, 'last_contest': index.last_contest,
+                                     'updating': True})
+            index.update(store)
+            index.save(output_dir)
+    except (OSError, ValueError, KeyError):
+        LatticeIndex.from_store(store).save(output_dir)
+    return LatticeIndex.load(output_dir)
@@ -15,8 +15,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.io_data import load_draws_csv
 from src.heatmap_analysis import compute_heatmap
 from src.spatial_metrics import draw_spatial_metrics
-from src.cooccurrence import cooccurrence_matrix, top_pairs
+from src.cooccurrence import cooccurrence_matrix, top_pairs, top_tuples_from_df
 from src.cluster_analysis import cluster_numbers_dbscan
+from src.figure_renderer import FigureJob, render_figures
 from src.visualizations import (
     plot_heatmap_grid, plot_frequency_bars, plot_row_col_comparison,
     plot_cooccurrence_network, plot_spatial_metrics_distribution,
@@ -29,6 +30,86 @@ def ensure_out_dir():
     os.makedirs("out", exist_ok=True)
 
 
+def heatmap_stage(df, ball_cols) -> dict:
+    """Heatmap do grid 5x5 e frequências por linha/coluna."""
+    hm = compute_heatmap(df, ball_cols)
+    hm["heatmap_df"].to_csv("out/heatmap_5x5.csv", index=True)
+    hm["row_df"].to_csv("out/freq_linhas.csv", index=False)
+    hm["col_df"].to_csv("out/freq_colunas.csv", index=False)
+    return hm
+
+
+def frequency_by_number(df, ball_cols) -> np.ndarray:
+    """Frequência de cada número (índices 1..25)."""
+    freq_by_number = np.zeros(26, dtype=int)
+    for n in df[ball_cols].to_numpy().ravel():
+        freq_by_number[int(n)] += 1
+    return freq_by_number
+
+
+def metrics_stage(df, ball_cols):
+    """Métricas espaciais por sorteio."""
+    metrics_df = draw_spatial_metrics(df, ball_cols)
+    metrics_df.to_csv("out/metrics_por_sorteio.csv", index=False)
+    return metrics_df
+
+
+def cooccurrence_stage(df, ball_cols):
+    """Top 80 pares, trios e quadras por co-ocorrência; retorna os pares."""
+    co = cooccurrence_matrix(df, ball_cols, n_max=25)
+    pairs_df = top_pairs(co, top_k=80)
+    pairs_df.to_csv("out/top_pares_coocorrencia.csv", index=False)
+    # trios e quadras (2.300 e 12.650 tuplas)
+    top_tuples_from_df(df, ball_cols, k=3, top_k=80).to_csv("out/top_trios_coocorrencia.csv", index=False)
+    top_tuples_from_df(df, ball_cols, k=4, top_k=80).to_csv("out/top_quadras_coocorrencia.csv", index=False)
+    return pairs_df
+
+
+def clusters_stage(freq_by_number: np.ndarray) -> int:
+    """Clusters DBSCAN (Manhattan) dos números; retorna a quantidade de clusters."""
+    clusters_df = cluster_numbers_dbscan(
+        freq_by_number=freq_by_number,
+        eps=1.0,          # vizinhança imediata (Manhattan <= 1)
+        min_samples=2,
+        top_n=25
+    )
+    clusters_df.to_csv("out/clusters_dbscan_manhattan.csv", index=False)
+    return len(clusters_df[clusters_df['cluster'] >= 0]['cluster'].unique())
+
+
+def summary_stage(n_draws: int, ball_cols, n_clusters: int) -> None:
+    """Resumo em JSON com os caminhos das saídas."""
+    summary = {
+        "n_sorteios": int(n_draws),
+        "heatmap_path": "out/heatmap_5x5.csv",
+        "metrics_path": "out/metrics_por_sorteio.csv",
+        "top_pairs_path": "out/top_pares_coocorrencia.csv",
+        "top_triples_path": "out/top_trios_coocorrencia.csv",
+        "top_quads_path": "out/top_quadras_coocorrencia.csv",
+        "clusters_path": "out/clusters_dbscan_manhattan.csv",
+        "ball_cols_used": ball_cols,
+        "n_clusters": n_clusters,
+    }
+    with open("out/summary.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+def plots_stage(heatmap_matrix: np.ndarray, row_df, col_df, freq_by_number: np.ndarray,
+                pairs_df, metrics_df, n_draws: int, workers: int = 1) -> None:
+    """5 gráficos (em paralelo, pulando os que não mudaram) e o relatório em texto."""
+    jobs = [
+        FigureJob("out/heatmap_grid.png", plot_heatmap_grid, {'heatmap_matrix': heatmap_matrix}),
+        FigureJob("out/freq_barras.png", plot_frequency_bars, {'freq_by_number': freq_by_number}),
+        FigureJob("out/linhas_colunas.png", plot_row_col_comparison, {'row_df': row_df, 'col_df': col_df}),
+        FigureJob("out/rede_coocorrencia.png", plot_cooccurrence_network, {'pairs_df': pairs_df, 'top_n': 30}),
+        FigureJob("out/metricas_espaciais.png", plot_spatial_metrics_distribution, {'metrics_df': metrics_df}),
+    ]
+    stats = render_figures(jobs, workers=workers)
+    if stats['puladas']:
+        print(f"   ✓ {stats['puladas']} gráficos sem mudança (não renderizados)")
+    create_summary_report(freq_by_number, pairs_df, metrics_df, n_draws)
+
+
 def main():
     """
     Executa o pipeline completo de análise.
@@ -40,6 +121,9 @@ def main():
     4. Calcula co-ocorrência de números
     5. Detecta clusters usando DBSCAN
     6. Salva todos os resultados em out/
+
+    As etapas só se comunicam pelos arquivos em out/; src/pipeline_main.py
+    as executa em paralelo e pula as que estão atualizadas.
     """
     print("🎯 Iniciando análise da Lotofácil...")
     ensure_out_dir()
@@ -51,65 +135,37 @@ def main():
 
     # 2. Heatmap
     print("🔥 Calculando heatmap do grid 5x5...")
-    hm = compute_heatmap(df, ball_cols)
-    hm["heatmap_df"].to_csv("out/heatmap_5x5.csv", index=True)
-    hm["row_df"].to_csv("out/freq_linhas.csv", index=False)
-    hm["col_df"].to_csv("out/freq_colunas.csv", index=False)
+    hm = heatmap_stage(df, ball_cols)
     print("   ✓ Heatmap gerado")
 
     # 3. Frequência por número (1..25)
     print("📊 Calculando frequências...")
-    freq_by_number = np.zeros(26, dtype=int)
-    for n in df[ball_cols].to_numpy().ravel():
-        freq_by_number[int(n)] += 1
+    freq_by_number = frequency_by_number(df, ball_cols)
 
     # 4. Métricas espaciais por sorteio
     print("📐 Calculando métricas espaciais...")
-    metrics_df = draw_spatial_metrics(df, ball_cols)
-    metrics_df.to_csv("out/metrics_por_sorteio.csv", index=False)
+    metrics_df = metrics_stage(df, ball_cols)
     print("   ✓ Métricas calculadas")
 
     # 5. Co-ocorrência
     print("🔗 Analisando co-ocorrência de números...")
-    co = cooccurrence_matrix(df, ball_cols, n_max=25)
-    pairs_df = top_pairs(co, top_k=80)
-    pairs_df.to_csv("out/top_pares_coocorrencia.csv", index=False)
+    pairs_df = cooccurrence_stage(df, ball_cols)
     print(f"   ✓ Top 80 pares identificados")
+    print(f"   ✓ Top 80 trios e quadras identificados")
 
     # 6. Clusters (DBSCAN Manhattan) nos números mais frequentes
     print("🎯 Detectando clusters espaciais (DBSCAN)...")
-    clusters_df = cluster_numbers_dbscan(
-        freq_by_number=freq_by_number,
-        eps=1.0,          # vizinhança imediata (Manhattan <= 1)
-        min_samples=2,
-        top_n=25
-    )
-    clusters_df.to_csv("out/clusters_dbscan_manhattan.csv", index=False)
-    n_clusters = len(clusters_df[clusters_df['cluster'] >= 0]['cluster'].unique())
+    n_clusters = clusters_stage(freq_by_number)
     print(f"   ✓ {n_clusters} clusters identificados")
 
     # 7. Resumo em JSON
     print("💾 Salvando resumo...")
-    summary = {
-        "n_sorteios": int(len(df)),
-        "heatmap_path": "out/heatmap_5x5.csv",
-        "metrics_path": "out/metrics_por_sorteio.csv",
-        "top_pairs_path": "out/top_pares_coocorrencia.csv",
-        "clusters_path": "out/clusters_dbscan_manhattan.csv",
-        "ball_cols_used": ball_cols,
-        "n_clusters": n_clusters,
-    }
-    with open("out/summary.json", "w", encoding="utf-8") as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    summary_stage(len(df), ball_cols, n_clusters)
 
     # 8. Gera visualizações
     print("\n🎨 Gerando visualizações...")
-    plot_heatmap_grid(hm["heatmap_matrix"])
-    plot_frequency_bars(freq_by_number)
-    plot_row_col_comparison(hm["row_df"], hm["col_df"])
-    plot_cooccurrence_network(pairs_df, top_n=30)
-    plot_spatial_metrics_distribution(metrics_df)
-    create_summary_report(freq_by_number, pairs_df, metrics_df, len(df))
+    plots_stage(hm["heatmap_matrix"], hm["row_df"], hm["col_df"], freq_by_number,
+                pairs_df, metrics_df, len(df), workers=os.cpu_count() or 1)
 
     print("\n✅ Análise concluída!")
     print(f"📁 Arquivos gerados em: out/")
@@ -7,6 +7,7 @@ Processa todos os sorteios e gera:
 3. Relatório de insights
 """
 
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -22,8 +23,9 @@ import json
 
 from megasena_grid_mapping import number_to_coord, create_grid_from_numbers, print_grid
 from megasena_geometric_analysis import full_geometric_analysis
+from figure_renderer import FigureJob, render_figures
 from megasena_visualizations import (
-    plot_single_draw_grid,
+    render_draw_grid,
     plot_heatmap_frequency,
     plot_pattern_distribution,
     plot_contiguity_scatter,
@@ -184,51 +186,58 @@ def generate_summary_report(analyses: list, output_path: str = "out/megasena_geo
     print("\n" + report_text)
 
 
-def generate_visualizations(df: pd.DataFrame, analyses: list):
+# create_grid_from_numbers, usado pelos grids individuais
+GRID_MAPPING_FILE = str(Path(__file__).parent / "megasena_grid_mapping.py")
+
+
+def generate_visualizations(df: pd.DataFrame, analyses: list, workers: int = None,
+                            example_limit: int = 10):
     """
     Gera todas as visualizações.
+
+    As figuras são renderizadas em paralelo (figure_renderer) e as que não
+    mudaram desde a última execução são puladas.
     
     Args:
         df: DataFrame com sorteios
         analyses: Lista de análises
+        workers: Processos usados (padrão: todos os núcleos)
+        example_limit: Quantos concursos ganham grid individual (None = todos)
     """
     print("\n🎨 Gerando visualizações...")
     
     os.makedirs("out", exist_ok=True)
     
-    # 1. Heatmap de frequências
     ball_cols = ['Bola1', 'Bola2', 'Bola3', 'Bola4', 'Bola5', 'Bola6']
-    all_draws = df[ball_cols].values.tolist()
-    plot_heatmap_frequency(all_draws, save_path="out/megasena_heatmap_frequency.png")
-    
-    # 2. Distribuição de padrões
-    patterns = [a['pattern'] for a in analyses]
-    plot_pattern_distribution(patterns, save_path="out/megasena_pattern_distribution.png")
-    
-    # 3. Scatter de contiguidade
-    contiguity_data = [a['contiguity'] for a in analyses]
-    plot_contiguity_scatter(contiguity_data, save_path="out/megasena_contiguity_scatter.png")
-    
-    # 4. Distribuição de dispersão
-    dispersion_data = [a['dispersion'] for a in analyses]
-    plot_dispersion_distribution(dispersion_data, save_path="out/megasena_dispersion_dist.png")
-    
-    # 5. Heatmap regional
-    region_data = [a['regions'] for a in analyses]
-    plot_region_heatmap(region_data, save_path="out/megasena_region_heatmap.png")
-    
-    # 6. Exemplos de sorteios (primeiros 10 e alguns padrões específicos)
-    print("  Criando grids de exemplo...")
-    
-    for idx in range(min(10, len(df))):
-        numeros = df.iloc[idx][ball_cols].tolist()
-        concurso = df.iloc[idx]['Concurso'] if 'Concurso' in df.columns else idx + 1
-        plot_single_draw_grid(
-            numeros, concurso=concurso,
-            save_path=f"out/draw_examples/concurso_{concurso:04d}.png"
-        )
-    
-    print("✅ Todas as visualizações geradas!")
+    jobs = [
+        # 1. Heatmap de frequências
+        FigureJob("out/megasena_heatmap_frequency.png", plot_heatmap_frequency,
+                  {'all_draws': df[ball_cols].values.tolist()}, path_arg='save_path'),
+        # 2. Distribuição de padrões
+        FigureJob("out/megasena_pattern_distribution.png", plot_pattern_distribution,
+                  {'patterns': [a['pattern'] for a in analyses]}, path_arg='save_path'),
+        # 3. Scatter de contiguidade
+        FigureJob("out/megasena_contiguity_scatter.png", plot_contiguity_scatter,
+                  {'contiguity_data': [a['contiguity'] for a in analyses]}, path_arg='save_path'),
+        # 4. Distribuição de dispersão
+        FigureJob("out/megasena_dispersion_dist.png", plot_dispersion_distribution,
+                  {'dispersion_data': [a['dispersion'] for a in analyses]}, path_arg='save_path'),
+        # 5. Heatmap regional
+        FigureJob("out/megasena_region_heatmap.png", plot_region_heatmap,
+                  {'region_data': [a['regions'] for a in analyses]}, path_arg='save_path'),
+    ]
+    
+    # 6. Grids individuais (os primeiros example_limit concursos, ou todos)
+    n_examples = len(df) if example_limit is None else min(example_limit, len(df))
+    for idx in range(n_examples):
+        numeros = [int(n) for n in df.iloc[idx][ball_cols].tolist()]
+        concurso = int(df.iloc[idx]['Concurso']) if 'Concurso' in df.columns else idx + 1
+        jobs.append(FigureJob(f"out/draw_examples/concurso_{concurso:04d}.png", render_draw_grid,
+                              {'numeros': numeros, 'concurso': concurso}, path_arg='save_path',
+                              code=[GRID_MAPPING_FILE]))
+    
+    stats = render_figures(jobs, workers=workers or os.cpu_count() or 1)
+    print(f"✅ Visualizações: {stats['renderizadas']} geradas, {stats['puladas']} sem mudança")
 
 
 def save_json_results(analyses: list, output_path: str = "out/megasena_analyses.json"):
@@ -267,8 +276,16 @@ def save_json_results(analyses: list, output_path: str = "out/megasena_analyses.
     print(f"✅ JSON salvo com {len(analyses)} análises")
 
 
-def main():
+def main(argv=None):
     """Pipeline principal."""
+    parser = argparse.ArgumentParser(description="Análise geométrica da Mega-Sena")
+    parser.add_argument("--grids", type=int, default=10,
+                        help="Concursos com grid individual em out/draw_examples/")
+    parser.add_argument("--todos-grids", action="store_true", help="Gera o grid de todos os concursos")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processos usados nas figuras")
+    args = parser.parse_args(argv)
+
     print("🎯 ANÁLISE GEOMÉTRICA DA MEGA-SENA")
     print("Grid 6×10 - Padrões tipo Batalha Naval")
     print("=" * 60)
@@ -283,7 +300,8 @@ def main():
     generate_summary_report(analyses)
     
     # 4. Gerar visualizações
-    generate_visualizations(df, analyses)
+    generate_visualizations(df, analyses, workers=args.workers,
+                            example_limit=None if args.todos_grids else args.grids)
     
     # 5. Salvar JSON
     save_json_results(analyses)
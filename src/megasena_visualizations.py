@@ -10,6 +10,100 @@ from typing import List, Dict
 from megasena_grid_mapping import number_to_coord, create_grid_from_numbers
 
 
+# cores das células: (fundo, borda, largura da borda, cor do número, peso do número)
+_DRAWN_STYLE = ('#FF6B6B', '#C92A2A', 3, 'white', 'bold')        # vermelho para sorteados
+_NOT_DRAWN_STYLE = ('#E9ECEF', '#ADB5BD', 1, '#495057', 'normal')  # cinza claro
+
+
+class DrawGridFigure:
+    """
+    Figura do grid 6×10 montada uma vez e reaproveitada entre sorteios.
+
+    As 60 células e os números são criados no construtor; render() só
+    troca cores, títulos e grava, o que evita recriar figura e artistas a
+    cada concurso.
+    """
+
+    def __init__(self, show_numbers: bool = True):
+        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.cells = []
+        self.labels = []
+        background, edge, width, text_color, weight = _NOT_DRAWN_STYLE
+        for linha in range(6):
+            for coluna in range(10):
+                numero = linha * 10 + coluna + 1
+                rect = patches.Rectangle(
+                    (coluna, 5-linha), 1, 1,
+                    linewidth=width,
+                    edgecolor=edge,
+                    facecolor=background
+                )
+                self.ax.add_patch(rect)
+                self.cells.append(rect)
+                if show_numbers:
+                    self.labels.append(self.ax.text(
+                        coluna + 0.5, 5-linha + 0.5, str(numero),
+                        ha='center', va='center',
+                        fontsize=11, color=text_color, weight=weight
+                    ))
+
+        # Configurações do plot
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 6)
+        self.ax.set_aspect('equal')
+        self.ax.axis('off')
+
+        self.title = self.fig.suptitle("Mega-Sena - Grid 6×10", fontsize=16, fontweight='bold', y=0.98)
+        self.subtitle = self.ax.text(5, -0.5, "", ha='center', fontsize=12, color='#495057')
+        self.fig.tight_layout()
+
+    def render(self, numeros: List[int], concurso: int = None, save_path: str = None):
+        """
+        Atualiza a figura para um sorteio e grava.
+
+        Args:
+            numeros: Lista de 6 números sorteados
+            concurso: Número do concurso (opcional)
+            save_path: Caminho para salvar a imagem
+        """
+        grid = create_grid_from_numbers(numeros)
+        for i, drawn in enumerate(grid.ravel()):
+            background, edge, width, text_color, weight = _DRAWN_STYLE if drawn == 1 else _NOT_DRAWN_STYLE
+            self.cells[i].set_facecolor(background)
+            self.cells[i].set_edgecolor(edge)
+            self.cells[i].set_linewidth(width)
+            if self.labels:
+                self.labels[i].set_color(text_color)
+                self.labels[i].set_fontweight(weight)
+
+        self.title.set_text(f"Mega-Sena - Concurso {concurso}" if concurso else "Mega-Sena - Grid 6×10")
+        self.subtitle.set_text(f"Números sorteados: {sorted(numeros)}")
+
+        if save_path:
+            self.fig.savefig(save_path, dpi=300, bbox_inches='tight')
+
+    def close(self):
+        plt.close(self.fig)
+
+
+# uma figura reaproveitada por processo (ver render_draw_grid)
+_DRAW_GRID_FIGURES: Dict[bool, DrawGridFigure] = {}
+
+
+def render_draw_grid(numeros: List[int], concurso: int = None,
+                     save_path: str = None, show_numbers: bool = True):
+    """
+    Como plot_single_draw_grid, mas reaproveitando a figura do processo.
+
+    Feita para renderizar muitos concursos em lote (figure_renderer);
+    não imprime nada por figura.
+    """
+    figure = _DRAW_GRID_FIGURES.get(show_numbers)
+    if figure is None or not plt.fignum_exists(figure.fig.number):
+        figure = _DRAW_GRID_FIGURES[show_numbers] = DrawGridFigure(show_numbers)
+    figure.render(numeros, concurso, save_path)
+
+
 def plot_single_draw_grid(numeros: List[int], concurso: int = None, 
                           save_path: str = None, show_numbers: bool = True):
     """
@@ -21,63 +115,11 @@ def plot_single_draw_grid(numeros: List[int], concurso: int = None,
         save_path: Caminho para salvar a imagem
         show_numbers: Se True, mostra os números nas células
     """
-    grid = create_grid_from_numbers(numeros)
-    
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
-    # Criar grid visual
-    for linha in range(6):
-        for coluna in range(10):
-            numero = linha * 10 + coluna + 1
-            
-            # Cor de fundo
-            if grid[linha, coluna] == 1:
-                color = '#FF6B6B'  # Vermelho para sorteados
-                edge_color = '#C92A2A'
-                edge_width = 3
-            else:
-                color = '#E9ECEF'  # Cinza claro
-                edge_color = '#ADB5BD'
-                edge_width = 1
-            
-            # Desenhar célula
-            rect = patches.Rectangle(
-                (coluna, 5-linha), 1, 1,
-                linewidth=edge_width,
-                edgecolor=edge_color,
-                facecolor=color
-            )
-            ax.add_patch(rect)
-            
-            # Adicionar número
-            if show_numbers:
-                text_color = 'white' if grid[linha, coluna] == 1 else '#495057'
-                weight = 'bold' if grid[linha, coluna] == 1 else 'normal'
-                ax.text(
-                    coluna + 0.5, 5-linha + 0.5, str(numero),
-                    ha='center', va='center',
-                    fontsize=11, color=text_color, weight=weight
-                )
-    
-    # Configurações do plot
-    ax.set_xlim(0, 10)
-    ax.set_ylim(0, 6)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    
-    # Título
-    title = f"Mega-Sena - Concurso {concurso}" if concurso else "Mega-Sena - Grid 6×10"
-    subtitle = f"Números sorteados: {sorted(numeros)}"
-    fig.suptitle(title, fontsize=16, fontweight='bold', y=0.98)
-    ax.text(5, -0.5, subtitle, ha='center', fontsize=12, color='#495057')
-    
-    plt.tight_layout()
-    
+    figure = DrawGridFigure(show_numbers)
+    figure.render(numeros, concurso, save_path)
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"✅ Salvo: {save_path}")
-    
-    plt.close()
+    figure.close()
 
 
 def plot_heatmap_frequency(all_draws: List[List[int]], save_path: str = None):
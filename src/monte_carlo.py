@@ -6,9 +6,97 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Dict, Tuple
 from tqdm import tqdm
 
+from .bitmask import N_NUMBERS, popcount
+from .io_data import build_draw_store
+from .combinatorics import BINOMIAL, rank_masks, unrank_masks
+from .hit_engine import bets_to_masks, hit_matrix, hit_summary, MAX_HITS, PRIZE_TIERS
+from .probability import at_least_probability, expected_hits
+
+# simulações por bloco do Monte Carlo (~2 MB por array uint32). O tamanho é
+# fixo para que o resultado dependa só da semente, não da quantidade de processos
+MC_BLOCK_SIZE = 1 << 18
+
+
+def _monte_carlo_block(seed: np.random.SeedSequence, n: int, n_numbers: int,
+                       draw_masks: np.ndarray) -> np.ndarray:
+    """
+    Simula um bloco de n jogos aleatórios contra sorteios aleatórios do histórico.
+
+    Cada jogo é sorteado uniformemente entre as C(25, n_numbers) apostas
+    (índice colexicográfico aleatório + unrank_masks) e confrontado com um
+    sorteio histórico escolhido ao acaso, via AND de bitmasks + popcount.
+
+    Args:
+        seed: Semente do fluxo aleatório deste bloco
+        n: Quantidade de simulações do bloco
+        n_numbers: Quantidade de números por jogo
+        draw_masks: Bitmasks dos sorteios históricos
+
+    Returns:
+        Histograma (16,) int64 com a quantidade de simulações por nº de acertos
+    """
+    rng = np.random.default_rng(seed)
+    bets = unrank_masks(rng.integers(0, BINOMIAL[N_NUMBERS, n_numbers], size=n), n_numbers)
+    draws = draw_masks[rng.integers(0, draw_masks.shape[0], size=n)]
+    return np.bincount(popcount(bets & draws), minlength=MAX_HITS + 1).astype(np.int64)
+
+
+def monte_carlo_histogram(draw_masks: np.ndarray, n_simulations: int, n_numbers: int = 15,
+                          seed: int | None = None, workers: int = 1,
+                          block_size: int = MC_BLOCK_SIZE, progress: bool = True) -> np.ndarray:
+    """
+    Histograma de acertos de jogos aleatórios contra sorteios do histórico.
+
+    As simulações são divididas em blocos de tamanho fixo, cada um com um
+    fluxo independente gerado por SeedSequence(seed).spawn. Como a soma dos
+    histogramas não depende da ordem, o resultado é idêntico para a mesma
+    semente com qualquer quantidade de processos.
+
+    Args:
+        draw_masks: Bitmasks dos sorteios históricos
+        n_simulations: Número de simulações
+        n_numbers: Quantidade de números por jogo (15 a 20)
+        seed: Semente (None = entropia do sistema, não reproduzível)
+        workers: Processos usados para simular os blocos
+        block_size: Simulações por bloco
+        progress: Mostra barra de progresso
+
+    Returns:
+        Array (16,) int64 com a quantidade de simulações por nº de acertos
+
+    Raises:
+        ValueError: Se n_simulations < 1 ou n_numbers fora de 15..20
+    """
+    if n_simulations < 1:
+        raise ValueError("n_simulations deve ser >= 1")
+    if not 15 <= n_numbers <= 20:
+        raise ValueError(f"n_numbers deve estar entre 15 e 20, recebido {n_numbers}")
+
+    draw_masks = np.ascontiguousarray(draw_masks, dtype=np.uint32)
+    n_blocks = -(-n_simulations // block_size)
+    seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+    sizes = [block_size] * (n_blocks - 1) + [n_simulations - block_size * (n_blocks - 1)]
+
+    run = partial(_monte_carlo_block, n_numbers=n_numbers, draw_masks=draw_masks)
+    histogram = np.zeros(MAX_HITS + 1, dtype=np.int64)
+    with tqdm(total=n_simulations, desc="Simulações", disable=not progress) as bar:
+        if workers <= 1 or n_blocks == 1:
+            results = map(run, seeds, sizes)
+            for size, block in zip(sizes, results):
+                histogram += block
+                bar.update(size)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, n_blocks)) as pool:
+                for size, block in zip(sizes, pool.map(run, seeds, sizes)):
+                    histogram += block
+                    bar.update(size)
+    return histogram
+
 
 class MonteCarloSimulator:
     """Simulador Monte Carlo para testar estratégias da Lotofácil."""
@@ -24,10 +112,11 @@ class MonteCarloSimulator:
         self.draws = historical_draws
         self.ball_cols = ball_cols
         
+        # Sorteios como bitmasks para contagem vetorizada de acertos
+        self.store = build_draw_store(historical_draws, ball_cols)
+        
         # Converte sorteios para sets para comparação rápida
-        self.draw_sets = []
-        for _, row in self.draws.iterrows():
-            self.draw_sets.append(set(row[ball_cols].tolist()))
+        self.draw_sets = [set(nums) for nums in historical_draws[ball_cols].to_numpy().tolist()]
     
     def count_matches(self, game: List[int], draw: set) -> int:
         """
@@ -52,20 +141,14 @@ class MonteCarloSimulator:
         Returns:
             Dicionário com estatísticas de acertos
         """
-        matches = []
-        prizes = {11: 0, 12: 0, 13: 0, 14: 0, 15: 0}
-        
-        for draw in self.draw_sets:
-            n_matches = self.count_matches(game, draw)
-            matches.append(n_matches)
-            
-            if n_matches >= 11:
-                prizes[n_matches] += 1
+        matches = hit_matrix([game], self.store)[0]
+        counts = np.bincount(matches, minlength=16)
+        prizes = {tier: int(counts[tier]) for tier in PRIZE_TIERS}
         
         return {
-            'acertos': matches,
+            'acertos': matches.tolist(),
             'media_acertos': np.mean(matches),
-            'max_acertos': max(matches),
+            'max_acertos': int(matches.max()),
             'premios_11': prizes[11],
             'premios_12': prizes[12],
             'premios_13': prizes[13],
@@ -85,25 +168,36 @@ class MonteCarloSimulator:
             strategy_name: Nome da estratégia
             
         Returns:
-            DataFrame com resultados por jogo
+            DataFrame com resultados por jogo; indice_combinatorio é a
+            posição colexicográfica do jogo (ver combinatorics.rank_masks) e
+            media_esperada/taxa_esperada_% são a linha de base exata de um
+            jogo aleatório do mesmo tamanho (ver probability)
         """
         results = []
         
-        for i, game in enumerate(games, 1):
-            stats = self.simulate_game_history(game)
+        # Todos os jogos da estratégia contra todo o histórico de uma vez
+        masks = bets_to_masks(games)
+        ranks = rank_masks(masks)
+        stats = hit_summary(masks, self.store)
+        
+        for i, game in enumerate(games):
+            total_premios = int(stats['total_premios'][i])
             results.append({
                 'estrategia': strategy_name,
-                'jogo_id': i,
+                'jogo_id': i + 1,
                 'numeros': str(sorted(game)),
-                'media_acertos': stats['media_acertos'],
-                'max_acertos': stats['max_acertos'],
-                'premios_11': stats['premios_11'],
-                'premios_12': stats['premios_12'],
-                'premios_13': stats['premios_13'],
-                'premios_14': stats['premios_14'],
-                'premios_15': stats['premios_15'],
-                'total_premios': stats['total_premios'],
-                'taxa_premio_%': stats['taxa_premio_%']
+                'indice_combinatorio': int(ranks[i]),
+                'media_acertos': float(stats['media_acertos'][i]),
+                'max_acertos': int(stats['max_acertos'][i]),
+                'premios_11': int(stats['premios_11'][i]),
+                'premios_12': int(stats['premios_12'][i]),
+                'premios_13': int(stats['premios_13'][i]),
+                'premios_14': int(stats['premios_14'][i]),
+                'premios_15': int(stats['premios_15'][i]),
+                'total_premios': total_premios,
+                'taxa_premio_%': (total_premios / len(self.draws)) * 100,
+                'media_esperada': expected_hits(len(game)),
+                'taxa_esperada_%': at_least_probability(len(game), PRIZE_TIERS[0]) * 100
             })
         
         return pd.DataFrame(results)
@@ -136,7 +230,8 @@ class MonteCarloSimulator:
             results_df: DataFrame com resultados das simulações
             
         Returns:
-            DataFrame com comparação agregada
+            DataFrame com comparação agregada; ganho_acertos é a diferença
+            entre a média de acertos e a esperada para jogos aleatórios
         """
         comparison = results_df.groupby('estrategia').agg({
             'media_acertos': 'mean',
@@ -147,48 +242,51 @@ class MonteCarloSimulator:
             'premios_14': 'sum',
             'premios_15': 'sum',
             'total_premios': 'sum',
-            'taxa_premio_%': 'mean'
-        }).round(2)
+            'taxa_premio_%': 'mean',
+            'media_esperada': 'mean',
+            'taxa_esperada_%': 'mean'
+        })
+        comparison['ganho_acertos'] = comparison['media_acertos'] - comparison['media_esperada']
+        comparison = comparison.round(2)
         
         comparison = comparison.sort_values('total_premios', ascending=False)
         return comparison
     
     def monte_carlo_random(self, n_simulations: int = 10000, 
-                          n_numbers: int = 15) -> Dict[str, any]:
+                          n_numbers: int = 15, seed: int | None = None,
+                          workers: int = 1) -> Dict[str, any]:
         """
         Simulação Monte Carlo pura (jogos completamente aleatórios).
         
+        Os jogos são gerados e conferidos em blocos vetorizados (ver
+        monte_carlo_histogram); para a mesma semente o resultado é o mesmo
+        com qualquer quantidade de processos.
+        
         Args:
             n_simulations: Número de simulações
             n_numbers: Quantidade de números por jogo
+            seed: Semente (None = não reproduzível)
+            workers: Processos usados na simulação
             
         Returns:
             Estatísticas agregadas
         """
         print(f"🎰 Executando Monte Carlo: {n_simulations:,} simulações...")
         
-        all_matches = []
-        prizes = {11: 0, 12: 0, 13: 0, 14: 0, 15: 0}
-        
-        for _ in tqdm(range(n_simulations), desc="Simulações"):
-            # Gera jogo aleatório
-            game = sorted(np.random.choice(range(1, 26), size=n_numbers, replace=False).tolist())
-            
-            # Testa contra um sorteio aleatório do histórico
-            draw = self.draw_sets[np.random.randint(0, len(self.draw_sets))]
-            
-            n_matches = self.count_matches(game, draw)
-            all_matches.append(n_matches)
-            
-            if n_matches >= 11:
-                prizes[n_matches] += 1
+        histogram = monte_carlo_histogram(self.store.masks, n_simulations, n_numbers,
+                                          seed=seed, workers=workers)
+        hits = np.arange(histogram.size)
+        observed = np.nonzero(histogram)[0]
+        mean = (histogram * hits).sum() / n_simulations
+        variance = (histogram * (hits - mean) ** 2).sum() / n_simulations
+        prizes = {tier: int(histogram[tier]) for tier in PRIZE_TIERS}
         
         return {
             'n_simulacoes': n_simulations,
-            'media_acertos': np.mean(all_matches),
-            'desvio_acertos': np.std(all_matches),
-            'min_acertos': min(all_matches),
-            'max_acertos': max(all_matches),
+            'media_acertos': float(mean),
+            'desvio_acertos': float(np.sqrt(variance)),
+            'min_acertos': int(observed[0]),
+            'max_acertos': int(observed[-1]),
             'premios_11': prizes[11],
             'premios_12': prizes[12],
             'premios_13': prizes[13],
@@ -5,12 +5,26 @@ Gera combinações otimizadas dos 18 números que mais saíram,
 removendo jogos improváveis e mantendo custo abaixo de R$ 1.000.
 """
 
+import os
+import sys
+import heapq
 import pandas as pd
 import numpy as np
-from itertools import combinations
 from pathlib import Path
 import json
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bitmask import N_NUMBERS, mask_to_numbers, numbers_to_mask
+from src.combinatorics import iter_combination_masks
+from src.draw_cache import load_draw_table
+from src.game_scoring import adjacent_pair_counts, quality_scores, regional_balance
+from src.grid_mapping import GRID, number_to_coord
+from src.hit_engine import PRIZE_TIERS, hit_matrix
+from src.io_data import DEFAULT_DRAWS_PATH, load_draw_store
+from src.portfolio import optimize_portfolio, portfolio_summary, ticket_values
+from src.universe import load_prize_table
+
 
 class CombinationOptimizer:
     """Otimizador de combinações para reduzir custo"""
@@ -67,49 +81,28 @@ class CombinationOptimizer:
             if int(row['a']) in self.hot_numbers and int(row['b']) in self.hot_numbers
         ]
         
-        print(f"\n🔗 Super pares disponíveis entre os 18 números: {len(self.super_pairs)}")
+        print(f"\n🔗 Super pares disponíveis entre os {len(self.hot_numbers)} números: {len(self.super_pairs)}")
         if len(self.super_pairs) > 0:
             print(f"  Top 5: {self.super_pairs[:5]}")
     
     def number_to_coord(self, num):
         """Converter número para coordenada no grid 5×5"""
-        num = num - 1
-        linha = num // 5
-        coluna = num % 5
-        return (linha, coluna)
+        return number_to_coord(num)
     
     def calculate_dispersion(self, numbers):
         """Calcular dispersão espacial"""
-        coords = [self.number_to_coord(n) for n in numbers]
+        coords = GRID.coords[list(numbers)]
         
-        centroid_row = np.mean([c[0] for c in coords])
-        centroid_col = np.mean([c[1] for c in coords])
+        centroid_row = np.mean(coords[:, 0])
+        centroid_col = np.mean(coords[:, 1])
         
-        distances = [
-            np.sqrt((c[0] - centroid_row)**2 + (c[1] - centroid_col)**2) 
-            for c in coords
-        ]
+        distances = np.sqrt((coords[:, 0] - centroid_row)**2 + (coords[:, 1] - centroid_col)**2)
         
         return np.mean(distances)
     
     def count_adjacent_pairs(self, numbers):
         """Contar pares adjacentes"""
-        coords = set(self.number_to_coord(n) for n in numbers)
-        adjacent_count = 0
-        
-        for linha, coluna in coords:
-            neighbors = [
-                (linha - 1, coluna),
-                (linha + 1, coluna),
-                (linha, coluna - 1),
-                (linha, coluna + 1)
-            ]
-            
-            for neighbor in neighbors:
-                if neighbor in coords:
-                    adjacent_count += 1
-        
-        return adjacent_count // 2
+        return int(adjacent_pair_counts([numbers_to_mask(numbers)])[0])
     
     def has_super_pair(self, numbers):
         """Verificar se contém pelo menos 1 super par"""
@@ -121,21 +114,8 @@ class CombinationOptimizer:
     
     def check_regional_balance(self, numbers):
         """Verificar equilíbrio regional (linhas e colunas)"""
-        coords = [self.number_to_coord(n) for n in numbers]
-        
-        line_counts = [0] * 5
-        for linha, _ in coords:
-            line_counts[linha] += 1
-        
-        col_counts = [0] * 5
-        for _, coluna in coords:
-            col_counts[coluna] += 1
-        
-        # Verificar se distribuição é razoável (não concentrado)
-        line_balanced = all(1 <= count <= 5 for count in line_counts)
-        col_balanced = all(1 <= count <= 5 for count in col_counts)
-        
-        return line_balanced and col_balanced
+        # Distribuição razoável (não concentrado): 1 a 5 por linha/coluna
+        return bool(regional_balance([numbers_to_mask(numbers)], 1, 5)[0])
     
     def score_game(self, numbers):
         """Pontuar jogo baseado em critérios de qualidade"""
@@ -169,46 +149,79 @@ class CombinationOptimizer:
         
         return score
     
-    def filter_and_rank_combinations(self):
-        """Filtrar e rankear combinações"""
+    def score_masks(self, masks):
+        """
+        Pontuar vários jogos de uma vez (versão vetorizada de score_game).
+
+        Args:
+            masks: Array (M,) de bitmasks dos jogos
+
+        Returns:
+            Dicionário de arrays (M,): score, dispersion, adjacent_pairs,
+            has_super_pair, balanced
+        """
+        return quality_scores(masks, self.super_pairs)
+
+    def filter_and_rank_combinations(self, chunk_size=1 << 16):
+        """
+        Filtrar e rankear combinações.
+
+        Enumera as combinações como bitmasks em blocos e mantém apenas os
+        max_games melhores em um heap, então a memória não depende do
+        tamanho do pool. Empates de score seguem a ordem de
+        itertools.combinations(self.hot_numbers, 15).
+        """
+        total = self._calculate_combinations(len(self.hot_numbers), 15)
         print(f"\n🔬 FILTRANDO E RANQUEANDO COMBINAÇÕES...")
-        print(f"  Gerando todas as {self._calculate_combinations(18, 15):,} combinações...")
-        
-        # Gerar todas as combinações
-        all_combos = list(combinations(self.hot_numbers, 15))
-        
-        print(f"  Pontuando {len(all_combos):,} jogos...")
-        
-        # Pontuar cada combinação
-        scored_games = []
-        for i, combo in enumerate(all_combos):
-            if i % 100 == 0:
-                print(f"    Processando: {i:,} / {len(all_combos):,} ({i/len(all_combos)*100:.1f}%)", end='\r')
-            
-            score = self.score_game(combo)
-            
+        print(f"  Pontuando {total:,} jogos...")
+
+        # heap de (score, -posição, bitmask): a raiz é o pior jogo mantido
+        heap = []
+        approved = 0
+        processed = 0
+        for masks in iter_combination_masks(self.hot_numbers, 15, chunk_size, order="lex"):
+            print(f"    Processando: {processed:,} / {total:,} ({processed/total*100:.1f}%)", end='\r')
+            scores = self.score_masks(masks)['score']
+
             # Filtro mínimo: score >= 5 (pelo menos metade dos pontos)
-            if score >= 5:
-                scored_games.append({
-                    'numbers': sorted(combo),
-                    'score': score,
-                    'dispersion': self.calculate_dispersion(combo),
-                    'adjacent_pairs': self.count_adjacent_pairs(combo),
-                    'has_super_pair': self.has_super_pair(combo)
-                })
-        
-        print(f"\n  ✅ Jogos aprovados (score ≥ 5): {len(scored_games):,}")
-        
-        # Ordenar por score (maior para menor)
-        scored_games.sort(key=lambda x: x['score'], reverse=True)
+            keep = np.flatnonzero(scores >= 5)
+            approved += keep.size
+            if keep.size > self.max_games:
+                # melhores do bloco: maior score, depois menor posição
+                order = np.lexsort((keep, -scores[keep]))
+                keep = keep[order[:self.max_games]]
+
+            for i in keep.tolist():
+                item = (int(scores[i]), -(processed + i), int(masks[i]))
+                if len(heap) < self.max_games:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+            processed += masks.size
+
+        best = sorted(heap, reverse=True)
+        best_masks = np.array([item[2] for item in best], dtype=np.uint32)
+        details = self.score_masks(best_masks)
+
+        scored_games = [
+            {
+                'numbers': mask_to_numbers(mask),
+                'score': int(details['score'][i]),
+                'dispersion': float(details['dispersion'][i]),
+                'adjacent_pairs': int(details['adjacent_pairs'][i]),
+                'has_super_pair': bool(details['has_super_pair'][i])
+            }
+            for i, mask in enumerate(best_masks)
+        ]
+        print(f"\n  ✅ Jogos aprovados (score ≥ 5): {approved:,}")
         
-        # Selecionar os melhores jogos dentro do orçamento
-        self.optimized_games = scored_games[:self.max_games]
+        # Melhores jogos dentro do orçamento, já ordenados por score
+        self.optimized_games = scored_games
         
         print(f"\n📊 RESULTADO DA OTIMIZAÇÃO:")
         print(f"  • Jogos selecionados: {len(self.optimized_games)}")
         print(f"  • Custo total: R$ {len(self.optimized_games) * self.price_per_game:.2f}")
-        print(f"  • Economia: R$ {(len(all_combos) - len(self.optimized_games)) * self.price_per_game:,.2f}")
+        print(f"  • Economia: R$ {(processed - len(self.optimized_games)) * self.price_per_game:,.2f}")
         print(f"  • Score médio: {np.mean([g['score'] for g in self.optimized_games]):.2f} / 10")
         
         # Estatísticas
@@ -218,6 +231,69 @@ class CombinationOptimizer:
         print(f"  • Dispersão média: {np.mean([g['dispersion'] for g in self.optimized_games]):.2f}")
         print(f"  • Jogos com super par: {sum(1 for g in self.optimized_games if g['has_super_pair'])}")
         
+    def optimize_portfolio(self, objective='cobertura', min_score=5, iterations=20000, seed=0):
+        """
+        Escolher o conjunto de jogos que cabe no orçamento com maior valor.
+
+        Em vez de cortar a lista ordenada por score (empates arbitrários e
+        jogos sobrepostos), pontua todas as combinações do pool contra o
+        histórico (matriz jogos × sorteios) e seleciona max_games delas com
+        simulated annealing + tabu (ver portfolio.optimize_portfolio).
+
+        Args:
+            objective: "cobertura" (melhor acerto por sorteio, pesos por
+                       faixa) ou "premio" (soma dos rateios pagos)
+            min_score: Score mínimo de qualidade das candidatas
+            iterations: Trocas avaliadas na busca
+            seed: Semente da busca
+        """
+        total = self._calculate_combinations(len(self.hot_numbers), 15)
+        print(f"\n🔬 OTIMIZANDO PORTFÓLIO ({objective.upper()})...")
+        print(f"  Pontuando {total:,} jogos...")
+
+        masks = np.concatenate(list(iter_combination_masks(self.hot_numbers, 15, order="lex")))
+        candidates = masks[self.score_masks(masks)['score'] >= min_score]
+        print(f"  ✅ Candidatos (score ≥ {min_score}): {candidates.size:,}")
+
+        store = load_draw_store()
+        hits = hit_matrix(candidates, store)
+        prizes = None
+        if objective == 'premio':
+            prizes = load_prize_table(load_draw_table(DEFAULT_DRAWS_PATH, n_max=N_NUMBERS))
+
+        result = optimize_portfolio(hits, self.max_games, objective, prizes,
+                                    iterations=iterations, seed=seed)
+        chosen = result['indices']
+        values = ticket_values(hits, objective, prizes)[chosen]
+        details = self.score_masks(candidates[chosen])
+
+        self.optimized_games = [
+            {
+                'numbers': mask_to_numbers(mask),
+                'score': int(details['score'][i]),
+                'dispersion': float(details['dispersion'][i]),
+                'adjacent_pairs': int(details['adjacent_pairs'][i]),
+                'has_super_pair': bool(details['has_super_pair'][i]),
+                'value': float(values[i])
+            }
+            for i, mask in enumerate(candidates[chosen])
+        ]
+
+        summary = portfolio_summary(hits, chosen)
+        print(f"\n📊 RESULTADO DA OTIMIZAÇÃO:")
+        print(f"  • Jogos selecionados: {len(self.optimized_games)}")
+        print(f"  • Custo total: R$ {len(self.optimized_games) * self.price_per_game:.2f}")
+        print(f"  • Economia: R$ {(total - len(self.optimized_games)) * self.price_per_game:,.2f}")
+        print(f"  • Valor do portfólio: {result['valor']:,.2f} "
+              f"(ponto de partida: {result['valor_inicial']:,.2f}, "
+              f"{result['trocas_aceitas']:,} trocas aceitas)")
+        print(f"  • Score médio: {np.mean([g['score'] for g in self.optimized_games]):.2f} / 10")
+
+        print(f"\n📈 COBERTURA NO HISTÓRICO ({len(store)} sorteios):")
+        for tier in PRIZE_TIERS:
+            covered = summary[f'sorteios_{tier}+']
+            print(f"  • Pelo menos {tier} acertos: {covered:,} sorteios ({covered / len(store) * 100:.1f}%)")
+
     def save_optimized_games(self):
         """Salvar jogos otimizados"""
         print(f"\n💾 Salvando jogos otimizados...")
@@ -258,10 +334,10 @@ RELATÓRIO: COMBINAÇÕES OTIMIZADAS - 18 NÚMEROS MAIS QUENTES
   • Saldo restante: R$ {self.budget - (len(self.optimized_games) * self.price_per_game):.2f}
 
 📊 COMPARAÇÃO:
-  • Total de combinações (fechar): {self._calculate_combinations(18, 15):,}
-  • Custo total (fechar): R$ {self._calculate_combinations(18, 15) * self.price_per_game:,.2f}
-  • Economia obtida: R$ {(self._calculate_combinations(18, 15) - len(self.optimized_games)) * self.price_per_game:,.2f}
-  • Redução de custo: {(1 - len(self.optimized_games)/self._calculate_combinations(18, 15))*100:.1f}%
+  • Total de combinações (fechar): {self._calculate_combinations(len(self.hot_numbers), 15):,}
+  • Custo total (fechar): R$ {self._calculate_combinations(len(self.hot_numbers), 15) * self.price_per_game:,.2f}
+  • Economia obtida: R$ {(self._calculate_combinations(len(self.hot_numbers), 15) - len(self.optimized_games)) * self.price_per_game:,.2f}
+  • Redução de custo: {(1 - len(self.optimized_games)/self._calculate_combinations(len(self.hot_numbers), 15))*100:.1f}%
 
 🎯 CRITÉRIOS DE OTIMIZAÇÃO:
   1. Dispersão Espacial (até 3 pontos)
@@ -285,7 +361,8 @@ RELATÓRIO: COMBINAÇÕES OTIMIZADAS - 18 NÚMEROS MAIS QUENTES
 
 ✅ RECOMENDAÇÕES:
   • Todos os jogos têm score ≥ 5/10 (mínimo de qualidade)
-  • Jogos estão ordenados por score (melhores primeiro)
+  • Jogos escolhidos em conjunto para cobrir o histórico (sem sobreposição inútil)
+  • Ordenados pelo valor individual no histórico (melhores primeiro)
   • Combine estes jogos com sua análise pessoal
   • Jogue com responsabilidade
 
@@ -309,16 +386,16 @@ Arquivos gerados:
             print(f"      Números: {nums_str}")
 
 
-def main():
-    """Executar otimização"""
+def main(top_n=18):
+    """Executar otimização (top_n: tamanho do pool de números quentes)"""
     optimizer = CombinationOptimizer(budget=1000, price_per_game=3.00)
     
     # Carregar dados
-    optimizer.load_hot_numbers(top_n=18)
+    optimizer.load_hot_numbers(top_n=top_n)
     optimizer.load_super_pairs()
     
-    # Filtrar e rankear
-    optimizer.filter_and_rank_combinations()
+    # Selecionar o portfólio dentro do orçamento
+    optimizer.optimize_portfolio()
     
     # Salvar resultados
     optimizer.save_optimized_games()
@@ -327,7 +404,7 @@ def main():
     print("✅ OTIMIZAÇÃO CONCLUÍDA!")
     print("=" * 80)
     print(f"\n💡 Você pode jogar {optimizer.max_games} jogos otimizados por R$ {optimizer.budget:.2f}")
-    print(f"   Economia de R$ {optimizer._calculate_combinations(18, 15) * 3.00 - optimizer.budget:,.2f} vs fechar!")
+    print(f"   Economia de R$ {optimizer._calculate_combinations(len(optimizer.hot_numbers), 15) * 3.00 - optimizer.budget:,.2f} vs fechar!")
 
 
 if __name__ == '__main__':
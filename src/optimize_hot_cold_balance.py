@@ -44,10 +44,17 @@ def load_recent_draws(n=20):
     
     return draws
 
-def simulate_strategy(num_cold, num_games=100):
-    """Simula uma estratégia com N números frios"""
-    hot_numbers, cold_numbers, df_sorted = load_hot_cold_numbers()
-    draws = load_recent_draws(20)
+def simulate_strategy(num_cold, num_games=100, df_sorted=None, draws=None):
+    """
+    Simula uma estratégia com N números frios
+
+    df_sorted e draws podem ser carregados uma vez e repassados a cada
+    proporção testada; só são lidos do disco se não forem passados
+    """
+    if df_sorted is None:
+        _, _, df_sorted = load_hot_cold_numbers()
+    if draws is None:
+        draws = load_recent_draws(20)
     
     # Seleciona os números
     num_hot = 18 - num_cold
@@ -119,10 +126,12 @@ def main():
     
     # Testa diferentes quantidades de números frios (0 a 8)
     results = []
+    _, _, df_sorted = load_hot_cold_numbers()
+    draws = load_recent_draws(20)
     
     for num_cold in range(0, 9):
         print(f"⏳ Testando: {18-num_cold} quentes + {num_cold} frios...")
-        result = simulate_strategy(num_cold, num_games=200)
+        result = simulate_strategy(num_cold, num_games=200, df_sorted=df_sorted, draws=draws)
         results.append(result)
     
     print()
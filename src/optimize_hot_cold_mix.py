@@ -3,11 +3,18 @@ Otimiza a proporção de números quentes e frios em apostas de 18 números
 baseado em análises históricas
 """
 
+import os
+import sys
 import pandas as pd
 from pathlib import Path
 from itertools import combinations
 import numpy as np
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+from src.hit_engine import hit_matrix
+
 def load_hot_and_cold_numbers():
     """Carrega números quentes e frios"""
     df = pd.read_csv('out/lotofacil/numeros_quentes_frios.csv')
@@ -26,43 +33,16 @@ def load_hot_and_cold_numbers():
     return hot_numbers, cold_numbers, hot_data, cold_data
 
 def load_recent_draws(n=20):
-    """Carrega os últimos N sorteios"""
-    df = pd.read_csv('data/lotofacil_sorteios.csv')
-    recent = df.tail(n)
-    
-    draws = []
-    for _, row in recent.iterrows():
-        numbers = set()
-        for i in range(1, 16):
-            numbers.add(int(row[f'Bola{i}']))
-        draws.append({
-            'concurso': int(row['Concurso']),
-            'data': row['Data Sorteio'],
-            'numbers': numbers
-        })
-    
-    return draws
+    """Carrega os últimos N sorteios (bitmasks compartilhados)"""
+    return load_draw_store().tail(n)
 
-def simulate_mix_strategy(hot_count, cold_count, hot_numbers, cold_numbers, draws):
+def evaluate_game(strategy, game_numbers, draws):
     """
-    Simula uma estratégia com X quentes + Y frios
+    Testa um jogo contra os sorteios
     Retorna estatísticas de acertos
     """
-    # Seleciona os top hot_count quentes e top cold_count frios "mais quentes entre os frios"
-    df = pd.read_csv('out/lotofacil/numeros_quentes_frios.csv')
-    
-    # Pega os mais quentes
-    top_hot = df[df['numero'].isin(hot_numbers)].nlargest(hot_count, 'freq')['numero'].tolist()
-    
-    # Pega os frios mais "quentes" (menor desvio negativo)
-    top_cold = df[df['numero'].isin(cold_numbers)].nlargest(cold_count, 'freq')['numero'].tolist()
-    
-    # Combinação
-    game_numbers = set(top_hot + top_cold)
-    
-    # Testa contra os sorteios
     results = {
-        'strategy': f"{hot_count} quentes + {cold_count} frios",
+        'strategy': strategy,
         'numbers': sorted(game_numbers),
         'hits_15': 0,
         'hits_14': 0,
@@ -72,21 +52,11 @@ def simulate_mix_strategy(hot_count, cold_count, hot_numbers, cold_numbers, draw
         'total_hits': 0
     }
     
-    for draw in draws:
-        matches = len(game_numbers & draw['numbers'])
-        if matches == 15:
-            results['hits_15'] += 1
-        elif matches == 14:
-            results['hits_14'] += 1
-        elif matches == 13:
-            results['hits_13'] += 1
-        elif matches == 12:
-            results['hits_12'] += 1
-        elif matches == 11:
-            results['hits_11'] += 1
-        
-        if matches >= 11:
-            results['total_hits'] += 1
+    matches = hit_matrix([game_numbers], draws)[0]
+    counts = np.bincount(matches, minlength=16)
+    for tier in range(11, 16):
+        results[f'hits_{tier}'] = int(counts[tier])
+    results['total_hits'] = int(counts[11:].sum())
     
     # Score ponderado: 15=100, 14=20, 13=5, 12=2, 11=1
     results['weighted_score'] = (
@@ -99,6 +69,30 @@ def simulate_mix_strategy(hot_count, cold_count, hot_numbers, cold_numbers, draw
     
     return results
 
+def simulate_mix_strategy(hot_count, cold_count, hot_numbers, cold_numbers, draws, df=None):
+    """
+    Simula uma estratégia com X quentes + Y frios
+    Retorna estatísticas de acertos
+
+    df é a tabela numeros_quentes_frios.csv já carregada; só é lida do
+    disco se não for passada (para varreduras, ver src/sweep.py)
+    """
+    # Seleciona os top hot_count quentes e top cold_count frios "mais quentes entre os frios"
+    if df is None:
+        df = pd.read_csv('out/lotofacil/numeros_quentes_frios.csv')
+    
+    # Pega os mais quentes
+    top_hot = df[df['numero'].isin(hot_numbers)].nlargest(hot_count, 'freq')['numero'].tolist()
+    
+    # Pega os frios mais "quentes" (menor desvio negativo)
+    top_cold = df[df['numero'].isin(cold_numbers)].nlargest(cold_count, 'freq')['numero'].tolist()
+    
+    # Combinação
+    game_numbers = set(top_hot + top_cold)
+    
+    # Testa contra os sorteios
+    return evaluate_game(f"{hot_count} quentes + {cold_count} frios", game_numbers, draws)
+
 def main():
     print("="*80)
     print("🔬 OTIMIZAÇÃO DA MIX QUENTES + FRIOS")
@@ -112,7 +106,7 @@ def main():
     print(f"📊 Base de análise:")
     print(f"   • 10 números quentes: {hot_numbers}")
     print(f"   • 15 números frios: {cold_numbers}")
-    print(f"   • Últimos 20 sorteios (concursos {draws[-1]['concurso']} a {draws[0]['concurso']})")
+    print(f"   • Últimos 20 sorteios (concursos {draws.contests[-1]} a {draws.contests[0]})")
     print()
     
     print("="*80)
@@ -139,66 +133,24 @@ def main():
     critical_cold = [8, 6, 21, 7, 9]  # Top 5 frios que mais impediram vitórias
     
     # Estratégia 1: 18 mais quentes (atual)
-    result1 = simulate_mix_strategy(18, 0, top_18, [], draws)
+    result1 = simulate_mix_strategy(18, 0, top_18, [], draws, df)
     result1['strategy'] = "18 mais quentes (atual)"
     result1['numbers'] = top_18
     strategies.append(result1)
     
     # Estratégia 2: 17 quentes + 1 frio crítico (8)
     game2 = top_17 + [8]
-    result2 = {
-        'strategy': "17 quentes + 1 frio (8)",
-        'numbers': game2,
-        'hits_15': 0, 'hits_14': 0, 'hits_13': 0, 'hits_12': 0, 'hits_11': 0, 'total_hits': 0
-    }
-    for draw in draws:
-        matches = len(set(game2) & draw['numbers'])
-        if matches == 15: result2['hits_15'] += 1
-        elif matches == 14: result2['hits_14'] += 1
-        elif matches == 13: result2['hits_13'] += 1
-        elif matches == 12: result2['hits_12'] += 1
-        elif matches == 11: result2['hits_11'] += 1
-        if matches >= 11: result2['total_hits'] += 1
-    result2['weighted_score'] = (result2['hits_15']*100 + result2['hits_14']*20 + 
-                                  result2['hits_13']*5 + result2['hits_12']*2 + result2['hits_11']*1)
+    result2 = evaluate_game("17 quentes + 1 frio (8)", game2, draws)
     strategies.append(result2)
     
     # Estratégia 3: 16 quentes + 2 frios (8, 6)
     game3 = top_16 + [8, 6]
-    result3 = {
-        'strategy': "16 quentes + 2 frios (8, 6)",
-        'numbers': game3,
-        'hits_15': 0, 'hits_14': 0, 'hits_13': 0, 'hits_12': 0, 'hits_11': 0, 'total_hits': 0
-    }
-    for draw in draws:
-        matches = len(set(game3) & draw['numbers'])
-        if matches == 15: result3['hits_15'] += 1
-        elif matches == 14: result3['hits_14'] += 1
-        elif matches == 13: result3['hits_13'] += 1
-        elif matches == 12: result3['hits_12'] += 1
-        elif matches == 11: result3['hits_11'] += 1
-        if matches >= 11: result3['total_hits'] += 1
-    result3['weighted_score'] = (result3['hits_15']*100 + result3['hits_14']*20 + 
-                                  result3['hits_13']*5 + result3['hits_12']*2 + result3['hits_11']*1)
+    result3 = evaluate_game("16 quentes + 2 frios (8, 6)", game3, draws)
     strategies.append(result3)
     
     # Estratégia 4: 15 quentes + 3 frios (8, 6, 9)
     game4 = top_15 + [8, 6, 9]
-    result4 = {
-        'strategy': "15 quentes + 3 frios (8, 6, 9)",
-        'numbers': game4,
-        'hits_15': 0, 'hits_14': 0, 'hits_13': 0, 'hits_12': 0, 'hits_11': 0, 'total_hits': 0
-    }
-    for draw in draws:
-        matches = len(set(game4) & draw['numbers'])
-        if matches == 15: result4['hits_15'] += 1
-        elif matches == 14: result4['hits_14'] += 1
-        elif matches == 13: result4['hits_13'] += 1
-        elif matches == 12: result4['hits_12'] += 1
-        elif matches == 11: result4['hits_11'] += 1
-        if matches >= 11: result4['total_hits'] += 1
-    result4['weighted_score'] = (result4['hits_15']*100 + result4['hits_14']*20 + 
-                                  result4['hits_13']*5 + result4['hits_12']*2 + result4['hits_11']*1)
+    result4 = evaluate_game("15 quentes + 3 frios (8, 6, 9)", game4, draws)
     strategies.append(result4)
     
     # Exibe resultados
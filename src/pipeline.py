@@ -0,0 +1,384 @@
+"""
+Módulo de pipeline declarativo das etapas de análise.
+Cada etapa declara os arquivos que lê e os que grava; as dependências
+entre etapas saem desses arquivos, etapas cujas entradas, código e saídas
+não mudaram desde a última execução são puladas, e etapas independentes
+rodam ao mesmo tempo em processos separados.
+"""
+from __future__ import annotations
+
+import ast
+import contextlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Sequence, Set
+
+from .draw_cache import _file_sha256, _write_json
+
+DEFAULT_STATE_PATH = "out/state/pipeline.json"
+DEFAULT_LOG_DIR = "out/state/logs"
+
+# situação de cada etapa em uma execução
+STATUS_FRESH = "atualizada"
+STATUS_DONE = "executada"
+STATUS_FAILED = "falhou"
+STATUS_BLOCKED = "bloqueada"
+STATUS_PENDING = "pendente"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Uma etapa do pipeline.
+
+    Atributos:
+        name: Nome único da etapa
+        run: Função de módulo sem argumentos que grava as saídas
+        inputs: Arquivos lidos pela etapa
+        outputs: Arquivos gravados pela etapa
+        code: Módulos de entrada da etapa (padrão: o módulo de run); a etapa
+              depende deles e dos módulos de src/ que importam (source_closure)
+        description: Descrição curta
+    """
+    name: str
+    run: Callable[[], object]
+    inputs: Sequence[str] = ()
+    outputs: Sequence[str] = ()
+    code: Sequence[str] = ()
+    description: str = ""
+
+    def code_files(self) -> List[str]:
+        return source_closure(list(self.code) or [inspect.getsourcefile(self.run)])
+
+
+@dataclass
+class StageResult:
+    """Resultado de uma etapa: situação, duração (s) e mensagem."""
+    name: str
+    status: str
+    seconds: float = 0.0
+    message: str = ""
+
+
+def _local_imports(path: str) -> List[str]:
+    """
+    Arquivos .py do mesmo diretório importados no nível de módulo de path
+    (inclusive dentro de try/if, ex.: o import duplo de figure_renderer).
+
+    Imports dentro de funções e classes ficam de fora: são os carregamentos tardios
+    de pipeline_stages, que apontam para os scripts de cada etapa.
+    """
+    folder = os.path.dirname(path)
+    package = os.path.basename(folder)
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), path)
+    module_level = [node for stmt in tree.body
+                    if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+                    for node in ast.walk(stmt)]
+    names = []
+    for node in module_level:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            names += [base] if base else [alias.name for alias in node.names]
+    found = []
+    for name in names:
+        parts = name.split(".")
+        # from src.x / import src.x (scripts) -> x; import x (scripts da Mega-Sena) -> x
+        if len(parts) > 1 and parts[0] == package:
+            parts = parts[1:]
+        candidate = os.path.join(folder, parts[0] + ".py")
+        if os.path.exists(candidate):
+            found.append(candidate)
+    return found
+
+
+def source_closure(paths: Iterable[str]) -> List[str]:
+    """
+    Arquivos de código dados mais os módulos locais que eles importam,
+    recursivamente (imports relativos, src.x e x com x.py no mesmo diretório,
+    no nível de módulo).
+
+    Args:
+        paths: Arquivos .py de entrada
+
+    Returns:
+        Lista ordenada de arquivos (os inexistentes são mantidos, para que
+        o hash registre a ausência)
+    """
+    seen, stack = set(), [os.path.relpath(p) for p in paths]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        if os.path.exists(path):
+            stack.extend(os.path.relpath(p) for p in _local_imports(path))
+    return sorted(seen)
+
+
+def _fingerprint(paths: Iterable[str]) -> Dict[str, str | None]:
+    """Hash do conteúdo de cada arquivo (None se ausente)."""
+    return {path: _file_sha256(path) if os.path.exists(path) else None for path in paths}
+
+
+def _run_logged(func: Callable[[], object], log_path: str) -> None:
+    """Executa a etapa com stdout/stderr redirecionados para o log."""
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    with open(log_path, "w", encoding="utf-8") as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        func()
+
+
+@dataclass
+class Pipeline:
+    """
+    Grafo de etapas ligado pelos arquivos de entrada e saída.
+
+    A etapa B depende de A quando B lê um arquivo que A grava. Arquivos
+    lidos que nenhuma etapa grava são entradas externas (ex.: o CSV de
+    sorteios) e precisam existir em disco.
+
+    Atributos:
+        stages: Etapas em ordem de declaração
+        state_path: JSON com as impressões digitais da última execução de cada etapa
+        log_dir: Diretório dos logs de cada etapa
+    """
+    stages: List[Stage]
+    state_path: str = DEFAULT_STATE_PATH
+    log_dir: str = DEFAULT_LOG_DIR
+    producers: Dict[str, str] = field(init=False)
+
+    def __post_init__(self):
+        names = [s.name for s in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError("Nomes de etapa repetidos")
+        self.producers = {}
+        for stage in self.stages:
+            for path in stage.outputs:
+                if path in self.producers:
+                    raise ValueError(f"{path} é gravado por {self.producers[path]} e {stage.name}")
+                self.producers[path] = stage.name
+        self._order()
+
+    def __getitem__(self, name: str) -> Stage:
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise KeyError(name)
+
+    def dependencies(self, name: str) -> Set[str]:
+        """Etapas que gravam algum arquivo lido pela etapa."""
+        return {self.producers[p] for p in self[name].inputs
+                if p in self.producers and self.producers[p] != name}
+
+    def _order(self) -> List[str]:
+        """Ordem topológica (Kahn), preservando a ordem de declaração."""
+        pending = {s.name: self.dependencies(s.name) for s in self.stages}
+        order = []
+        while pending:
+            ready = [n for n, deps in pending.items() if not deps]
+            if not ready:
+                raise ValueError(f"Ciclo entre as etapas: {sorted(pending)}")
+            for name in ready:
+                order.append(name)
+                del pending[name]
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return order
+
+    def upstream(self, targets: Iterable[str]) -> Set[str]:
+        """Etapas pedidas mais todas as de que elas dependem."""
+        selected, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in selected:
+                self[name]
+                selected.add(name)
+                stack.extend(self.dependencies(name))
+        return selected
+
+    def _load_state(self) -> Dict[str, dict]:
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _record(self, stage: Stage) -> dict:
+        return {
+            'inputs': _fingerprint(stage.inputs),
+            'code': _fingerprint(stage.code_files()),
+            'outputs': _fingerprint(stage.outputs),
+        }
+
+    def is_fresh(self, stage: Stage, state: Dict[str, dict]) -> bool:
+        """
+        A etapa pode ser pulada: entradas, código e saídas iguais aos
+        registrados na última execução bem-sucedida (e todas as saídas existem).
+        """
+        saved = state.get(stage.name)
+        if saved is None:
+            return False
+        current = self._record(stage)
+        return current == saved and all(h is not None for h in current['outputs'].values())
+
+    def plan(self, targets: Iterable[str] | None = None) -> List[StageResult]:
+        """
+        O que run() faria, sem executar nada.
+
+        Etapas dependentes de uma etapa pendente também ficam pendentes,
+        pois as saídas dela podem mudar.
+
+        Args:
+            targets: Etapas desejadas (com suas dependências); padrão: todas
+
+        Returns:
+            Lista de StageResult em ordem topológica (atualizada, pendente ou bloqueada)
+        """
+        selected = self.upstream(targets) if targets is not None else {s.name for s in self.stages}
+        state = self._load_state()
+        status: Dict[str, StageResult] = {}
+        for name in self._order():
+            if name not in selected:
+                continue
+            stage = self[name]
+            deps = self.dependencies(name)
+            missing = [p for p in stage.inputs if p not in self.producers and not os.path.exists(p)]
+            blockers = sorted(d for d in deps if status[d].status == STATUS_BLOCKED)
+            if missing:
+                status[name] = StageResult(name, STATUS_BLOCKED, message=f"entrada ausente: {', '.join(missing)}")
+            elif blockers:
+                status[name] = StageResult(name, STATUS_BLOCKED, message=f"depende de {', '.join(blockers)}")
+            elif any(status[d].status == STATUS_PENDING for d in deps) or not self.is_fresh(stage, state):
+                status[name] = StageResult(name, STATUS_PENDING)
+            else:
+                status[name] = StageResult(name, STATUS_FRESH)
+        return list(status.values())
+
+    def run(self, targets: Iterable[str] | None = None, workers: int = 1, force: bool = False,
+            on_result: Callable[[StageResult], None] | None = None) -> List[StageResult]:
+        """
+        Executa as etapas desatualizadas, em paralelo quando independentes.
+
+        Uma etapa só começa depois que todas as etapas de que depende
+        terminam; se alguma falhar (ou faltar uma entrada externa), as
+        dependentes ficam bloqueadas e as demais seguem. Etapas que rodaram
+        invalidam as dependentes pelo hash das saídas, não pela data.
+
+        Args:
+            targets: Etapas desejadas (com suas dependências); padrão: todas
+            workers: Processos usados (1 = em sequência, no próprio processo)
+            force: Executa mesmo as etapas atualizadas
+            on_result: Chamada a cada etapa concluída (ex.: para imprimir progresso)
+
+        Returns:
+            Lista de StageResult na ordem em que as etapas terminaram
+        """
+        selected = self.upstream(targets) if targets is not None else {s.name for s in self.stages}
+        order = [n for n in self._order() if n in selected]
+        state = self._load_state()
+        waiting = {n: self.dependencies(n) & selected for n in order}
+        results: List[StageResult] = []
+        failed: Set[str] = set()
+
+        def finish(result: StageResult) -> None:
+            results.append(result)
+            if result.status in (STATUS_FAILED, STATUS_BLOCKED):
+                failed.add(result.name)
+            else:
+                for deps in waiting.values():
+                    deps.discard(result.name)
+            if on_result:
+                on_result(result)
+
+        def start(name: str):
+            """Retorna a etapa a executar, ou None se ela já foi resolvida (atualizada ou bloqueada)."""
+            stage = self[name]
+            missing = [p for p in stage.inputs if p not in self.producers and not os.path.exists(p)]
+            if missing:
+                finish(StageResult(name, STATUS_BLOCKED, message=f"entrada ausente: {', '.join(missing)}"))
+                return None
+            if not force and self.is_fresh(stage, state):
+                finish(StageResult(name, STATUS_FRESH))
+                return None
+            for path in stage.outputs:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            return stage
+
+        def complete(stage: Stage, seconds: float, error: str | None) -> None:
+            missing = [p for p in stage.outputs if not os.path.exists(p)]
+            if error is None and missing:
+                error = f"saída não gerada: {', '.join(missing)}"
+            if error is None:
+                state[stage.name] = self._record(stage)
+                _write_state(self.state_path, state)
+                finish(StageResult(stage.name, STATUS_DONE, seconds))
+            else:
+                state.pop(stage.name, None)
+                _write_state(self.state_path, state)
+                finish(StageResult(stage.name, STATUS_FAILED, seconds, error))
+
+        def next_ready() -> List[str]:
+            ready = []
+            for name in list(waiting):
+                deps = waiting[name]
+                if deps & failed:
+                    del waiting[name]
+                    blockers = ', '.join(sorted(deps & failed))
+                    finish(StageResult(name, STATUS_BLOCKED, message=f"depende de {blockers}"))
+                elif not deps:
+                    del waiting[name]
+                    ready.append(name)
+            return ready
+
+        if workers <= 1:
+            while True:
+                ready = next_ready()
+                if not ready:
+                    return results
+                for name in ready:
+                    stage = start(name)
+                    if stage is None:
+                        continue
+                    began = time.perf_counter()
+                    try:
+                        _run_logged(stage.run, self._log_path(name))
+                        error = None
+                    except Exception as exc:
+                        error = f"{type(exc).__name__}: {exc}"
+                    complete(stage, time.perf_counter() - began, error)
+
+        running: Dict[Future, tuple] = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                ready = next_ready()
+                for name in ready:
+                    stage = start(name)
+                    if stage is not None:
+                        future = pool.submit(_run_logged, stage.run, self._log_path(name))
+                        running[future] = (stage, time.perf_counter())
+                if not running:
+                    if ready:
+                        # etapas já atualizadas podem ter liberado outras
+                        continue
+                    return results
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, began = running.pop(future)
+                    exc = future.exception()
+                    error = None if exc is None else f"{type(exc).__name__}: {exc}"
+                    complete(stage, time.perf_counter() - began, error)
+
+    def _log_path(self, name: str) -> str:
+        return os.path.join(self.log_dir, f"{name}.log")
+
+
+def _write_state(path: str, state: Dict[str, dict]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    _write_json(path, state)
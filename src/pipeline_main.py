@@ -0,0 +1,88 @@
+"""
+Script que executa as análises como um pipeline de etapas.
+
+Só roda as etapas cujas entradas, código ou saídas mudaram desde a última
+execução (ex.: depois de um novo concurso em data/lotofacil_sorteios.csv),
+com as etapas independentes em paralelo. A saída de cada etapa vai para
+out/state/logs/<etapa>.log.
+
+Exemplos:
+    python src/pipeline_main.py
+    python src/pipeline_main.py --plano
+    python src/pipeline_main.py --etapas simulacao excel --workers 4
+    python src/pipeline_main.py --etapas graficos --forcar
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pipeline import (DEFAULT_STATE_PATH, STATUS_BLOCKED, STATUS_DONE, STATUS_FAILED,
+                          STATUS_FRESH, STATUS_PENDING, Pipeline, StageResult)
+from src.pipeline_stages import lotofacil_stages
+
+ICONS = {
+    STATUS_FRESH: "⏭️ ",
+    STATUS_PENDING: "🔄",
+    STATUS_DONE: "✅",
+    STATUS_FAILED: "❌",
+    STATUS_BLOCKED: "⛔",
+}
+
+
+def _print_result(result: StageResult) -> None:
+    line = f"   {ICONS[result.status]} {result.name:<20} {result.status:<11}"
+    if result.status in (STATUS_DONE, STATUS_FAILED):
+        line += f" {result.seconds:7.1f}s"
+    if result.message:
+        line += f"  {result.message}"
+    print(line.rstrip(), flush=True)
+
+
+def main(argv=None):
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Pipeline de análises com etapas incrementais")
+    parser.add_argument("--etapas", nargs="+", help="Etapas desejadas (com suas dependências; padrão: todas)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos usados")
+    parser.add_argument("--forcar", action="store_true", help="Executa mesmo as etapas atualizadas")
+    parser.add_argument("--plano", action="store_true", help="Só mostra o que seria executado")
+    parser.add_argument("--listar", action="store_true", help="Lista as etapas e suas dependências")
+    parser.add_argument("--estado", default=DEFAULT_STATE_PATH, help="JSON com o estado das etapas")
+    args = parser.parse_args(argv)
+
+    pipeline = Pipeline(lotofacil_stages(), state_path=args.estado)
+
+    if args.listar:
+        for stage in pipeline.stages:
+            deps = ", ".join(sorted(pipeline.dependencies(stage.name))) or "-"
+            print(f"{stage.name:<20} {stage.description:<50} ← {deps}")
+        return
+
+    try:
+        pipeline.upstream(args.etapas or [])
+    except KeyError as exc:
+        parser.error(f"etapa desconhecida: {exc.args[0]} (use --listar)")
+
+    print("=" * 80)
+    print("🧩 PIPELINE DE ANÁLISES")
+    print("=" * 80)
+
+    if args.plano:
+        for result in pipeline.plan(args.etapas):
+            _print_result(result)
+        return
+
+    results = pipeline.run(args.etapas, workers=args.workers, force=args.forcar, on_result=_print_result)
+    counts = {status: sum(r.status == status for r in results) for status in ICONS}
+    print(f"\n{counts[STATUS_DONE]} executadas, {counts[STATUS_FRESH]} atualizadas, "
+          f"{counts[STATUS_FAILED]} com falha, {counts[STATUS_BLOCKED]} bloqueadas")
+    print(f"📁 Logs em: {pipeline.log_dir}/")
+    if counts[STATUS_FAILED]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Grafo de etapas da análise Lotofácil + Mega-Sena para src/pipeline.py.
+Cada etapa é uma função de módulo sem argumentos que lê suas entradas do
+disco e grava suas saídas em out/, como os scripts já fazem; as
+dependências saem dos caminhos declarados. O código de cada etapa é o do
+script que ela executa mais os módulos de src/ que ele importa.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+from typing import List
+
+from .io_data import DEFAULT_DRAWS_PATH
+from .pipeline import Stage
+
+MEGASENA_PATH = "data/mega-sena.csv"
+
+# cópias lidas por combined_analysis, export_to_excel e generate_more_games
+LOTOFACIL_PUBLISHED = [
+    "out/summary.json", "out/metrics_por_sorteio.csv", "out/freq_linhas.csv",
+    "out/freq_colunas.csv", "out/numeros_quentes_frios.csv", "out/pares_forca.csv",
+]
+MEGASENA_ANALYSES = "out/megasena_analyses.json"
+
+
+def _src(*names: str) -> List[str]:
+    return [os.path.join("src", f"{name}.py") for name in names]
+
+
+def _published(path: str, folder: str) -> str:
+    return os.path.join("out", folder, os.path.basename(path))
+
+
+def _load_draws():
+    from .io_data import load_draws_csv
+    return load_draws_csv(DEFAULT_DRAWS_PATH)
+
+
+# --- etapas de src/main.py (independentes entre si até o resumo) ---
+
+def heatmap() -> None:
+    from .main import heatmap_stage
+    heatmap_stage(*_load_draws())
+
+
+def metrics() -> None:
+    from .main import metrics_stage
+    metrics_stage(*_load_draws())
+
+
+def cooccurrence() -> None:
+    from .main import cooccurrence_stage
+    cooccurrence_stage(*_load_draws())
+
+
+def clusters() -> None:
+    from .main import clusters_stage, frequency_by_number
+    clusters_stage(frequency_by_number(*_load_draws()))
+
+
+def summary() -> None:
+    import pandas as pd
+    from .main import summary_stage
+    df, ball_cols = _load_draws()
+    clusters_df = pd.read_csv("out/clusters_dbscan_manhattan.csv")
+    summary_stage(len(df), ball_cols, len(clusters_df[clusters_df['cluster'] >= 0]['cluster'].unique()))
+
+
+def plots() -> None:
+    import pandas as pd
+    from .heatmap_analysis import compute_heatmap
+    from .main import frequency_by_number, plots_stage
+    df, ball_cols = _load_draws()
+    hm = compute_heatmap(df, ball_cols)
+    plots_stage(hm["heatmap_matrix"], hm["row_df"], hm["col_df"], frequency_by_number(df, ball_cols),
+                pd.read_csv("out/top_pares_coocorrencia.csv"), pd.read_csv("out/metrics_por_sorteio.csv"),
+                len(df))
+
+
+# --- scripts inteiros ---
+
+def advanced() -> None:
+    from .advanced_main import main
+    main()
+
+
+def simulation() -> None:
+    from .simulation_main import main
+    main()
+
+
+def megasena() -> None:
+    from .megasena_main import main
+    main(["--workers", "1"])
+
+
+def combined() -> None:
+    from .combined_analysis import main
+    main()
+
+
+def more_games() -> None:
+    from .generate_more_games import main
+    main()
+
+
+def backtesting() -> None:
+    from .backtesting import main
+    main()
+
+
+def excel() -> None:
+    from .export_to_excel import main
+    main([])
+
+
+def publish_lotofacil() -> None:
+    for path in LOTOFACIL_PUBLISHED:
+        os.makedirs(os.path.dirname(_published(path, "lotofacil")), exist_ok=True)
+        shutil.copyfile(path, _published(path, "lotofacil"))
+
+
+def publish_megasena() -> None:
+    os.makedirs(os.path.dirname(_published(MEGASENA_ANALYSES, "megasena")), exist_ok=True)
+    shutil.copyfile(MEGASENA_ANALYSES, _published(MEGASENA_ANALYSES, "megasena"))
+
+
+def lotofacil_stages() -> List[Stage]:
+    """
+    Etapas da análise completa, da leitura dos CSVs de sorteios ao Excel.
+
+    Returns:
+        Lista de Stage para Pipeline
+    """
+    draws = [DEFAULT_DRAWS_PATH]
+    advanced_out = [
+        "out/numeros_quentes_frios.csv", "out/tendencias_temporais.csv",
+        "out/clusters_vizinhos_imediatos.csv", "out/clusters_com_diagonais.csv",
+        "out/clusters_quadrantes.csv", "out/pares_forca.csv", "out/bias_borda_centro.json",
+    ]
+    combined_out = ["out/jogos_otimizados_combined.csv", "out/relatorio_analise_combinada.txt"]
+    backtesting_out = ["out/backtesting/resultados_por_jogo.csv", "out/backtesting/resultados_por_estrategia.csv"]
+    published_lf = [_published(p, "lotofacil") for p in LOTOFACIL_PUBLISHED]
+    published_ms = [_published(MEGASENA_ANALYSES, "megasena")]
+    return [
+        Stage("heatmap", heatmap, draws,
+              ["out/heatmap_5x5.csv", "out/freq_linhas.csv", "out/freq_colunas.csv"],
+              _src("main", "heatmap_analysis", "grid_mapping"), "Heatmap do grid 5x5"),
+        Stage("metricas", metrics, draws, ["out/metrics_por_sorteio.csv"],
+              _src("main", "spatial_metrics", "grid_mapping"), "Métricas espaciais por sorteio"),
+        Stage("coocorrencia", cooccurrence, draws,
+              ["out/top_pares_coocorrencia.csv", "out/top_trios_coocorrencia.csv",
+               "out/top_quadras_coocorrencia.csv"],
+              _src("main", "cooccurrence"), "Top pares, trios e quadras"),
+        Stage("clusters", clusters, draws, ["out/clusters_dbscan_manhattan.csv"],
+              _src("main", "cluster_analysis"), "Clusters DBSCAN (Manhattan)"),
+        Stage("resumo", summary, draws + ["out/clusters_dbscan_manhattan.csv"], ["out/summary.json"],
+              _src("main"), "Resumo em JSON"),
+        Stage("graficos", plots,
+              draws + ["out/top_pares_coocorrencia.csv", "out/metrics_por_sorteio.csv"],
+              ["out/heatmap_grid.png", "out/freq_barras.png", "out/linhas_colunas.png",
+               "out/rede_coocorrencia.png", "out/metricas_espaciais.png", "out/relatorio_resumo.txt"],
+              _src("main", "visualizations", "heatmap_analysis", "figure_renderer"),
+              "Gráficos e relatório em texto"),
+        Stage("avancado", advanced, draws, advanced_out,
+              _src("advanced_main", "advanced_analysis"), "Quentes/frios, tendências, micro-clusters, bias"),
+        Stage("simulacao", simulation, draws + advanced_out,
+              ["out/jogos_gerados.csv", "out/resultados_estrategias.csv", "out/comparacao_estrategias.csv",
+               "out/melhores_jogos.csv", "out/baseline_aleatorio.json"],
+              _src("simulation_main", "game_generator", "monte_carlo", "probability"),
+              "Simulação e comparação de estratégias"),
+        Stage("publicar_lotofacil", publish_lotofacil, LOTOFACIL_PUBLISHED, published_lf,
+              _src("pipeline_stages"), "Copia as saídas para out/lotofacil/"),
+        Stage("megasena", megasena, [MEGASENA_PATH],
+              [MEGASENA_ANALYSES, "out/megasena_geometric_report.txt"],
+              _src("megasena_main", "megasena_geometric_analysis", "megasena_grid_mapping",
+                   "megasena_visualizations", "figure_renderer"),
+              "Análise geométrica da Mega-Sena"),
+        Stage("publicar_megasena", publish_megasena, [MEGASENA_ANALYSES], published_ms,
+              _src("pipeline_stages"), "Copia a análise para out/megasena/"),
+        Stage("combinada", combined, published_lf + published_ms, combined_out,
+              _src("combined_analysis"), "Análise combinada Mega-Sena + Lotofácil"),
+        Stage("mais_jogos", more_games, published_lf, ["out/jogos_otimizados_100.csv"],
+              _src("generate_more_games"), "100 jogos otimizados"),
+        Stage("backtesting", backtesting, draws + ["out/jogos_otimizados_combined.csv"], backtesting_out,
+              _src("backtesting", "hit_engine"), "Backtesting dos jogos otimizados"),
+        Stage("excel", excel,
+              combined_out[:1] + ["out/jogos_otimizados_100.csv"] + backtesting_out + published_lf + published_ms,
+              ["out/LOTOFACIL_ANALISE_COMPLETA.xlsx"],
+              _src("export_to_excel"), "Planilha com todas as análises"),
+    ]
@@ -0,0 +1,171 @@
+"""
+Módulo de busca exata do melhor pool de k números (16 a 21).
+Um pool contém um sorteio quando os 25 - k números excluídos do pool
+estão entre os 10 números que não saíram; em vez de testar os C(25, k)
+pools contra cada sorteio, cada sorteio soma um ponto a todos os
+conjuntos de excluídos compatíveis, o que dá a contagem exata de todos
+os pools de uma vez.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from math import comb
+from typing import Dict, Sequence
+
+from .bitmask import FULL_MASK, N_NUMBERS, NUMBER_BITS, mask_to_numbers, numbers_to_mask
+from .combinatorics import iter_index_masks, unrank_masks
+from .hit_engine import DrawsLike, _draw_masks
+from .probability import DRAW_SIZE
+
+POOL_SIZES = range(16, 22)
+
+# faixas de acerto do pool avaliadas (pelo menos h acertos)
+POOL_TIERS = (15, 14, 13)
+
+# critério de ordenação -> colunas em ordem de prioridade
+ORDERS = {
+    "15": ["jogos_15", "jogos_14+", "jogos_13+"],
+    "14": ["jogos_14+", "jogos_15", "jogos_13+"],
+    "13": ["jogos_13+", "jogos_14+", "jogos_15"],
+}
+
+# sorteios processados por bloco na contagem
+DEFAULT_DRAW_CHUNK = 256
+
+
+def _selectors(n: int, k: int) -> np.ndarray:
+    """Matriz (n, C(n, k)) 0/1 com os subconjuntos de k posições entre n."""
+    index_masks = np.concatenate(list(iter_index_masks(n, k)) or [np.empty(0, dtype=np.uint32)])
+    return ((index_masks[np.newaxis, :] >> np.arange(n, dtype=np.uint32)[:, np.newaxis]) & 1).astype(np.int64)
+
+
+def _subset_masks(number_bits: np.ndarray, k: int) -> np.ndarray:
+    """
+    Bitmasks de todos os subconjuntos de k números de cada linha.
+
+    number_bits é (M, n) com o bit de cada número; como os bits são
+    disjuntos, somar os bits selecionados equivale ao OU.
+    """
+    return number_bits @ _selectors(number_bits.shape[1], k)
+
+
+def pool_hit_counts(draws: DrawsLike, k: int, min_hits: int = POOL_TIERS[-1],
+                    chunk_draws: int = DEFAULT_DRAW_CHUNK) -> Dict[int, np.ndarray]:
+    """
+    Contagem exata de acertos de todos os pools de k números.
+
+    O pool com excluídos E acerta 15 - |E ∩ sorteio| números; com e = 25 - k
+    e os 10 ausentes A, isso é 15 - e + |E ∩ A|. Cada sorteio contribui para
+    os E formados por j ausentes e e - j sorteados (j >= e - (15 - min_hits)),
+    somados num contador indexado pelo bitmask de E.
+
+    Args:
+        draws: DrawStore ou array de bitmasks dos sorteios
+        k: Tamanho do pool
+        min_hits: Menor faixa contada (13 a 15)
+        chunk_draws: Sorteios por bloco
+
+    Returns:
+        Dicionário {h: array (C(25, k),) int64} com quantos sorteios têm
+        pelo menos h acertos, para h de 15 até min_hits, alinhado com
+        pool_complements(k)
+    """
+    excluded = N_NUMBERS - k
+    draw_masks = _draw_masks(draws)
+    complements = pool_complements(k)
+
+    shifts = np.arange(N_NUMBERS, dtype=np.uint32)
+    bits = NUMBER_BITS[1:].astype(np.int64)
+    exact: Dict[int, np.ndarray] = {}
+    for hits in range(DRAW_SIZE, min_hits - 1, -1):
+        missing_in = excluded - (DRAW_SIZE - hits)   # j = |E ∩ A|
+        drawn_in = excluded - missing_in              # |E ∩ sorteio|
+        if missing_in < 0 or drawn_in > DRAW_SIZE or missing_in > N_NUMBERS - DRAW_SIZE:
+            exact[hits] = np.zeros(complements.size, dtype=np.int64)
+            continue
+        # um contador denso por faixa (bitmask de E -> sorteios), somado bloco a bloco
+        dense = np.zeros(FULL_MASK + 1, dtype=np.int32)
+        for start in range(0, draw_masks.size, chunk_draws):
+            block = draw_masks[start:start + chunk_draws]
+            present = ((block[:, np.newaxis] >> shifts) & 1).astype(bool)
+            # bits dos 15 sorteados e dos 10 ausentes de cada sorteio, em ordem crescente
+            drawn_bits = np.broadcast_to(bits, present.shape)[present].reshape(-1, DRAW_SIZE)
+            missing_bits = np.broadcast_to(bits, present.shape)[~present].reshape(-1, N_NUMBERS - DRAW_SIZE)
+            sets = (_subset_masks(missing_bits, missing_in)[:, :, np.newaxis]
+                    | _subset_masks(drawn_bits, drawn_in)[:, np.newaxis, :])
+            values, counts = np.unique(sets.astype(np.uint32).ravel(), return_counts=True)
+            dense[values] += counts.astype(np.int32)
+        exact[hits] = dense[complements].astype(np.int64)
+        del dense
+
+    counts, running = {}, np.zeros(complements.size, dtype=np.int64)
+    for hits in range(DRAW_SIZE, min_hits - 1, -1):
+        running = running + exact[hits]
+        counts[hits] = running
+    return counts
+
+
+def pool_complements(k: int) -> np.ndarray:
+    """
+    Bitmasks dos números excluídos de cada pool de k números.
+
+    Args:
+        k: Tamanho do pool
+
+    Returns:
+        Array (C(25, k),) uint32 em ordem colexicográfica
+    """
+    excluded = N_NUMBERS - k
+    return unrank_masks(np.arange(comb(N_NUMBERS, excluded)), excluded)
+
+
+def search_pools(draws: DrawsLike, k: int, top: int = 10, include: Sequence[int] = (),
+                 exclude: Sequence[int] = (), order: str = "15",
+                 chunk_draws: int = DEFAULT_DRAW_CHUNK) -> pd.DataFrame:
+    """
+    Melhores pools de k números entre todos os C(25, k), com restrições.
+
+    Args:
+        draws: DrawStore ou array de bitmasks dos sorteios
+        k: Tamanho do pool (16 a 21)
+        top: Quantidade de pools retornados
+        include: Números que precisam estar no pool
+        exclude: Números que precisam ficar fora do pool
+        order: Critério principal: "15" (sorteios cobertos), "14" (14+) ou "13" (13+);
+               empates são desfeitos pelas outras faixas
+        chunk_draws: Sorteios por bloco na contagem
+
+    Returns:
+        DataFrame com pool, excluidos, jogos_15, jogos_14+ e jogos_13+,
+        do melhor para o pior
+
+    Raises:
+        ValueError: Se k, order ou as restrições forem inválidos
+    """
+    if k not in POOL_SIZES:
+        raise ValueError(f"Tamanho de pool deve estar entre {POOL_SIZES[0]} e {POOL_SIZES[-1]}: {k}")
+    if order not in ORDERS:
+        raise ValueError(f"Ordem desconhecida: {order} (use {', '.join(ORDERS)})")
+    include_mask, exclude_mask = numbers_to_mask(include), numbers_to_mask(exclude)
+    if include_mask & exclude_mask:
+        raise ValueError("Número ao mesmo tempo obrigatório e proibido: "
+                         f"{mask_to_numbers(include_mask & exclude_mask)}")
+    if len(mask_to_numbers(include_mask)) > k or len(mask_to_numbers(exclude_mask)) > N_NUMBERS - k:
+        raise ValueError(f"Restrições incompatíveis com um pool de {k} números")
+
+    counts = pool_hit_counts(draws, k, POOL_TIERS[-1], chunk_draws)
+    complements = pool_complements(k)
+    allowed = ((complements & include_mask) == 0) & ((complements & exclude_mask) == exclude_mask)
+
+    frame = pd.DataFrame({
+        'mask': FULL_MASK ^ complements[allowed],
+        'jogos_15': counts[15][allowed],
+        'jogos_14+': counts[14][allowed],
+        'jogos_13+': counts[13][allowed],
+    })
+    keys = ORDERS[order]
+    frame = frame.sort_values(keys + ['mask'], ascending=[False] * len(keys) + [True]).head(top)
+    frame.insert(0, 'pool', [mask_to_numbers(int(m)) for m in frame['mask']])
+    frame.insert(1, 'excluidos', [mask_to_numbers(FULL_MASK ^ int(m)) for m in frame['mask']])
+    return frame.drop(columns='mask').reset_index(drop=True)
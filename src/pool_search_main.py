@@ -0,0 +1,75 @@
+"""
+Script de busca exata do melhor pool de 16 a 21 números.
+
+Avalia todos os C(25, k) pools contra o histórico (sem partir dos mais
+frequentes), com números obrigatórios e proibidos opcionais.
+
+Exemplos:
+    python src/pool_search_main.py --tamanho 18
+    python src/pool_search_main.py --tamanho 19 --incluir 13 21 --ordem 14
+    python src/pool_search_main.py --tamanho 19 --incluir 21 --excluir 10 22 --top 20
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from math import comb
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import DEFAULT_DRAWS_PATH, load_draw_store
+from src.pool_search import ORDERS, POOL_SIZES, search_pools
+
+
+def main(argv=None):
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Busca exata do melhor pool da Lotofácil")
+    parser.add_argument("--draws", default=DEFAULT_DRAWS_PATH, help="CSV de sorteios")
+    parser.add_argument("--tamanho", type=int, nargs="+", default=[18],
+                        help=f"Tamanhos de pool ({POOL_SIZES[0]} a {POOL_SIZES[-1]})")
+    parser.add_argument("--incluir", type=int, nargs="*", default=[], help="Números obrigatórios")
+    parser.add_argument("--excluir", type=int, nargs="*", default=[], help="Números proibidos")
+    parser.add_argument("--ordem", choices=list(ORDERS), default="15",
+                        help="Critério principal: 15, 14 (14+) ou 13 (13+)")
+    parser.add_argument("--top", type=int, default=10, help="Pools listados")
+    parser.add_argument("--out", default="out/pools", help="Diretório de saída")
+    args = parser.parse_args(argv)
+
+    store = load_draw_store(args.draws)
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+
+    for k in args.tamanho:
+        print("=" * 80)
+        print(f"🔎 MELHORES POOLS DE {k} NÚMEROS ({comb(25, k):,} pools, {len(store):,} sorteios)")
+        print("=" * 80)
+        if args.incluir:
+            print(f"   Obrigatórios: {sorted(args.incluir)}")
+        if args.excluir:
+            print(f"   Proibidos: {sorted(args.excluir)}")
+
+        try:
+            best = search_pools(store, k, top=args.top, include=args.incluir,
+                                exclude=args.excluir, order=args.ordem)
+        except ValueError as exc:
+            print(f"\n❌ {exc}\n")
+            continue
+
+        print(f"\n{'#':>3} | {'15':>4} | {'14+':>5} | {'13+':>5} | Excluídos")
+        print("-" * 80)
+        for i, row in best.iterrows():
+            print(f"{i + 1:3d} | {row['jogos_15']:4d} | {row['jogos_14+']:5d} | "
+                  f"{row['jogos_13+']:5d} | {row['excluidos']}")
+        if not best.empty:
+            print(f"\n🏆 Melhor pool: {best.iloc[0]['pool']}\n")
+
+        path = out / f"melhores_pools_{k}.csv"
+        best.assign(pool=best['pool'].map(lambda p: ','.join(map(str, p))),
+                    excluidos=best['excluidos'].map(lambda p: ','.join(map(str, p)))).to_csv(path, index=False)
+        print(f"💾 Salvo em: {path}\n")
+
+
+if __name__ == "__main__":
+    main()
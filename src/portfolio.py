@@ -0,0 +1,210 @@
+"""
+Módulo de otimização de portfólio de apostas sob orçamento.
+Escolhe quais apostas jogar entre milhares de candidatas, maximizando o
+valor do conjunto contra o histórico: a matriz apostas × sorteios é
+calculada uma vez, cada troca é avaliada de forma incremental e a busca
+usa simulated annealing com lista tabu.
+"""
+from __future__ import annotations
+
+import numpy as np
+from typing import Dict
+
+from .hit_engine import MAX_HITS, PRIZE_TIERS
+
+# valor de cada faixa no objetivo de cobertura (mesmos pesos do score de
+# test_all_strategies: 15=100, 14=20, 13=5, 12=2, 11=1)
+SCORE_WEIGHTS = {11: 1, 12: 2, 13: 5, 14: 20, 15: 100}
+
+OBJECTIVES = ("cobertura", "premio")
+
+
+def ticket_values(hits: np.ndarray, objective: str = "cobertura",
+                  prizes: np.ndarray | None = None,
+                  weights: Dict[int, float] = SCORE_WEIGHTS) -> np.ndarray:
+    """
+    Valor de cada aposta jogada sozinha contra o histórico.
+
+    Args:
+        hits: Matriz (N, M) uint8 de acertos (ver hit_engine.hit_matrix)
+        objective: "cobertura" (pesos por faixa) ou "premio" (rateios pagos)
+        prizes: Array (M, 16) de rateios por sorteio (ver universe.load_prize_table),
+                obrigatório para "premio"
+        weights: Valor por faixa no objetivo "cobertura"
+
+    Returns:
+        Array (N,) float64
+    """
+    if objective == "premio":
+        if prizes is None:
+            raise ValueError("Objetivo 'premio' exige a tabela de rateios")
+        return prizes[np.arange(hits.shape[1]), hits].sum(axis=1)
+    table = np.zeros(MAX_HITS + 1, dtype=np.float64)
+    for tier, weight in weights.items():
+        table[tier] = weight
+    return table[hits].sum(axis=1)
+
+
+class _Coverage:
+    """
+    Estado incremental do objetivo de cobertura.
+
+    O valor do portfólio é a soma, por sorteio, do peso do melhor acerto
+    entre as apostas escolhidas. Decompondo o peso em degraus por faixa,
+    basta manter quantas apostas escolhidas atingem cada faixa em cada
+    sorteio para avaliar uma troca em O(faixas × sorteios).
+    """
+
+    def __init__(self, hits: np.ndarray, weights: Dict[int, float]):
+        tiers = sorted(t for t in weights if weights[t])
+        cumulative = np.array([weights[t] for t in tiers], dtype=np.float64)
+        self.steps = np.diff(cumulative, prepend=0.0)
+        # nível de cada (aposta, sorteio) = quantas faixas o acerto atinge
+        lut = np.array([sum(h >= t for t in tiers) for h in range(MAX_HITS + 1)], dtype=np.uint8)
+        self.levels = lut[hits]
+        self.tier_range = np.arange(len(tiers), dtype=np.uint8)[:, np.newaxis]
+        self.counts = np.zeros((len(tiers), hits.shape[1]), dtype=np.int32)
+
+    def reaches(self, i: int) -> np.ndarray:
+        return self.levels[i][np.newaxis, :] > self.tier_range
+
+    def add(self, i: int, sign: int = 1) -> None:
+        self.counts += sign * self.reaches(i)
+
+    def value(self) -> float:
+        return float(self.steps @ (self.counts > 0).sum(axis=1))
+
+    def delta(self, out: int, into: int) -> float:
+        r_out, r_in = self.reaches(out), self.reaches(into)
+        gain = (r_in & ~r_out & (self.counts == 0)).sum(axis=1)
+        loss = (r_out & ~r_in & (self.counts == 1)).sum(axis=1)
+        return float(self.steps @ (gain - loss))
+
+
+class _Additive:
+    """Objetivo somado aposta a aposta (ex.: total de rateios)."""
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        self.total = 0.0
+
+    def add(self, i: int, sign: int = 1) -> None:
+        self.total += sign * self.values[i]
+
+    def value(self) -> float:
+        return self.total
+
+    def delta(self, out: int, into: int) -> float:
+        return float(self.values[into] - self.values[out])
+
+
+def optimize_portfolio(hits: np.ndarray, n_tickets: int, objective: str = "cobertura",
+                       prizes: np.ndarray | None = None,
+                       weights: Dict[int, float] = SCORE_WEIGHTS,
+                       iterations: int = 20000, tabu_tenure: int | None = None,
+                       start_temperature: float | None = None, seed: int = 0) -> dict:
+    """
+    Seleciona n_tickets apostas maximizando o valor do portfólio no histórico.
+
+    Parte das apostas de maior valor individual e melhora o conjunto com
+    trocas (uma sai, outra entra) aceitas por simulated annealing; apostas
+    que acabaram de sair ficam tabu por algumas iterações. No objetivo
+    "premio" o valor é aditivo e o ponto de partida já é ótimo, mas no de
+    "cobertura" apostas sobrepostas não somam, e a busca troca apostas
+    redundantes por outras que cobrem sorteios ainda descobertos.
+
+    Args:
+        hits: Matriz (N, M) uint8 de acertos das candidatas
+        n_tickets: Apostas que cabem no orçamento
+        objective: "cobertura" ou "premio" (ver ticket_values)
+        prizes: Tabela (M, 16) de rateios, obrigatória para "premio"
+        weights: Valor por faixa no objetivo "cobertura"
+        iterations: Trocas avaliadas
+        tabu_tenure: Iterações em que uma aposta removida não pode voltar
+                     (padrão: ~1/4 das candidatas não escolhidas, até 50)
+        start_temperature: Temperatura inicial (padrão: estimada pelas trocas)
+        seed: Semente da busca
+
+    Returns:
+        Dicionário com:
+        - indices: array das apostas escolhidas, em ordem decrescente de valor individual
+        - valor: valor do portfólio
+        - valor_inicial: valor do ponto de partida
+        - trocas_aceitas: trocas aceitas durante a busca
+
+    Raises:
+        ValueError: Se o objetivo for desconhecido
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Objetivo desconhecido: {objective} (use {', '.join(OBJECTIVES)})")
+    n_candidates = hits.shape[0]
+    n_tickets = min(n_tickets, n_candidates)
+    rng = np.random.default_rng(seed)
+
+    single = ticket_values(hits, objective, prizes, weights)
+    # maior valor individual primeiro; empates pela posição da candidata
+    ranking = np.lexsort((np.arange(n_candidates), -single))
+    selected = ranking[:n_tickets].copy()
+    outside = ranking[n_tickets:].copy()
+
+    state = _Additive(single) if objective == "premio" else _Coverage(hits, weights)
+    for i in selected:
+        state.add(int(i))
+    value = start_value = state.value()
+    best_value, best = value, selected.copy()
+
+    accepted = 0
+    if outside.size and n_tickets and objective == "cobertura":
+        tenure = tabu_tenure if tabu_tenure is not None else min(50, outside.size // 4)
+        tabu_until = np.zeros(n_candidates, dtype=np.int64)
+        if start_temperature is None:
+            sample = [abs(state.delta(int(selected[rng.integers(n_tickets)]),
+                                      int(outside[rng.integers(outside.size)])))
+                      for _ in range(min(200, iterations))]
+            start_temperature = max(np.mean(sample), 1e-9) if sample else 1.0
+        end_temperature = start_temperature * 1e-3
+
+        for it in range(iterations):
+            temperature = start_temperature * (end_temperature / start_temperature) ** (it / iterations)
+            a = int(rng.integers(n_tickets))
+            b = int(rng.integers(outside.size))
+            i, j = int(selected[a]), int(outside[b])
+            if tabu_until[j] > it:
+                continue
+            d = state.delta(i, j)
+            if d >= 0 or rng.random() < np.exp(d / temperature):
+                state.add(i, -1)
+                state.add(j)
+                selected[a], outside[b] = j, i
+                tabu_until[i] = it + tenure
+                value += d
+                accepted += 1
+                if value > best_value:
+                    best_value, best = value, selected.copy()
+
+    best = best[np.lexsort((best, -single[best]))]
+    return {
+        'indices': best,
+        'valor': float(best_value),
+        'valor_inicial': float(start_value),
+        'trocas_aceitas': accepted,
+    }
+
+
+def portfolio_summary(hits: np.ndarray, indices: np.ndarray) -> Dict[str, object]:
+    """
+    Cobertura do histórico pelo portfólio escolhido.
+
+    Args:
+        hits: Matriz (N, M) de acertos das candidatas
+        indices: Apostas escolhidas
+
+    Returns:
+        Dicionário com o melhor acerto por sorteio (melhor_acertos (M,)) e,
+        para cada faixa, sorteios em que o portfólio a atingiu (sorteios_11+ ...)
+    """
+    best = hits[indices].max(axis=0) if len(indices) else np.zeros(hits.shape[1], dtype=np.uint8)
+    summary = {'melhor_acertos': best}
+    for tier in PRIZE_TIERS:
+        summary[f'sorteios_{tier}+'] = int((best >= tier).sum())
+    return summary
@@ -0,0 +1,221 @@
+"""
+Módulo de índice de somas de prefixo sobre o histórico de sorteios.
+Guarda contagens acumuladas de cada número e de cada par, de modo que a
+frequência em qualquer intervalo de sorteios seja uma subtração O(1).
+"""
+from __future__ import annotations
+
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+from .bitmask import N_NUMBERS, masks_to_incidence
+from .io_data import DEFAULT_DRAWS_PATH, DrawStore, load_draw_store
+
+# posição de cada par (a < b) nas colunas de pair_cum; -1 fora do triângulo
+_PAIR_A, _PAIR_B = np.triu_indices(N_NUMBERS, k=1)
+PAIR_INDEX = np.full((N_NUMBERS + 1, N_NUMBERS + 1), -1, dtype=np.int64)
+PAIR_INDEX[_PAIR_A + 1, _PAIR_B + 1] = np.arange(_PAIR_A.size)
+PAIR_INDEX[_PAIR_B + 1, _PAIR_A + 1] = np.arange(_PAIR_A.size)
+
+
+@dataclass(frozen=True)
+class FrequencyIndex:
+    """
+    Contagens acumuladas por número e por par ao longo do histórico.
+
+    number_cum[i, n] = vezes que o número n saiu nos sorteios [0, i), e
+    pair_cum[i, p] = vezes que o par p saiu junto nos sorteios [0, i).
+    Com ~3.600 sorteios ocupa ~5 MB.
+
+    Atributos:
+        number_cum: Array (M+1, 26) int32 (coluna 0 não é usada)
+        pair_cum: Array (M+1, 300) int32 (colunas na ordem de PAIR_INDEX)
+        contests: Array (M,) com o número do concurso de cada posição
+    """
+    number_cum: np.ndarray
+    pair_cum: np.ndarray
+    contests: np.ndarray
+
+    def __post_init__(self):
+        for arr in (self.number_cum, self.pair_cum, self.contests):
+            arr.flags.writeable = False
+
+    @classmethod
+    def from_store(cls, store: DrawStore) -> "FrequencyIndex":
+        """
+        Constrói o índice a partir de um DrawStore.
+
+        Args:
+            store: Histórico de sorteios
+
+        Returns:
+            Índice com uma linha de prefixo por sorteio (mais a linha zero)
+        """
+        incidence = masks_to_incidence(store.masks)
+        n_draws = incidence.shape[0]
+
+        number_cum = np.zeros((n_draws + 1, N_NUMBERS + 1), dtype=np.int32)
+        np.cumsum(incidence, axis=0, dtype=np.int32, out=number_cum[1:, 1:])
+
+        pairs = incidence[:, _PAIR_A] & incidence[:, _PAIR_B]
+        pair_cum = np.zeros((n_draws + 1, _PAIR_A.size), dtype=np.int32)
+        np.cumsum(pairs, axis=0, dtype=np.int32, out=pair_cum[1:])
+
+        return cls(number_cum, pair_cum, np.asarray(store.contests).copy())
+
+    def __len__(self) -> int:
+        return int(self.number_cum.shape[0] - 1)
+
+    def _bounds(self, start: int | None, stop: int | None) -> Tuple[int, int]:
+        """Normaliza (start, stop) como em slices Python."""
+        return slice(start, stop).indices(len(self))[:2]
+
+    def counts(self, start: int | None = None, stop: int | None = None) -> np.ndarray:
+        """
+        Frequência de cada número nos sorteios [start, stop) (por posição).
+
+        Args:
+            start: Posição inicial (inclusiva; negativos contam do fim)
+            stop: Posição final (exclusiva)
+
+        Returns:
+            Array (26,) int com a frequência de cada número (índice 0 não usado)
+        """
+        start, stop = self._bounds(start, stop)
+        return (self.number_cum[stop] - self.number_cum[start]).astype(int)
+
+    def count(self, number: int, start: int | None = None, stop: int | None = None) -> int:
+        """
+        Frequência de um número nos sorteios [start, stop).
+
+        Args:
+            number: Número de 1 a 25
+            start: Posição inicial (inclusiva)
+            stop: Posição final (exclusiva)
+
+        Returns:
+            Quantidade de sorteios em que o número saiu
+        """
+        start, stop = self._bounds(start, stop)
+        return int(self.number_cum[stop, number] - self.number_cum[start, number])
+
+    def pair_count(self, a: int, b: int, start: int | None = None, stop: int | None = None) -> int:
+        """
+        Quantas vezes os números a e b saíram juntos nos sorteios [start, stop).
+
+        Args:
+            a: Primeiro número
+            b: Segundo número (diferente de a)
+            start: Posição inicial (inclusiva)
+            stop: Posição final (exclusiva)
+
+        Returns:
+            Quantidade de sorteios com os dois números
+        """
+        p = PAIR_INDEX[a, b]
+        if p < 0:
+            raise ValueError(f"Par inválido: ({a}, {b})")
+        start, stop = self._bounds(start, stop)
+        return int(self.pair_cum[stop, p] - self.pair_cum[start, p])
+
+    def pair_matrix(self, start: int | None = None, stop: int | None = None) -> np.ndarray:
+        """
+        Matriz de co-ocorrência dos sorteios [start, stop).
+
+        Args:
+            start: Posição inicial (inclusiva)
+            stop: Posição final (exclusiva)
+
+        Returns:
+            Matriz (26, 26) no formato de cooccurrence.cooccurrence_matrix
+        """
+        start, stop = self._bounds(start, stop)
+        counts = self.pair_cum[stop] - self.pair_cum[start]
+        mat = np.zeros((N_NUMBERS + 1, N_NUMBERS + 1), dtype=int)
+        mat[_PAIR_A + 1, _PAIR_B + 1] = counts
+        mat[_PAIR_B + 1, _PAIR_A + 1] = counts
+        return mat
+
+    def last(self, n: int) -> np.ndarray:
+        """
+        Frequência de cada número nos últimos N sorteios.
+
+        Args:
+            n: Quantidade de sorteios
+
+        Returns:
+            Array (26,) int (índice 0 não usado)
+        """
+        return self.counts(max(len(self) - n, 0), None)
+
+    def draw_hits(self, numbers, start: int | None = None, stop: int | None = None) -> np.ndarray:
+        """
+        Quantos dos números dados saíram em cada sorteio de [start, stop).
+
+        Soma as colunas de prefixo dos números e tira a diferença entre
+        linhas consecutivas, sem voltar aos sorteios.
+
+        Args:
+            numbers: Números do pool/aposta
+            start: Posição inicial (inclusiva)
+            stop: Posição final (exclusiva)
+
+        Returns:
+            Array (stop - start,) int com os acertos por sorteio
+        """
+        start, stop = self._bounds(start, stop)
+        cols = np.asarray(sorted(set(numbers)), dtype=np.int64)
+        totals = self.number_cum[start:stop + 1, cols].sum(axis=1)
+        return np.diff(totals).astype(int)
+
+    def window_counts(self, window: int, step: int, start: int = 0,
+                      stop: int | None = None) -> np.ndarray:
+        """
+        Frequências em janelas deslizantes [s, s + window).
+
+        As janelas começam em range(start, stop - window, step), como nos
+        laços de janela móvel das análises de tendência.
+
+        Args:
+            window: Tamanho de cada janela (em sorteios)
+            step: Deslocamento entre janelas
+            start: Posição da primeira janela
+            stop: Fim do histórico considerado (padrão: todos os sorteios)
+
+        Returns:
+            Array (W, 26) int com a frequência de cada número em cada janela
+        """
+        stop = len(self) if stop is None else stop
+        starts = np.arange(start, stop - window, step)
+        return (self.number_cum[starts + window] - self.number_cum[starts]).astype(int)
+
+    def contest_range(self, first: int, last: int) -> Tuple[int, int]:
+        """
+        Converte um intervalo de concursos em posições [start, stop).
+
+        Args:
+            first: Primeiro concurso (inclusivo)
+            last: Último concurso (inclusivo)
+
+        Returns:
+            Tupla (start, stop) para usar em counts/pair_count/pair_matrix
+        """
+        start = int(np.searchsorted(self.contests, first, side='left'))
+        stop = int(np.searchsorted(self.contests, last, side='right'))
+        return start, stop
+
+
+@lru_cache(maxsize=None)
+def load_frequency_index(path: str = DEFAULT_DRAWS_PATH) -> FrequencyIndex:
+    """
+    Índice de prefixos do histórico, construído uma vez por caminho.
+
+    Args:
+        path: Caminho do arquivo CSV
+
+    Returns:
+        FrequencyIndex do arquivo
+    """
+    return FrequencyIndex.from_store(load_draw_store(path))
@@ -0,0 +1,138 @@
+"""
+Módulo de probabilidades exatas da Lotofácil (distribuição hipergeométrica).
+Substitui a simulação de jogos aleatórios como linha de base: para uma
+aposta (ou pool) de k números, a quantidade de acertos entre os 15
+sorteados segue Hipergeométrica(25, k, 15) e tem forma fechada.
+"""
+from __future__ import annotations
+
+import numpy as np
+from functools import lru_cache
+from math import comb
+from typing import Dict
+
+from .bitmask import N_NUMBERS
+from .hit_engine import MAX_HITS, PRIZE_TIERS
+
+# números sorteados por concurso
+DRAW_SIZE = 15
+# tamanhos de aposta aceitos pela Lotofácil
+MIN_BET_SIZE = 15
+MAX_BET_SIZE = 20
+
+
+def _check_size(size: int) -> None:
+    if not 0 <= size <= N_NUMBERS:
+        raise ValueError(f"Tamanho deve estar entre 0 e {N_NUMBERS}, recebido {size}")
+
+
+@lru_cache(maxsize=None)
+def hit_probabilities(size: int = DRAW_SIZE) -> np.ndarray:
+    """
+    Distribuição exata de acertos de uma aposta/pool de `size` números.
+
+    P(h) = C(size, h) * C(25 - size, 15 - h) / C(25, 15)
+
+    Args:
+        size: Quantidade de números da aposta ou do pool (0 a 25)
+
+    Returns:
+        Array (16,) float64 somente leitura com P(acertos = h), h = 0..15
+
+    Raises:
+        ValueError: Se size estiver fora de 0..25
+    """
+    _check_size(size)
+    total = comb(N_NUMBERS, DRAW_SIZE)
+    probs = np.array([comb(size, h) * comb(N_NUMBERS - size, DRAW_SIZE - h) / total
+                      for h in range(MAX_HITS + 1)], dtype=np.float64)
+    probs.flags.writeable = False
+    return probs
+
+
+def at_least_probability(size: int, min_hits: int) -> float:
+    """
+    Probabilidade de pelo menos `min_hits` dos sorteados caírem no pool.
+
+    Responde perguntas de garantia do tipo "qual a chance de um pool de 18
+    números conter 14 ou mais dos 15 sorteados?".
+
+    Args:
+        size: Quantidade de números do pool
+        min_hits: Acertos mínimos
+
+    Returns:
+        P(acertos >= min_hits)
+    """
+    return float(hit_probabilities(size)[max(min_hits, 0):].sum())
+
+
+def expected_hits(size: int = DRAW_SIZE) -> float:
+    """
+    Média de acertos de uma aposta aleatória de `size` números (15 * size / 25).
+
+    Args:
+        size: Quantidade de números da aposta
+
+    Returns:
+        Acertos esperados por sorteio
+    """
+    _check_size(size)
+    return DRAW_SIZE * size / N_NUMBERS
+
+
+@lru_cache(maxsize=None)
+def expected_prizes(bet_size: int = DRAW_SIZE) -> Dict[int, float]:
+    """
+    Prêmios esperados por sorteio de uma aposta de 15 a 20 números.
+
+    Uma aposta de k números equivale às C(k, 15) apostas simples; com h
+    acertos, C(h, t) * C(k - h, 15 - t) delas fazem exatamente t pontos.
+
+    Args:
+        bet_size: Quantidade de números da aposta
+
+    Returns:
+        Dicionário faixa (11..15) -> quantidade esperada de prêmios por sorteio
+
+    Raises:
+        ValueError: Se bet_size estiver fora de 15..20
+    """
+    if not MIN_BET_SIZE <= bet_size <= MAX_BET_SIZE:
+        raise ValueError(f"Aposta deve ter de {MIN_BET_SIZE} a {MAX_BET_SIZE} números, "
+                         f"recebido {bet_size}")
+    probs = hit_probabilities(bet_size)
+    return {tier: float(sum(probs[h] * comb(h, tier) * comb(bet_size - h, DRAW_SIZE - tier)
+                            for h in range(tier, MAX_HITS + 1)))
+            for tier in PRIZE_TIERS}
+
+
+def random_baseline(bet_size: int = DRAW_SIZE) -> Dict[str, float]:
+    """
+    Linha de base exata de jogos aleatórios de `bet_size` números.
+
+    Traz as mesmas estatísticas de MonteCarloSimulator.monte_carlo_random
+    (média, desvio e probabilidade de cada faixa de acertos), sem erro de
+    amostragem.
+
+    Args:
+        bet_size: Quantidade de números por jogo
+
+    Returns:
+        Dicionário com as estatísticas
+    """
+    probs = hit_probabilities(bet_size)
+    hits = np.arange(probs.size)
+    mean = expected_hits(bet_size)
+    possible = np.nonzero(probs)[0]
+    baseline = {
+        'numeros_por_jogo': bet_size,
+        'media_acertos': mean,
+        'desvio_acertos': float(np.sqrt((probs * (hits - mean) ** 2).sum())),
+        'min_acertos': int(possible[0]),
+        'max_acertos': int(possible[-1]),
+    }
+    for tier in PRIZE_TIERS:
+        baseline[f'prob_{tier}_acertos_%'] = float(probs[tier]) * 100
+    baseline['prob_qualquer_premio_%'] = at_least_probability(bet_size, PRIZE_TIERS[0]) * 100
+    return baseline
@@ -14,6 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.io_data import load_draws_csv
 from src.game_generator import LotofacilGameGenerator
 from src.monte_carlo import MonteCarloSimulator
+from src.probability import random_baseline
+from src.hit_engine import PRIZE_TIERS
 
 
 def main():
@@ -90,27 +92,24 @@ def main():
     print(best_games.to_string(index=False))
     best_games.to_csv("out/melhores_jogos.csv", index=False)
     
-    # 9. Monte Carlo puro (jogos aleatórios)
+    # 9. Linha de base exata (jogos aleatórios)
     print("\n" + "="*80)
-    print("🎲 SIMULAÇÃO MONTE CARLO PURA (10.000 JOGOS ALEATÓRIOS)")
+    print("🎲 LINHA DE BASE EXATA (JOGOS ALEATÓRIOS DE 15 NÚMEROS)")
     print("="*80)
-    mc_stats = simulator.monte_carlo_random(n_simulations=10000, n_numbers=15)
-    
-    print(f"\n📊 ESTATÍSTICAS:")
-    print(f"   Média de acertos: {mc_stats['media_acertos']:.2f} ± {mc_stats['desvio_acertos']:.2f}")
-    print(f"   Min-Max acertos: {mc_stats['min_acertos']} - {mc_stats['max_acertos']}")
-    print(f"\n🎁 PRÊMIOS (em {mc_stats['n_simulacoes']:,} simulações):")
-    print(f"   11 acertos: {mc_stats['premios_11']:,} ({mc_stats['prob_11_acertos_%']:.3f}%)")
-    print(f"   12 acertos: {mc_stats['premios_12']:,} ({mc_stats['prob_12_acertos_%']:.3f}%)")
-    print(f"   13 acertos: {mc_stats['premios_13']:,} ({mc_stats['prob_13_acertos_%']:.3f}%)")
-    print(f"   14 acertos: {mc_stats['premios_14']:,} ({mc_stats['prob_14_acertos_%']:.4f}%)")
-    print(f"   15 acertos: {mc_stats['premios_15']:,} ({mc_stats['prob_15_acertos_%']:.6f}%)")
-    print(f"\n   TOTAL de prêmios: {mc_stats['total_premios']:,}")
-    print(f"   Probabilidade de ganhar algo: {mc_stats['prob_qualquer_premio_%']:.3f}%")
-    
-    # Salva estatísticas Monte Carlo
-    with open("out/monte_carlo_stats.json", "w", encoding="utf-8") as f:
-        json.dump(mc_stats, f, ensure_ascii=False, indent=2)
+    baseline = random_baseline(15)
+    
+    print(f"\n📊 ESTATÍSTICAS (distribuição hipergeométrica):")
+    print(f"   Média de acertos: {baseline['media_acertos']:.2f} ± {baseline['desvio_acertos']:.2f}")
+    print(f"   Min-Max acertos: {baseline['min_acertos']} - {baseline['max_acertos']}")
+    print(f"\n🎁 PROBABILIDADE POR SORTEIO:")
+    for tier in PRIZE_TIERS:
+        prob = baseline[f'prob_{tier}_acertos_%']
+        print(f"   {tier} acertos: {prob:.6f}% (1 em {100 / prob:,.0f})")
+    print(f"\n   Probabilidade de ganhar algo: {baseline['prob_qualquer_premio_%']:.3f}%")
+    
+    # Salva linha de base
+    with open("out/baseline_aleatorio.json", "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
     
     # 10. Relatório final
     print("\n" + "="*80)
@@ -127,9 +126,9 @@ def main():
     print(f"   Taxa de prêmio: {comparison.iloc[0]['taxa_premio_%']:.2f}%")
     
     print(f"\n📊 Comparado com jogos aleatórios:")
-    print(f"   Aleatório: {mc_stats['media_acertos']:.2f} acertos")
+    print(f"   Aleatório (exato): {comparison.iloc[0]['media_esperada']:.2f} acertos")
     print(f"   Melhor estratégia: {best_avg:.2f} acertos")
-    print(f"   Ganho: {best_avg - mc_stats['media_acertos']:+.2f} acertos")
+    print(f"   Ganho: {comparison.iloc[0]['ganho_acertos']:+.2f} acertos")
     
     print("\n" + "="*80)
     print("✅ SIMULAÇÃO CONCLUÍDA!")
@@ -139,7 +138,7 @@ def main():
     print(f"   - resultados_estrategias.csv")
     print(f"   - comparacao_estrategias.csv")
     print(f"   - melhores_jogos.csv")
-    print(f"   - monte_carlo_stats.json")
+    print(f"   - baseline_aleatorio.json")
 
 
 if __name__ == "__main__":
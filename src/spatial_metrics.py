@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
-from typing import List
-from .grid_mapping import build_number_coord_map, GridSpec
+from typing import Dict, List
+from .bitmask import masks_to_numbers_array, popcount
+from .grid_mapping import GridSpec, grid_tables
 
 
 def manhattan(a: np.ndarray, b: np.ndarray) -> int:
@@ -24,6 +25,74 @@ def manhattan(a: np.ndarray, b: np.ndarray) -> int:
     return int(abs(a[0] - b[0]) + abs(a[1] - b[1]))
 
 
+# colunas de spatial_metrics, na ordem de draw_spatial_metrics
+METRIC_COLUMNS = [
+    "mean_to_centroid", "max_to_centroid", "mean_pair_dist",
+    "max_pair_dist", "edge_count", "center_count",
+]
+
+# linhas por bloco em spatial_metrics (limita o tensor de pares em memória)
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def spatial_metrics(bets, spec: GridSpec = GridSpec(),
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, np.ndarray]:
+    """
+    Calcula as métricas espaciais de muitos jogos de uma vez.
+
+    Os jogos são mapeados para um tensor de coordenadas (M, k, 2) e todas as
+    métricas saem por broadcasting, em blocos de chunk_size jogos. Serve
+    tanto para o histórico quanto para milhões de candidatos gerados.
+
+    Args:
+        bets: Array (M, k) de números ou array 1-D de bitmasks (ver bitmask)
+        spec: Especificação do grid
+        chunk_size: Jogos por bloco
+
+    Returns:
+        Dicionário coluna -> array (M,) com as colunas de METRIC_COLUMNS
+    """
+    bets = np.asarray(bets)
+    if bets.ndim == 1:
+        k = int(popcount(bets[:1])[0]) if bets.size else 0
+        bets = masks_to_numbers_array(bets, k)
+    n_bets, k = bets.shape
+
+    table = grid_tables(spec).coords
+    pair_i, pair_j = np.triu_indices(k, k=1)
+    out = {
+        "mean_to_centroid": np.empty(n_bets, dtype=np.float64),
+        "max_to_centroid": np.empty(n_bets, dtype=np.float64),
+        "mean_pair_dist": np.empty(n_bets, dtype=np.float64),
+        "max_pair_dist": np.empty(n_bets, dtype=np.float64),
+        "edge_count": np.empty(n_bets, dtype=np.int64),
+        "center_count": np.empty(n_bets, dtype=np.int64),
+    }
+
+    for start in range(0, n_bets, chunk_size):
+        stop = min(start + chunk_size, n_bets)
+        coords = table[bets[start:stop].astype(np.intp)]  # (B, k, 2)
+
+        # centroide (média) e dispersão
+        centroid = coords.mean(axis=1, keepdims=True)
+        dists_to_centroid = np.abs(coords - centroid).sum(axis=2)  # manhattan para centroid "real"
+        out["mean_to_centroid"][start:stop] = dists_to_centroid.mean(axis=1)
+        out["max_to_centroid"][start:stop] = dists_to_centroid.max(axis=1)
+
+        # distância de Manhattan entre todos os pares
+        pair_dists = np.abs(coords[:, pair_i] - coords[:, pair_j]).sum(axis=2)
+        out["mean_pair_dist"][start:stop] = pair_dists.mean(axis=1)
+        out["max_pair_dist"][start:stop] = pair_dists.max(axis=1)
+
+        # bias borda/centro: borda = r=0/4 ou c=0/4
+        edge = ((coords[:, :, 0] == 0) | (coords[:, :, 0] == spec.rows - 1) |
+                (coords[:, :, 1] == 0) | (coords[:, :, 1] == spec.cols - 1)).sum(axis=1)
+        out["edge_count"][start:stop] = edge
+        out["center_count"][start:stop] = k - edge
+
+    return out
+
+
 def draw_spatial_metrics(df: pd.DataFrame, ball_cols: List[str], spec: GridSpec = GridSpec()) -> pd.DataFrame:
     """
     Calcula métricas espaciais para cada sorteio.
@@ -49,40 +118,8 @@ def draw_spatial_metrics(df: pd.DataFrame, ball_cols: List[str], spec: GridSpec
         - edge_count: quantidade de números nas bordas
         - center_count: quantidade de números no centro
     """
-    n2c = build_number_coord_map(spec)
-
-    rows = []
-    for idx, row in df.iterrows():
-        nums = row[ball_cols].tolist()
-        coords = np.array([n2c[int(n)] for n in nums], dtype=int)  # shape (15,2)
-
-        # centroide (média) e dispersão
-        centroid = coords.mean(axis=0)
-        dists_to_centroid = np.abs(coords - centroid).sum(axis=1)  # manhattan para centroid "real"
-        mean_to_centroid = float(dists_to_centroid.mean())
-        max_to_centroid = float(dists_to_centroid.max())
-
-        # distância média entre todos os pares
-        pair_dists = []
-        for i in range(len(coords)):
-            for j in range(i+1, len(coords)):
-                pair_dists.append(manhattan(coords[i], coords[j]))
-        mean_pair_dist = float(np.mean(pair_dists))
-        max_pair_dist = float(np.max(pair_dists))
-
-        # bias borda/centro: borda = r=0/4 ou c=0/4
-        edge = int(((coords[:, 0] == 0) | (coords[:, 0] == spec.rows-1) |
-                    (coords[:, 1] == 0) | (coords[:, 1] == spec.cols-1)).sum())
-        center = 15 - edge
-
-        rows.append({
-            "row_index": int(idx),
-            "mean_to_centroid": mean_to_centroid,
-            "max_to_centroid": max_to_centroid,
-            "mean_pair_dist": mean_pair_dist,
-            "max_pair_dist": max_pair_dist,
-            "edge_count": edge,
-            "center_count": center,
-        })
-
-    return pd.DataFrame(rows)
+    metrics = spatial_metrics(df[ball_cols].to_numpy(), spec)
+    frame = pd.DataFrame({"row_index": df.index.to_numpy(dtype=np.int64)})
+    for col in METRIC_COLUMNS:
+        frame[col] = metrics[col]
+    return frame
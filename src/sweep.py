@@ -0,0 +1,206 @@
+"""
+Módulo de varredura de parâmetros (sweep) para experimentos de estratégia.
+Roda uma função de experimento sobre uma grade de parâmetros, com os dados
+compartilhados carregados uma única vez, pontos da grade em paralelo e
+resultados memorizados em disco por versão dos dados e parâmetros: rodar
+de novo a varredura com um ponto a mais calcula só esse ponto.
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import comb
+from typing import Callable, Dict, List
+from tqdm import tqdm
+
+from .advanced_analysis import hot_cold_analysis
+from .atomic_io import write_json
+from .combinatorics import index_masks_to_number_masks, unrank_masks
+from .hit_engine import MAX_HITS, PRIZE_TIERS, hit_matrix
+from .io_data import DrawStore
+from .portfolio import SCORE_WEIGHTS
+from .prefix_index import FrequencyIndex
+
+DEFAULT_SWEEP_DIR = "out/cache/sweep"
+
+Experiment = Callable[[Dict[str, object], object], Dict[str, object]]
+
+
+def data_version(store: DrawStore) -> str:
+    """
+    Identificador do conteúdo do histórico (concursos e números sorteados).
+
+    Args:
+        store: Histórico de sorteios
+
+    Returns:
+        Hash hexadecimal curto; muda quando entra um concurso novo ou um
+        sorteio é corrigido
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(store.contests).tobytes())
+    digest.update(np.ascontiguousarray(store.masks).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def param_grid(**axes) -> List[Dict[str, object]]:
+    """
+    Produto cartesiano dos valores de cada parâmetro.
+
+    Exemplo: param_grid(hot=[15, 16], cold=[0, 2]) gera 4 pontos.
+
+    Returns:
+        Lista de dicionários {parâmetro: valor}, na ordem dos argumentos
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def _point_key(name: str, version: str, params: Dict[str, object]) -> str:
+    payload = json.dumps({'experimento': name, 'dados': version, 'parametros': params},
+                         sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _run_point(params: Dict[str, object], experiment: Experiment, shared: object) -> Dict[str, object]:
+    return experiment(params, shared)
+
+
+def _write_json(path: str, data: Dict[str, object]) -> None:
+    """Grava JSON de forma atômica (temporário único + rename, ver atomic_io)."""
+    write_json(path, data, ensure_ascii=False, indent=2, default=str)
+
+
+def run_sweep(experiment: Experiment, grid: List[Dict[str, object]], shared: object,
+              version: str, cache_dir: str | None = DEFAULT_SWEEP_DIR, workers: int = 1,
+              refresh: bool = False, progress: bool = True) -> List[Dict[str, object]]:
+    """
+    Executa um experimento em todos os pontos da grade.
+
+    Cada ponto é guardado em cache_dir/<experimento>/<hash>.json, com chave
+    (nome do experimento, versão dos dados, parâmetros); pontos já
+    calculados são lidos do disco e só os que faltam são executados, em
+    processos quando workers > 1. Cada resultado é gravado assim que fica
+    pronto, então uma varredura interrompida não perde o que já calculou.
+
+    Args:
+        experiment: Função de módulo experiment(params, shared) -> dict
+                    (resultado serializável em JSON)
+        grid: Pontos da grade (ver param_grid)
+        shared: Dados carregados uma vez e repassados a todos os pontos
+        version: Versão dos dados (ver data_version)
+        cache_dir: Diretório do cache (None desativa)
+        workers: Processos usados
+        refresh: Ignora o cache e recalcula todos os pontos
+        progress: Mostra barra de progresso
+
+    Returns:
+        Lista de resultados na ordem da grade, cada um com os parâmetros
+        do ponto mesclados ao resultado
+    """
+    name = f"{experiment.__module__}.{experiment.__qualname__}"
+    directory = os.path.join(cache_dir, experiment.__name__) if cache_dir else None
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    results: List[Dict[str, object] | None] = [None] * len(grid)
+    paths: List[str | None] = [None] * len(grid)
+    missing = []
+    for i, params in enumerate(grid):
+        if directory:
+            paths[i] = os.path.join(directory, _point_key(name, version, params) + ".json")
+            if not refresh and os.path.exists(paths[i]):
+                with open(paths[i], encoding="utf-8") as f:
+                    results[i] = json.load(f)['resultado']
+                continue
+        missing.append(i)
+
+    run = partial(_run_point, experiment=experiment, shared=shared)
+    with tqdm(total=len(missing), desc="Sweep", disable=not progress or not missing) as bar:
+        if workers <= 1 or len(missing) <= 1:
+            computed = map(run, (grid[i] for i in missing))
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(missing)))
+            computed = pool.map(run, (grid[i] for i in missing))
+        try:
+            for i, result in zip(missing, computed):
+                results[i] = result
+                if paths[i]:
+                    _write_json(paths[i], {'parametros': grid[i], 'dados': version,
+                                           'resultado': result})
+                bar.update(1)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    return [{**params, **result} for params, result in zip(grid, results)]
+
+
+def hot_cold_mix_experiment(params: Dict[str, object], store: DrawStore) -> Dict[str, object]:
+    """
+    Experimento de mistura quentes + frios (optimize_hot_cold_mix/balance).
+
+    As frequências vêm dos `window` sorteios anteriores aos `eval_draws`
+    últimos (sem olhar os sorteios avaliados), classificadas por
+    hot_cold_analysis com o limiar `threshold`. O pool junta os `hot`
+    números mais frequentes fora da categoria fria e os `cold` frios mais
+    frequentes; dele são sorteados `games` jogos de 15 números, conferidos
+    nos sorteios avaliados junto com o pool inteiro como aposta única.
+
+    Args:
+        params: hot, cold, window (0 = todo o histórico anterior), threshold,
+                games, eval_draws (padrão 20) e seed (padrão 42)
+        store: Histórico de sorteios
+
+    Returns:
+        Dicionário com o pool, acertos por faixa dos jogos (hits_11..15),
+        score ponderado, taxa de premiação, prêmios por jogo e faixas do
+        pool como aposta única (pool_hits_11..15, se couber em 15..20 números)
+    """
+    eval_draws = int(params.get('eval_draws', 20))
+    window = int(params.get('window', 0))
+    stop = len(store) - eval_draws
+    start = max(stop - window, 0) if window else 0
+
+    freq = FrequencyIndex.from_store(store).counts(start, stop)
+    table = hot_cold_analysis(freq, stop - start, threshold=float(params.get('threshold', 1.5)))
+    table = table.sort_values(['freq', 'numero'], ascending=[False, True])
+    is_cold = table['categoria'] == "❄️ Frio"
+    hot = table[~is_cold]['numero'].head(int(params['hot'])).tolist()
+    cold = table[is_cold]['numero'].head(int(params['cold'])).tolist()
+    pool = sorted(hot + cold)
+
+    draws = store.tail(eval_draws)
+    result: Dict[str, object] = {
+        'pool': pool,
+        'hot_selected': sorted(hot),
+        'cold_selected': sorted(cold),
+    }
+
+    n_games = min(int(params.get('games', 100)), comb(len(pool), 15)) if len(pool) >= 15 else 0
+    counts = np.zeros(MAX_HITS + 1, dtype=np.int64)
+    if n_games:
+        rng = np.random.default_rng(int(params.get('seed', 42)))
+        ranks = rng.choice(comb(len(pool), 15), size=n_games, replace=False)
+        games = index_masks_to_number_masks(unrank_masks(np.sort(ranks), 15), pool)
+        counts = np.bincount(hit_matrix(games, draws).ravel(), minlength=MAX_HITS + 1)
+
+    result['games_tested'] = n_games
+    for tier in PRIZE_TIERS:
+        result[f'hits_{tier}'] = int(counts[tier])
+    prizes = int(counts[PRIZE_TIERS[0]:].sum())
+    result['weighted_score'] = int(sum(SCORE_WEIGHTS[t] * counts[t] for t in PRIZE_TIERS))
+    result['hit_rate'] = prizes / (n_games * len(draws)) * 100 if n_games else 0.0
+    result['avg_prize_per_game'] = prizes / n_games if n_games else 0.0
+
+    if 15 <= len(pool) <= 20:
+        pool_counts = np.bincount(hit_matrix([pool], draws)[0], minlength=MAX_HITS + 1)
+        for tier in PRIZE_TIERS:
+            result[f'pool_hits_{tier}'] = int(pool_counts[tier])
+    return result
@@ -0,0 +1,86 @@
+"""
+Script de varredura da mistura quentes + frios.
+
+Substitui os testes um a um de optimize_hot_cold_mix.py e
+optimize_hot_cold_balance.py por uma grade de parâmetros com resultados em
+cache: rodar de novo com um valor a mais calcula só os pontos novos.
+
+Exemplos:
+    python src/sweep_main.py
+    python src/sweep_main.py --quentes 14 15 16 17 18 --frios 0 1 2 3 --janelas 0 500 1000
+    python src/sweep_main.py --limiares 1.0 1.5 2.0 --jogos 200 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import DEFAULT_DRAWS_PATH, load_draw_store
+from src.sweep import DEFAULT_SWEEP_DIR, data_version, hot_cold_mix_experiment, param_grid, run_sweep
+
+
+def main(argv=None):
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Varredura da mistura quentes + frios")
+    parser.add_argument("--draws", default=DEFAULT_DRAWS_PATH, help="CSV de sorteios")
+    parser.add_argument("--quentes", type=int, nargs="+", default=[15, 16, 17, 18],
+                        help="Quantidades de números quentes")
+    parser.add_argument("--frios", type=int, nargs="+", default=[0, 1, 2, 3],
+                        help="Quantidades de números frios")
+    parser.add_argument("--janelas", type=int, nargs="+", default=[0],
+                        help="Sorteios usados nas frequências (0 = todo o histórico)")
+    parser.add_argument("--limiares", type=float, nargs="+", default=[1.5],
+                        help="Desvio (%%) que separa quentes/frios de médios")
+    parser.add_argument("--jogos", type=int, nargs="+", default=[200],
+                        help="Jogos de 15 sorteados de cada pool")
+    parser.add_argument("--avaliados", type=int, default=20, help="Últimos sorteios usados na avaliação")
+    parser.add_argument("--pool-min", type=int, default=15, help="Tamanho mínimo do pool")
+    parser.add_argument("--pool-max", type=int, default=20, help="Tamanho máximo do pool")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos usados")
+    parser.add_argument("--refresh", action="store_true", help="Ignora o cache e recalcula tudo")
+    parser.add_argument("--cache", default=DEFAULT_SWEEP_DIR, help="Diretório do cache")
+    parser.add_argument("--out", default="out/optimized/sweep_quentes_frios.csv", help="CSV de saída")
+    args = parser.parse_args(argv)
+
+    store = load_draw_store(args.draws)
+    version = data_version(store)
+    grid = [p for p in param_grid(hot=args.quentes, cold=args.frios, window=args.janelas,
+                                  threshold=args.limiares, games=args.jogos,
+                                  eval_draws=[args.avaliados])
+            if args.pool_min <= p['hot'] + p['cold'] <= args.pool_max]
+
+    print("=" * 80)
+    print("🔬 VARREDURA QUENTES + FRIOS")
+    print("=" * 80)
+    print(f"\nPontos na grade: {len(grid)} | Dados: {version} | "
+          f"Avaliação: últimos {args.avaliados} sorteios\n")
+
+    results = run_sweep(hot_cold_mix_experiment, grid, store, version, cache_dir=args.cache,
+                        workers=args.workers, refresh=args.refresh)
+    frame = pd.DataFrame(results).sort_values(['avg_prize_per_game', 'weighted_score'],
+                                              ascending=False)
+
+    columns = ['hot', 'cold', 'window', 'threshold', 'games', 'hits_15', 'hits_14', 'hits_13',
+               'hits_12', 'hits_11', 'weighted_score', 'hit_rate', 'avg_prize_per_game']
+    print(frame[columns].head(15).to_string(index=False))
+
+    best = frame.iloc[0]
+    print(f"\n🏆 Melhor ponto: {best['hot']} quentes + {best['cold']} frios "
+          f"(janela {best['window'] or 'completa'}, limiar {best['threshold']})")
+    print(f"   Números: {', '.join(map(str, best['pool']))}")
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    frame.assign(**{col: frame[col].map(lambda v: ','.join(map(str, v)))
+                    for col in ('pool', 'hot_selected', 'cold_selected')}).to_csv(out, index=False)
+    print(f"\n💾 Resultados salvos em: {out}")
+
+
+if __name__ == "__main__":
+    main()
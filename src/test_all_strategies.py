@@ -2,26 +2,20 @@
 Testa diferentes estratégias e identifica a melhor
 """
 
+import os
+import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+from src.hit_engine import hit_matrix
+
 def load_recent_draws(n=20):
-    """Carrega os últimos N sorteios"""
-    df = pd.read_csv('data/lotofacil_sorteios.csv')
-    recent = df.tail(n)
-    
-    draws = []
-    for _, row in recent.iterrows():
-        numbers = set()
-        for i in range(1, 16):
-            numbers.add(int(row[f'Bola{i}']))
-        draws.append({
-            'concurso': int(row['Concurso']),
-            'data': row['Data Sorteio'],
-            'numbers': numbers
-        })
-    
-    return draws
+    """Carrega os últimos N sorteios (bitmasks compartilhados)"""
+    return load_draw_store().tail(n)
 
 def test_strategy(pool_numbers, strategy_name, draws):
     """Testa uma estratégia contra os últimos sorteios"""
@@ -36,18 +30,10 @@ def test_strategy(pool_numbers, strategy_name, draws):
         'hits_11': 0
     }
     
-    for draw in draws:
-        matches = len(pool_numbers & draw['numbers'])
-        if matches == 15:
-            results['hits_15'] += 1
-        elif matches == 14:
-            results['hits_14'] += 1
-        elif matches == 13:
-            results['hits_13'] += 1
-        elif matches == 12:
-            results['hits_12'] += 1
-        elif matches == 11:
-            results['hits_11'] += 1
+    matches = hit_matrix([pool_numbers], draws)[0]
+    counts = np.bincount(matches, minlength=16)
+    for tier in range(11, 16):
+        results[f'hits_{tier}'] = int(counts[tier])
     
     # Score ponderado: 15=100, 14=20, 13=5, 12=2, 11=1
     results['score'] = (
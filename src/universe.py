@@ -0,0 +1,346 @@
+"""
+Módulo do universo completo de apostas da Lotofácil.
+Pontua todas as C(25, 15) = 3.268.760 apostas possíveis contra o histórico
+e grava o resultado em um arquivo .npy estruturado, mapeado em memória,
+em que a linha i é a aposta de posição colexicográfica i.
+"""
+from __future__ import annotations
+
+import json
+import os
+import numpy as np
+import pandas as pd
+from math import comb
+from typing import Dict, Iterable, List, Sequence, Tuple
+from tqdm import tqdm
+
+from .atomic_io import atomic_path, write_json
+from .bitmask import N_NUMBERS, mask_to_numbers, numbers_to_mask, popcount
+from .combinatorics import colex_rank, iter_combination_masks
+from .game_scoring import quality_scores
+from .hit_engine import DEFAULT_BLOCK_ELEMENTS, MAX_HITS, PRIZE_TIERS, map_hit_blocks
+from .draw_cache import DrawTable, load_draw_table
+from .io_data import DEFAULT_DRAWS_PATH, load_draw_store
+
+BET_SIZE = 15
+UNIVERSE_SIZE = comb(N_NUMBERS, BET_SIZE)
+
+DEFAULT_UNIVERSE_DIR = "out/universe"
+UNIVERSE_FILE = "universe.npy"
+META_FILE = "universe.json"
+DEFAULT_PAIRS_PATH = "out/lotofacil/pares_forca.csv"
+
+UNIVERSE_DTYPE = np.dtype([
+    ('mask', '<u4'),                      # bitmask da aposta
+    ('hits', '<u2', (MAX_HITS + 1,)),     # sorteios com 0..15 acertos
+    ('prize', '<f8'),                     # soma dos rateios que teria recebido (R$)
+    ('score', 'u1'),                      # score de qualidade (0-10)
+    ('dispersion', '<f4'),
+    ('adjacent_pairs', 'u1'),
+    ('has_super_pair', '?'),
+    ('balanced', '?'),
+])
+
+# faixas com até este número de trechos de rateio constante (prêmios
+# fixos de 11-13 acertos) são somadas por trecho em vez de por sorteio
+MAX_FIXED_PRIZE_RUNS = 64
+
+
+def load_prize_table(table: DrawTable) -> np.ndarray:
+    """
+    Monta a tabela de rateios pagos em cada sorteio.
+
+    Args:
+        table: Colunas do arquivo de sorteios (ver draw_cache.load_draw_table)
+
+    Returns:
+        Array (M, 16) float64 onde [j, h] = rateio (R$) de h acertos no sorteio j
+        (zero para faixas não premiadas ou colunas ausentes)
+    """
+    prizes = np.zeros((len(table), MAX_HITS + 1), dtype=np.float64)
+    for tier in PRIZE_TIERS:
+        col = f"Rateio {tier} acertos"
+        if col in table.money_columns:
+            prizes[:, tier] = table.money_column(col) / 100
+    return prizes
+
+
+def load_super_pairs(path: str = DEFAULT_PAIRS_PATH) -> List[Tuple[int, int]]:
+    """
+    Lê os super pares gerados pela análise avançada, se existirem.
+
+    Args:
+        path: CSV de pares de força (colunas a, b, categoria)
+
+    Returns:
+        Lista de pares (a, b); vazia se o arquivo não existir
+    """
+    if not os.path.exists(path):
+        return []
+    df = pd.read_csv(path)
+    df = df[df['categoria'] == '⭐⭐⭐ Super Par']
+    return [(int(a), int(b)) for a, b in zip(df['a'], df['b'])]
+
+
+def _prize_schedule(prizes: np.ndarray) -> Dict[int, object]:
+    """
+    Decide como somar o rateio de cada faixa.
+
+    Returns:
+        Dicionário faixa -> lista de trechos (início, fim, valor) quando o
+        rateio é constante em poucos trechos, ou o array de rateios por
+        sorteio caso contrário
+    """
+    schedule = {}
+    for tier in PRIZE_TIERS:
+        values = prizes[:, tier]
+        bounds = np.concatenate(([0], np.flatnonzero(np.diff(values)) + 1, [len(values)]))
+        if len(bounds) - 1 <= MAX_FIXED_PRIZE_RUNS:
+            schedule[tier] = [(int(s), int(e), float(values[s]))
+                              for s, e in zip(bounds[:-1], bounds[1:]) if e > s]
+        else:
+            schedule[tier] = values
+    return schedule
+
+
+def _score_hits(bet_masks: np.ndarray, draw_masks: np.ndarray, prizes: np.ndarray,
+                block_elements: int, workers: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distribuição de acertos e rateio acumulado de cada aposta.
+
+    Returns:
+        Tupla (hits (N, 16) uint16, prize (N,) float64)
+    """
+    n_bets = bet_masks.shape[0]
+    n_draws = draw_masks.shape[0]
+    hits = np.zeros((n_bets, MAX_HITS + 1), dtype=np.uint16)
+    prize = np.zeros(n_bets, dtype=np.float64)
+    schedule = _prize_schedule(prizes)
+
+    # com apostas e sorteios de 15 números há sempre pelo menos 5 acertos
+    draw_size = int(popcount(draw_masks).min()) if n_draws else 0
+    lowest = max(0, BET_SIZE + draw_size - N_NUMBERS)
+
+    def reduce(start: int, block: np.ndarray) -> None:
+        stop = start + block.shape[0]
+        remaining = np.full(block.shape[0], n_draws, dtype=np.uint32)
+        for tier in range(MAX_HITS, lowest, -1):
+            rule = schedule.get(tier)
+            if isinstance(rule, list):
+                counts = np.zeros(block.shape[0], dtype=np.uint32)
+                for s, e, value in rule:
+                    run_counts = (block[:, s:e] == tier).sum(axis=1, dtype=np.uint32)
+                    counts += run_counts
+                    if value:
+                        prize[start:stop] += run_counts * value
+            else:
+                equal = block == tier
+                counts = equal.sum(axis=1, dtype=np.uint32)
+                if rule is not None:
+                    rows, cols = np.nonzero(equal)
+                    prize[start:stop] += np.bincount(rows, weights=rule[cols], minlength=block.shape[0])
+            hits[start:stop, tier] = counts
+            remaining -= counts
+        hits[start:stop, lowest] = remaining
+
+    map_hit_blocks(reduce, bet_masks, draw_masks, block_elements, workers)
+    return hits, prize
+
+
+def build_universe(output_dir: str = DEFAULT_UNIVERSE_DIR, draws_path: str = DEFAULT_DRAWS_PATH,
+                   super_pairs: Iterable[Tuple[int, int]] | None = None,
+                   chunk_size: int = 1 << 20, block_elements: int = DEFAULT_BLOCK_ELEMENTS,
+                   workers: int = 1) -> str:
+    """
+    Pontua todas as apostas de 15 números e grava o universo em disco.
+
+    O arquivo é escrito em um temporário e renomeado no fim, então um
+    processo interrompido nunca deixa um universo parcial no lugar.
+
+    Args:
+        output_dir: Diretório de saída
+        draws_path: CSV de sorteios (com colunas de rateio)
+        super_pairs: Pares usados no critério de super par; se None, lidos
+                     de out/lotofacil/pares_forca.csv quando existir
+        chunk_size: Inteiros varridos por bloco na enumeração
+        block_elements: Tamanho máximo de cada bloco (apostas × sorteios)
+        workers: Threads usadas na contagem de acertos
+
+    Returns:
+        Caminho do arquivo .npy gerado
+    """
+    store = load_draw_store(draws_path)
+    if len(store) > np.iinfo(np.uint16).max:
+        raise ValueError(f"Histórico grande demais para contagens uint16: {len(store)} sorteios")
+    prizes = load_prize_table(load_draw_table(draws_path, n_max=N_NUMBERS))
+    super_pairs = load_super_pairs() if super_pairs is None else list(super_pairs)
+
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, UNIVERSE_FILE)
+    with atomic_path(path) as tmp_path:
+        universe = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=UNIVERSE_DTYPE,
+                                             shape=(UNIVERSE_SIZE,))
+
+        position = 0
+        with tqdm(total=UNIVERSE_SIZE, desc="Universo") as progress:
+            for masks in iter_combination_masks(range(1, N_NUMBERS + 1), BET_SIZE, chunk_size):
+                rows = universe[position:position + masks.size]
+                hits, prize = _score_hits(masks, store.masks, prizes, block_elements, workers)
+                quality = quality_scores(masks, super_pairs)
+
+                rows['mask'] = masks
+                rows['hits'] = hits
+                rows['prize'] = prize
+                for field in ('score', 'dispersion', 'adjacent_pairs', 'has_super_pair', 'balanced'):
+                    rows[field] = quality[field]
+
+                position += masks.size
+                progress.update(masks.size)
+
+        universe.flush()
+        del universe
+
+    meta = {
+        'apostas': UNIVERSE_SIZE,
+        'sorteios': len(store),
+        'ultimo_concurso': int(store.contests[-1]) if len(store) else None,
+        'arquivo_sorteios': draws_path,
+        'super_pares': [list(p) for p in super_pairs],
+    }
+    write_json(os.path.join(output_dir, META_FILE), meta, ensure_ascii=False, indent=2)
+
+    return path
+
+
+def load_universe(output_dir: str = DEFAULT_UNIVERSE_DIR) -> Tuple[np.ndarray, dict]:
+    """
+    Abre o universo gerado por build_universe (somente leitura, mmap).
+
+    Args:
+        output_dir: Diretório do universo
+
+    Returns:
+        Tupla (array estruturado (3.268.760,) mapeado em memória, metadados)
+    """
+    universe = np.load(os.path.join(output_dir, UNIVERSE_FILE), mmap_mode='r')
+    with open(os.path.join(output_dir, META_FILE), encoding='utf-8') as f:
+        meta = json.load(f)
+    return universe, meta
+
+
+def lookup(universe: np.ndarray, numbers: Sequence[int]) -> np.void:
+    """
+    Linha de uma aposta (O(1), pela posição colexicográfica).
+
+    Args:
+        universe: Array retornado por load_universe
+        numbers: Os 15 números da aposta
+
+    Returns:
+        Registro estruturado da aposta
+
+    Raises:
+        ValueError: Se a aposta não tiver 15 números distintos entre 1 e 25
+    """
+    numbers = [int(n) for n in numbers]
+    if len(numbers) != BET_SIZE or len(set(numbers)) != BET_SIZE:
+        raise ValueError(f"A aposta deve ter {BET_SIZE} números distintos, recebido {numbers}")
+    out_of_range = [n for n in numbers if not 1 <= n <= N_NUMBERS]
+    if out_of_range:
+        raise ValueError(f"Números fora do intervalo 1..{N_NUMBERS}: {out_of_range}")
+    return universe[colex_rank(numbers)]
+
+
+def bets_containing(universe: np.ndarray, numbers: Sequence[int]) -> np.ndarray:
+    """
+    Posições das apostas que contêm todos os números dados.
+
+    Args:
+        universe: Array retornado por load_universe
+        numbers: Números obrigatórios
+
+    Returns:
+        Array de posições (ordem crescente)
+    """
+    required = np.uint32(numbers_to_mask(numbers))
+    return np.flatnonzero((universe['mask'] & required) == required)
+
+
+def bets_never_hit(universe: np.ndarray, tier: int = 15,
+                   indices: np.ndarray | None = None) -> np.ndarray:
+    """
+    Posições das apostas que nunca tiveram exatamente `tier` acertos.
+
+    Args:
+        universe: Array retornado por load_universe
+        tier: Quantidade de acertos (0..15)
+        indices: Restringe a busca a estas posições
+
+    Returns:
+        Array de posições
+    """
+    if indices is None:
+        return np.flatnonzero(universe['hits'][:, tier] == 0)
+    indices = np.asarray(indices)
+    return indices[universe['hits'][indices, tier] == 0]
+
+
+def _sort_values(universe: np.ndarray, key: str, indices: np.ndarray | None) -> np.ndarray:
+    """Valores usados para ordenar: campo do universo ou hits_<faixa>."""
+    if key.startswith('hits_'):
+        values = universe['hits'][:, int(key.split('_', 1)[1])]
+    elif key in UNIVERSE_DTYPE.names and key != 'hits':
+        values = universe[key]
+    else:
+        raise ValueError(f"Critério de ordenação desconhecido: {key}")
+    return values if indices is None else values[indices]
+
+
+def top_bets(universe: np.ndarray, key: str = 'prize', n: int = 10,
+             indices: np.ndarray | None = None) -> np.ndarray:
+    """
+    Melhores apostas segundo um critério (maior primeiro).
+
+    Args:
+        universe: Array retornado por load_universe
+        key: Campo do universo (prize, score, dispersion...) ou hits_<faixa>
+        n: Quantidade de apostas
+        indices: Restringe a busca a estas posições
+
+    Returns:
+        Array de até n posições, da melhor para a pior
+    """
+    # float64 evita que -valor dê a volta em campos sem sinal
+    values = np.asarray(_sort_values(universe, key, indices), dtype=np.float64)
+    n = min(n, values.shape[0])
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    best = np.argpartition(-values, n - 1)[:n]
+    best = best[np.argsort(-values[best], kind='stable')]
+    return best if indices is None else np.asarray(indices)[best]
+
+
+def universe_frame(universe: np.ndarray, indices: Sequence[int]) -> pd.DataFrame:
+    """
+    Converte linhas do universo em DataFrame legível.
+
+    Args:
+        universe: Array retornado por load_universe
+        indices: Posições desejadas
+
+    Returns:
+        DataFrame com posição, números, acertos por faixa, rateio e critérios
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    rows = universe[indices]
+    frame = pd.DataFrame({
+        'posicao': indices,
+        'numeros': [','.join(map(str, mask_to_numbers(m))) for m in rows['mask']],
+    })
+    for tier in sorted(PRIZE_TIERS, reverse=True):
+        frame[f'acertos_{tier}'] = rows['hits'][:, tier]
+    frame['premio_total'] = rows['prize'].round(2)
+    for field in ('score', 'dispersion', 'adjacent_pairs', 'has_super_pair', 'balanced'):
+        frame[field] = rows[field]
+    frame['dispersion'] = frame['dispersion'].round(2)
+    return frame
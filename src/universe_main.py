@@ -0,0 +1,139 @@
+"""
+Script do universo completo de apostas da Lotofácil.
+
+Subcomandos:
+    build   Pontua as 3.268.760 apostas e grava out/universe/universe.npy
+    query   Consulta o universo já gerado (sem nova simulação)
+    coverage  Cobertura exata de um portfólio sobre todos os sorteios possíveis
+
+Exemplos:
+    python src/universe_main.py build
+    python src/universe_main.py query --contains 13 21 --key prize --top 20
+    python src/universe_main.py query --never 15 --key score
+    python src/universe_main.py query --bet 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15
+    python src/universe_main.py coverage --games out/jogos_otimizados_100.csv
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.universe import (
+    DEFAULT_UNIVERSE_DIR, UNIVERSE_SIZE, bets_containing, bets_never_hit,
+    build_universe, load_universe, lookup, top_bets, universe_frame
+)
+from src.combinatorics import colex_rank
+from src.coverage import coverage_frame, load_portfolio, portfolio_coverage
+from src.hit_engine import PRIZE_TIERS
+
+
+def cmd_build(args: argparse.Namespace) -> None:
+    """Gera o universo completo."""
+    print("=" * 80)
+    print(f"🌌 UNIVERSO LOTOFÁCIL - {UNIVERSE_SIZE:,} APOSTAS")
+    print("=" * 80)
+
+    path = build_universe(args.out, args.draws, workers=args.workers)
+    _, meta = load_universe(args.out)
+
+    print(f"\n✅ Universo salvo em: {path}")
+    print(f"   • Sorteios considerados: {meta['sorteios']} (até o concurso {meta['ultimo_concurso']})")
+    print(f"   • Super pares usados: {len(meta['super_pares'])}")
+
+
+def cmd_query(args: argparse.Namespace) -> None:
+    """Consulta o universo gerado."""
+    universe, meta = load_universe(args.out)
+    print(f"🌌 Universo: {len(universe):,} apostas × {meta['sorteios']} sorteios "
+          f"(até o concurso {meta['ultimo_concurso']})\n")
+
+    if args.bet:
+        row = lookup(universe, args.bet)
+        frame = universe_frame(universe, [colex_rank(args.bet)])
+        print(frame.to_string(index=False))
+        print(f"\nDistribuição de acertos: {dict(enumerate(row['hits'].tolist()))}")
+        return
+
+    indices = None
+    if args.contains:
+        indices = bets_containing(universe, args.contains)
+        print(f"Apostas contendo {args.contains}: {len(indices):,}")
+    if args.never is not None:
+        indices = bets_never_hit(universe, args.never, indices)
+        print(f"Apostas que nunca fizeram {args.never} acertos: {len(indices):,}")
+
+    best = top_bets(universe, args.key, args.top, indices)
+    frame = universe_frame(universe, best)
+    print(f"\n🏆 TOP {len(frame)} por {args.key}:")
+    print(frame.to_string(index=False))
+
+    if args.csv:
+        frame.to_csv(args.csv, index=False)
+        print(f"\n💾 Salvo em: {args.csv}")
+
+
+def cmd_coverage(args: argparse.Namespace) -> None:
+    """Avalia um portfólio contra todos os sorteios possíveis."""
+    bets = load_portfolio(args.games)
+    print("=" * 80)
+    print(f"🛡️ COBERTURA EXATA - {len(bets)} APOSTAS × {UNIVERSE_SIZE:,} SORTEIOS POSSÍVEIS")
+    print("=" * 80)
+
+    coverage = portfolio_coverage(bets, workers=args.workers)
+    frame = coverage_frame(coverage)
+
+    print(f"\n🏆 MELHOR ACERTO DO PORTFÓLIO POR SORTEIO:")
+    print(frame.round(4).to_string(index=False))
+
+    print(f"\n🎯 GARANTIAS:")
+    for tier in PRIZE_TIERS:
+        print(f"   • Pelo menos {tier} acertos em {coverage['cobertura_%'][tier]:.4f}% dos sorteios")
+    print(f"\n🎁 PRÊMIOS SOMADOS SOBRE O UNIVERSO:")
+    for tier in sorted(PRIZE_TIERS, reverse=True):
+        print(f"   • {tier} acertos: {coverage[f'premios_{tier}']:,}")
+    print(f"   • Sorteios com pelo menos um prêmio: {coverage['sorteios_premiados']:,}")
+
+    if args.csv:
+        frame.to_csv(args.csv, index=False)
+        print(f"\n💾 Salvo em: {args.csv}")
+
+
+def main(argv=None):
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Universo completo de apostas da Lotofácil")
+    parser.add_argument("--out", default=DEFAULT_UNIVERSE_DIR, help="Diretório do universo")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Pontua todas as apostas possíveis")
+    build.add_argument("--draws", default="data/lotofacil_sorteios.csv", help="CSV de sorteios")
+    build.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                       help="Threads para a contagem de acertos")
+    build.set_defaults(func=cmd_build)
+
+    query = sub.add_parser("query", help="Consulta o universo gerado")
+    query.add_argument("--bet", type=int, nargs=15, help="Mostra uma aposta específica")
+    query.add_argument("--contains", type=int, nargs="+", help="Números obrigatórios")
+    query.add_argument("--never", type=int, help="Só apostas que nunca tiveram N acertos")
+    query.add_argument("--key", default="prize",
+                       help="Critério: prize, score, dispersion, hits_11..hits_15")
+    query.add_argument("--top", type=int, default=10, help="Quantidade de apostas")
+    query.add_argument("--csv", help="Salva o resultado em CSV")
+    query.set_defaults(func=cmd_query)
+
+    coverage = sub.add_parser("coverage", help="Cobertura exata de um portfólio")
+    coverage.add_argument("--games", default="out/jogos_otimizados_100.csv",
+                          help="CSV de jogos (coluna numeros)")
+    coverage.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                          help="Threads para a contagem de acertos")
+    coverage.add_argument("--csv", help="Salva a distribuição em CSV")
+    coverage.set_defaults(func=cmd_coverage)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
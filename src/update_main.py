@@ -0,0 +1,92 @@
+"""
+Atualização incremental após a publicação de um novo concurso.
+
+Carrega o estado salvo em out/state/analysis_state.npz, incorpora apenas os
+sorteios novos do CSV e regrava as saídas derivadas (heatmap, frequências
+por linha/coluna, top pares, ciclos e backtest das apostas salvas), sem
+reprocessar o histórico inteiro.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io_data import load_draw_store
+from src.cooccurrence import top_pairs
+from src.incremental import DEFAULT_STATE_PATH, AnalysisState
+from src.lattice_index import DEFAULT_LATTICE_DIR, load_or_build_lattice
+
+SAVED_BETS_PATH = "out/jogos_otimizados_combined.csv"
+
+
+def load_saved_bets(path: str = SAVED_BETS_PATH):
+    """Apostas salvas pela análise combinada (lista vazia se não houver)."""
+    if not os.path.exists(path):
+        return []
+    df = pd.read_csv(path)
+    return [[int(x) for x in s.split(',')] for s in df['numeros_str']]
+
+
+def main():
+    """Avança o estado incremental e regrava as saídas derivadas."""
+    print("=" * 80)
+    print("🔄 ATUALIZAÇÃO INCREMENTAL - LOTOFÁCIL")
+    print("=" * 80)
+
+    store = load_draw_store()
+    bets = load_saved_bets()
+
+    start = time.perf_counter()
+    rebuilt = False
+    if os.path.exists(DEFAULT_STATE_PATH):
+        state = AnalysisState.load(DEFAULT_STATE_PATH)
+        try:
+            new_draws = state.update(store)
+        except ValueError as exc:
+            print(f"\n⚠️ {exc}")
+            state, new_draws, rebuilt = AnalysisState.from_store(store), len(store), True
+    else:
+        state, new_draws, rebuilt = AnalysisState.from_store(store), len(store), True
+    if bets:
+        state.track_bets(bets, store)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if rebuilt:
+        print(f"\n🧱 Estado construído do zero: {new_draws} sorteios ({elapsed_ms:.1f} ms)")
+    elif new_draws:
+        print(f"\n✅ {new_draws} sorteio(s) novo(s) incorporado(s) em {elapsed_ms:.1f} ms")
+    else:
+        print(f"\n✅ Estado já atualizado ({elapsed_ms:.1f} ms)")
+    print(f"   • Sorteios no estado: {state.n_draws} (último concurso: {state.last_contest})")
+
+    os.makedirs("out/state", exist_ok=True)
+
+    hm = state.heatmap()
+    hm["heatmap_df"].to_csv("out/heatmap_5x5.csv", index=True)
+    hm["row_df"].to_csv("out/freq_linhas.csv", index=False)
+    hm["col_df"].to_csv("out/freq_colunas.csv", index=False)
+    top_pairs(state.cooc, top_k=80).to_csv("out/top_pares_coocorrencia.csv", index=False)
+
+    cycles = pd.DataFrame.from_dict(state.gap_stats(), orient='index')
+    cycles.index.name = 'numero'
+    cycles.to_csv("out/state/ciclos.csv")
+
+    if state.bet_masks.size:
+        state.backtest_frame().to_csv("out/state/backtest_apostas.csv", index=False)
+        print(f"   • Apostas acompanhadas: {state.bet_masks.size}")
+
+    state.save(DEFAULT_STATE_PATH)
+    print(f"\n💾 Estado salvo em: {DEFAULT_STATE_PATH}")
+
+    start = time.perf_counter()
+    lattice = load_or_build_lattice(store, DEFAULT_LATTICE_DIR)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"💾 Índice de conjuntos ({lattice.n_draws} sorteios, {elapsed_ms:.1f} ms): {DEFAULT_LATTICE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,7 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Dict, List, Tuple
-import networkx as nx
 from matplotlib.colors import LinearSegmentedColormap
 
 plt.rcParams['figure.figsize'] = (12, 8)
@@ -24,6 +22,8 @@ def plot_heatmap_grid(heatmap_matrix: np.ndarray, output_path: str = "out/heatma
         heatmap_matrix: Matriz 5x5 com frequências
         output_path: Caminho para salvar a imagem
     """
+    import seaborn as sns  # import pesado, só quando usado
+    
     fig, ax = plt.subplots(figsize=(10, 8))
     
     # Cria o heatmap
@@ -147,6 +147,8 @@ def plot_cooccurrence_network(pairs_df: pd.DataFrame, top_n: int = 30,
         top_n: Quantidade de pares a mostrar
         output_path: Caminho para salvar a imagem
     """
+    import networkx as nx  # import pesado, só quando usado
+    
     G = nx.Graph()
     
     # Adiciona arestas (top N pares)
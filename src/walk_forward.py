@@ -0,0 +1,197 @@
+"""
+Módulo de backtesting walk-forward (sem lookahead) das estratégias.
+Em cada concurso t, as estratégias de LotofacilGameGenerator enxergam só
+os sorteios anteriores a t (frequências, tendências e co-ocorrência lidas
+do índice de somas de prefixo em [0, t)), geram seus jogos e são
+pontuadas no sorteio t.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Sequence, Tuple
+from tqdm import tqdm
+
+from .advanced_analysis import hot_cold_analysis, pair_strength_analysis, trends_from_windows
+from .bitmask import mask_to_numbers, numbers_to_mask, popcount
+from .game_generator import LotofacilGameGenerator
+from .hit_engine import PRIZE_TIERS
+from .io_data import DrawStore
+from .prefix_index import FrequencyIndex
+from .probability import at_least_probability, expected_hits
+
+# janela das tendências, igual à de advanced_main
+DEFAULT_WINDOW_SIZE = 500
+# concursos por tarefa; fixo para que o resultado dependa só da semente
+DEFAULT_BLOCK_SIZE = 100
+
+
+def analysis_frames(index: FrequencyIndex, t: int,
+                    window_size: int = DEFAULT_WINDOW_SIZE) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Tabelas das análises avançadas usando apenas os sorteios [0, t).
+
+    Mesmas funções de advanced_main (quentes/frios, pares de força com
+    top 50 e tendências em janelas com passo window_size / 2), alimentadas
+    pelo índice de prefixos em vez do DataFrame completo.
+
+    Args:
+        index: Índice de prefixos do histórico
+        t: Posição do concurso avaliado (exclusiva)
+        window_size: Tamanho da janela das tendências
+
+    Returns:
+        Tupla (hot_cold_df, pairs_df, trends_df)
+    """
+    hot_cold = hot_cold_analysis(index.counts(0, t), t)
+    pairs = pair_strength_analysis(index.pair_matrix(0, t), top_n=50)
+    trends = trends_from_windows(index.window_counts(window_size, window_size // 2, 0, t))
+    return hot_cold, pairs, trends
+
+
+def _walk_block(positions: Sequence[int], seed: np.random.SeedSequence, index: FrequencyIndex,
+                n_numbers: int, games_per_strategy: int, strategies: Sequence[str] | None,
+                window_size: int) -> Tuple[np.ndarray, List[str], np.ndarray, np.ndarray]:
+    """
+    Gera os jogos de todas as estratégias para um bloco de concursos.
+
+    As estratégias usam o gerador global do numpy, que é semeado por bloco.
+
+    Returns:
+        Tupla (posições, estratégias, jogo_id, bitmasks), uma linha por jogo
+    """
+    np.random.seed(seed.generate_state(1)[0])
+    rows_pos, rows_name, rows_game, rows_mask = [], [], [], []
+    for t in positions:
+        hot_cold, pairs, trends = analysis_frames(index, t, window_size)
+        # bias borda/centro não é usado pelas estratégias
+        generator = LotofacilGameGenerator(hot_cold, pairs, trends, bias={})
+        games = generator.generate_all_strategies(n_numbers, games_per_strategy)
+        for name, strategy_games in games.items():
+            if strategies is not None and name not in strategies:
+                continue
+            for game_id, game in enumerate(strategy_games, 1):
+                rows_pos.append(t)
+                rows_name.append(name)
+                rows_game.append(game_id)
+                rows_mask.append(numbers_to_mask(game))
+    return (np.array(rows_pos, dtype=np.int64), rows_name,
+            np.array(rows_game, dtype=np.int64), np.array(rows_mask, dtype=np.uint32))
+
+
+def walk_forward(store: DrawStore, prizes: np.ndarray | None = None, start: int | None = None,
+                 stop: int | None = None, n_numbers: int = 15, games_per_strategy: int = 5,
+                 strategies: Sequence[str] | None = None, window_size: int = DEFAULT_WINDOW_SIZE,
+                 block_size: int = DEFAULT_BLOCK_SIZE, workers: int = 1, seed: int = 0,
+                 progress: bool = True) -> pd.DataFrame:
+    """
+    Backtesting walk-forward de todas as estratégias do gerador.
+
+    Os concursos são divididos em blocos de tamanho fixo, cada um com seu
+    próprio fluxo aleatório (SeedSequence(seed).spawn), e os blocos podem
+    rodar em paralelo em processos; o resultado é o mesmo com qualquer
+    quantidade de processos.
+
+    Args:
+        store: Histórico de sorteios
+        prizes: Tabela (M, 16) de rateios (ver universe.load_prize_table); opcional
+        start: Primeira posição avaliada (padrão: a primeira com 2 janelas de tendência)
+        stop: Posição final, exclusiva (padrão: fim do histórico)
+        n_numbers: Números por jogo
+        games_per_strategy: Jogos gerados por estratégia em cada concurso
+        strategies: Estratégias avaliadas (padrão: todas)
+        window_size: Janela das tendências
+        block_size: Concursos por tarefa
+        workers: Processos usados
+        seed: Semente das estratégias aleatórias
+        progress: Mostra barra de progresso
+
+    Returns:
+        DataFrame com uma linha por jogo: concurso, estrategia, jogo_id,
+        numeros, acertos e premio (R$, se prizes for dado)
+
+    Raises:
+        ValueError: Se alguma estratégia gerar jogo sem n_numbers números distintos
+    """
+    index = FrequencyIndex.from_store(store)
+    first = window_size + window_size // 2 + 1
+    start = first if start is None else max(start, first)
+    stop = len(store) if stop is None else min(stop, len(store))
+    blocks = [range(s, min(s + block_size, stop)) for s in range(start, stop, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+
+    run = partial(_walk_block, index=index, n_numbers=n_numbers,
+                  games_per_strategy=games_per_strategy, strategies=strategies,
+                  window_size=window_size)
+    parts = []
+    with tqdm(total=max(stop - start, 0), desc="Walk-forward", disable=not progress) as bar:
+        if workers <= 1 or len(blocks) <= 1:
+            results = map(run, blocks, seeds)
+            for block, part in zip(blocks, results):
+                parts.append(part)
+                bar.update(len(block))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(blocks))) as pool:
+                for block, part in zip(blocks, pool.map(run, blocks, seeds)):
+                    parts.append(part)
+                    bar.update(len(block))
+
+    positions = np.concatenate([p[0] for p in parts]) if parts else np.empty(0, dtype=np.int64)
+    masks = np.concatenate([p[3] for p in parts]) if parts else np.empty(0, dtype=np.uint32)
+    names = [name for p in parts for name in p[1]]
+    short = popcount(masks) != n_numbers
+    if short.any():
+        # a linha de base (probability) supõe jogos de n_numbers números distintos
+        bad = sorted({names[i] for i in np.flatnonzero(short)})
+        raise ValueError(f"{int(short.sum())} jogos sem {n_numbers} números distintos "
+                         f"(estratégias: {', '.join(bad)})")
+    hits = popcount(masks & store.masks[positions])
+
+    frame = pd.DataFrame({
+        'concurso': store.contests[positions],
+        'estrategia': names,
+        'jogo_id': np.concatenate([p[2] for p in parts]) if parts else np.empty(0, dtype=np.int64),
+        'numeros': [','.join(map(str, mask_to_numbers(int(m)))) for m in masks],
+        'acertos': hits,
+    })
+    if prizes is not None:
+        frame['premio'] = prizes[positions, hits]
+    return frame
+
+
+def walk_forward_summary(results: pd.DataFrame, n_numbers: int = 15,
+                         price_per_game: float | None = None) -> pd.DataFrame:
+    """
+    Desempenho de cada estratégia no walk-forward.
+
+    Args:
+        results: DataFrame de walk_forward
+        n_numbers: Números por jogo (para a linha de base exata)
+        price_per_game: Preço por jogo (R$) para calcular custo e retorno
+
+    Returns:
+        DataFrame por estratégia com média de acertos, prêmios por faixa,
+        taxa de prêmio e, para comparação, a média e a taxa esperadas de
+        jogos aleatórios (ver probability)
+    """
+    grouped = results.groupby('estrategia')
+    summary = pd.DataFrame({
+        'jogos': grouped.size(),
+        'concursos': grouped['concurso'].nunique(),
+        'media_acertos': grouped['acertos'].mean(),
+        'max_acertos': grouped['acertos'].max(),
+    })
+    for tier in PRIZE_TIERS:
+        summary[f'premios_{tier}'] = grouped['acertos'].apply(lambda h, t=tier: int((h == t).sum()))
+    summary['taxa_premio_%'] = grouped['acertos'].apply(lambda h: (h >= PRIZE_TIERS[0]).mean() * 100)
+    summary['media_esperada'] = expected_hits(n_numbers)
+    summary['taxa_esperada_%'] = at_least_probability(n_numbers, PRIZE_TIERS[0]) * 100
+    summary['ganho_acertos'] = summary['media_acertos'] - summary['media_esperada']
+    if 'premio' in results:
+        summary['premio_total'] = grouped['premio'].sum()
+        if price_per_game is not None:
+            summary['custo'] = summary['jogos'] * price_per_game
+            summary['retorno_%'] = summary['premio_total'] / summary['custo'] * 100
+    return summary.sort_values('media_acertos', ascending=False).round(4)
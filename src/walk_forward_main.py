@@ -0,0 +1,74 @@
+"""
+Script de backtesting walk-forward das estratégias do gerador.
+
+Em cada concurso, as estratégias são recalculadas só com os sorteios
+anteriores, geram seus jogos e são conferidas no sorteio daquele concurso.
+
+Exemplos:
+    python src/walk_forward_main.py
+    python src/walk_forward_main.py --inicio 3000 --jogos 10 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bitmask import N_NUMBERS
+from src.draw_cache import load_draw_table
+from src.io_data import DEFAULT_DRAWS_PATH, load_draw_store
+from src.universe import load_prize_table
+from src.walk_forward import DEFAULT_BLOCK_SIZE, DEFAULT_WINDOW_SIZE, walk_forward, walk_forward_summary
+
+
+def main(argv=None):
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Backtesting walk-forward das estratégias")
+    parser.add_argument("--draws", default=DEFAULT_DRAWS_PATH, help="CSV de sorteios")
+    parser.add_argument("--inicio", type=int, help="Primeiro concurso avaliado (padrão: após o aquecimento)")
+    parser.add_argument("--fim", type=int, help="Último concurso avaliado (padrão: o mais recente)")
+    parser.add_argument("--jogos", type=int, default=5, help="Jogos por estratégia em cada concurso")
+    parser.add_argument("--janela", type=int, default=DEFAULT_WINDOW_SIZE, help="Janela das tendências")
+    parser.add_argument("--bloco", type=int, default=DEFAULT_BLOCK_SIZE, help="Concursos por tarefa")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos usados")
+    parser.add_argument("--seed", type=int, default=0, help="Semente das estratégias aleatórias")
+    parser.add_argument("--preco", type=float, default=3.50, help="Preço por jogo (R$)")
+    parser.add_argument("--out", default="out/walk_forward", help="Diretório de saída")
+    args = parser.parse_args(argv)
+
+    store = load_draw_store(args.draws)
+    prizes = load_prize_table(load_draw_table(args.draws, n_max=N_NUMBERS))
+    contests = list(store.contests)
+    start = contests.index(args.inicio) if args.inicio in contests else None
+    stop = contests.index(args.fim) + 1 if args.fim in contests else None
+
+    print("=" * 80)
+    print("🚶 BACKTESTING WALK-FORWARD (SEM LOOKAHEAD)")
+    print("=" * 80)
+
+    results = walk_forward(store, prizes, start=start, stop=stop, games_per_strategy=args.jogos,
+                           window_size=args.janela, block_size=args.bloco,
+                           workers=args.workers, seed=args.seed)
+    if results.empty:
+        print("\n⚠️  Nenhum concurso avaliado (histórico curto demais para o aquecimento)")
+        return
+    summary = walk_forward_summary(results, price_per_game=args.preco)
+
+    first, last = results['concurso'].iloc[0], results['concurso'].iloc[-1]
+    print(f"\nConcursos avaliados: {first} a {last} ({results['concurso'].nunique():,})")
+    print(f"Jogos conferidos: {len(results):,}\n")
+    print(summary[['jogos', 'media_acertos', 'ganho_acertos', 'taxa_premio_%',
+                   'taxa_esperada_%', 'premio_total', 'retorno_%']].to_string())
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    results.to_csv(out / "jogos_walk_forward.csv", index=False)
+    summary.to_csv(out / "resumo_walk_forward.csv")
+    print(f"\n💾 Resultados salvos em: {out}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Módulo de fechamentos (wheels / covering designs) para pools de 18 a 21 números.
+Em vez de jogar todas as C(v, 15) combinações do pool, monta um conjunto
+pequeno de apostas com garantia: "se `condicao` dos números sorteados
+estiverem no pool, pelo menos uma aposta faz `acertos` pontos".
+
+A cobertura é calculada com bitmasks de posições do pool (AND + popcount
+pelo motor de acertos), o conjunto inicial vem de cobertura gulosa e é
+melhorado por busca local (remoção de redundantes e troca de 2 apostas
+por 1). Fechamentos já encontrados ficam em cache em disco e valem para
+qualquer pool do mesmo tamanho.
+"""
+from __future__ import annotations
+
+import json
+import os
+import numpy as np
+from typing import List, Sequence, Tuple
+
+from .atomic_io import write_json
+from .bitmask import N_NUMBERS, masks_to_numbers_array, popcount
+from .combinatorics import index_masks_to_number_masks, iter_index_masks
+from .hit_engine import DEFAULT_BLOCK_ELEMENTS, map_hit_blocks
+
+TICKET_SIZE = 15
+DEFAULT_WHEEL_DIR = "out/wheels"
+
+
+def _check_params(v: int, hits: int, condition: int) -> None:
+    if not TICKET_SIZE <= v <= N_NUMBERS:
+        raise ValueError(f"Pool deve ter entre {TICKET_SIZE} e {N_NUMBERS} números, recebido {v}")
+    lowest = max(0, TICKET_SIZE - (N_NUMBERS - v))
+    if not lowest <= condition <= TICKET_SIZE:
+        raise ValueError(f"Condição deve estar entre {lowest} e {TICKET_SIZE} para pool de {v}")
+    if not 0 < hits <= condition:
+        raise ValueError(f"Acertos garantidos devem estar entre 1 e {condition}")
+
+
+def _coverage_csr(candidates: np.ndarray, targets: np.ndarray, hits: int,
+                  block_elements: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Relação "candidato cobre alvo" (|C ∩ D| >= hits) em formato CSR.
+
+    Returns:
+        Tupla (indptr (C+1,), indices) com os alvos cobertos por cada candidato
+    """
+    rows, cols = [], []
+
+    def reduce(start: int, block: np.ndarray) -> None:
+        r, c = np.nonzero(block >= hits)
+        rows.append(r.astype(np.int64) + start)
+        cols.append(c.astype(np.int32))
+
+    map_hit_blocks(reduce, candidates, targets, block_elements)
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int32)
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(candidates.size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=candidates.size), out=indptr[1:])
+    return indptr, cols[order]
+
+
+def _transpose(indptr: np.ndarray, indices: np.ndarray, n_cols: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Transpõe uma relação CSR (alvo -> candidatos que o cobrem)."""
+    rows = np.repeat(np.arange(indptr.size - 1, dtype=np.int32), np.diff(indptr))
+    order = np.argsort(indices, kind='stable')
+    t_indptr = np.zeros(n_cols + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=n_cols), out=t_indptr[1:])
+    return t_indptr, rows[order]
+
+
+class _Cover:
+    """Relação de cobertura entre candidatos e alvos (posições do pool)."""
+
+    def __init__(self, v: int, hits: int, condition: int, block_elements: int):
+        self.candidates = np.concatenate(list(iter_index_masks(v, TICKET_SIZE)))
+        self.targets = np.concatenate(list(iter_index_masks(v, condition)))
+        self.n_targets = self.targets.size
+        self.hits = hits
+        # uma aposta r que cubra alvos exclusivos de a e de b tem
+        # |r ∩ a|, |r ∩ b| >= 2*hits - condition, logo a e b precisam ter
+        # pelo menos 2*(2*hits - condition) - 15 números em comum
+        self.min_overlap = 2 * (2 * hits - condition) - TICKET_SIZE
+        self.indptr, self.indices = _coverage_csr(self.candidates, self.targets, hits, block_elements)
+        if condition == TICKET_SIZE:
+            # a relação é simétrica e candidatos == alvos
+            self.t_indptr, self.t_indices = self.indptr, self.indices
+        else:
+            self.t_indptr, self.t_indices = _transpose(self.indptr, self.indices, self.n_targets)
+
+    def covered_by(self, candidate: int) -> np.ndarray:
+        return self.indices[self.indptr[candidate]:self.indptr[candidate + 1]]
+
+    def covering(self, targets: np.ndarray) -> np.ndarray:
+        """Candidatos que cobrem todos os alvos dados."""
+        # só quem cobre o primeiro alvo pode cobrir todos
+        first = self.t_indices[self.t_indptr[targets[0]]:self.t_indptr[targets[0] + 1]]
+        hits = popcount(self.candidates[first, np.newaxis] & self.targets[np.newaxis, targets])
+        return first[(hits >= self.hits).all(axis=1)]
+
+    def counts(self, chosen: Sequence[int]) -> np.ndarray:
+        """Quantas apostas escolhidas cobrem cada alvo."""
+        lists = [self.covered_by(c) for c in chosen]
+        if not lists:
+            return np.zeros(self.n_targets, dtype=np.int64)
+        return np.bincount(np.concatenate(lists), minlength=self.n_targets)
+
+    def greedy(self, rng: np.random.Generator) -> List[int]:
+        """Cobertura gulosa (maior ganho primeiro, empates sorteados)."""
+        gain = np.diff(self.indptr)
+        covered = np.zeros(self.n_targets, dtype=bool)
+        chosen = []
+        while not covered.all():
+            best = np.flatnonzero(gain == gain.max())
+            c = int(best[rng.integers(best.size)])
+            new = self.covered_by(c)
+            new = new[~covered[new]]
+            covered[new] = True
+            lists = [self.t_indices[self.t_indptr[t]:self.t_indptr[t + 1]] for t in new]
+            gain = gain - np.bincount(np.concatenate(lists), minlength=gain.size)
+            chosen.append(c)
+        return chosen
+
+    def improve(self, chosen: List[int], rng: np.random.Generator) -> List[int]:
+        """
+        Busca local: remove apostas redundantes e troca pares de apostas
+        próximas por uma só que cubra tudo o que o par cobria sozinho, até
+        não melhorar.
+        """
+        chosen = list(chosen)
+        counts = self.counts(chosen)
+        improved = True
+        while improved:
+            improved = False
+            for c in [chosen[i] for i in rng.permutation(len(chosen))]:
+                cov = self.covered_by(c)
+                if (counts[cov] >= 2).all():
+                    chosen.remove(c)
+                    counts[cov] -= 1
+            chosen = [chosen[i] for i in rng.permutation(len(chosen))]
+            # candidatos que cobrem todos os alvos exclusivos de cada aposta;
+            # quem substitui um par precisa estar nos dois conjuntos
+            private = {}
+
+            def substitutes(c: int) -> set:
+                if c not in private:
+                    cov = self.covered_by(c)
+                    own = cov[counts[cov] == 1]
+                    private[c] = set(self.covering(own).tolist()) if own.size else None
+                return private[c]
+
+            i = 0
+            while i < len(chosen):
+                a = chosen[i]
+                masks = self.candidates[chosen]
+                partners = np.flatnonzero(popcount(masks[i + 1:] & masks[i]) >= self.min_overlap) + i + 1
+                for j in partners.tolist():
+                    b = chosen[j]
+                    sub_a, sub_b = substitutes(a), substitutes(b)
+                    if sub_a is not None and sub_b is not None and not (sub_a & sub_b):
+                        continue
+                    cov_a, cov_b = self.covered_by(a), self.covered_by(b)
+                    counts[cov_a] -= 1
+                    counts[cov_b] -= 1
+                    lost = np.union1d(cov_a[counts[cov_a] == 0], cov_b[counts[cov_b] == 0])
+                    replacement = self.covering(lost) if lost.size else np.array([a])
+                    if replacement.size:
+                        r = int(replacement[rng.integers(replacement.size)])
+                        counts[self.covered_by(r)] += 1
+                        chosen[i] = r
+                        del chosen[j]
+                        private.clear()
+                        improved = True
+                        break
+                    counts[cov_a] += 1
+                    counts[cov_b] += 1
+                else:
+                    i += 1
+        return chosen
+
+
+def _cache_path(cache_dir: str, v: int, hits: int, condition: int) -> str:
+    return os.path.join(cache_dir, f"wheel_{v}_{TICKET_SIZE}_{hits}se{condition}.json")
+
+
+def _load_cached(path: str) -> List[List[int]] | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['apostas']
+
+
+def wheel_guarantee(tickets: Sequence[Sequence[int]], pool: Sequence[int], condition: int = TICKET_SIZE,
+                    block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> int:
+    """
+    Acertos garantidos por um conjunto de apostas quando `condition` dos
+    sorteados estão no pool (pior caso sobre todas as possibilidades).
+
+    Args:
+        tickets: Apostas (números)
+        pool: Números do pool
+        condition: Quantos dos sorteados caem no pool
+
+    Returns:
+        Menor valor, entre todos os sorteios possíveis, do melhor acerto das apostas
+    """
+    pool = sorted(int(n) for n in pool)
+    targets = index_masks_to_number_masks(np.concatenate(list(iter_index_masks(len(pool), condition))), pool)
+    ticket_masks = np.array([sum(1 << (int(n) - 1) for n in t) for t in tickets], dtype=np.uint32)
+    best = np.empty(targets.size, dtype=np.uint8)
+
+    def reduce(start: int, block: np.ndarray) -> None:
+        best[start:start + block.shape[0]] = block.max(axis=1)
+
+    map_hit_blocks(reduce, targets, ticket_masks, block_elements)
+    return int(best.min())
+
+
+def build_wheel(pool: Sequence[int], hits: int = 14, condition: int = TICKET_SIZE,
+                restarts: int = 4, seed: int = 0, cache_dir: str | None = DEFAULT_WHEEL_DIR,
+                refresh: bool = False, block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> List[List[int]]:
+    """
+    Gera um fechamento de apostas de 15 números para o pool.
+
+    Garantia: se `condition` dos 15 sorteados estiverem no pool, pelo menos
+    uma aposta faz `hits` acertos. O fechamento é guardado em cache por
+    (tamanho do pool, hits, condition) em posições do pool, então serve
+    para qualquer pool do mesmo tamanho; um resultado novo só substitui o
+    do cache se tiver menos apostas.
+
+    Args:
+        pool: Números do pool (15 a 25 números distintos)
+        hits: Acertos garantidos
+        condition: Quantos dos sorteados precisam estar no pool
+        restarts: Execuções gulosas com desempates diferentes (fica a menor)
+        seed: Semente dos desempates e da busca local
+        cache_dir: Diretório do cache (None desativa)
+        refresh: Ignora o cache e recalcula
+        block_elements: Tamanho máximo de cada bloco (candidatos × alvos)
+
+    Returns:
+        Lista de apostas (15 números em ordem crescente)
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos
+    """
+    pool = sorted(int(n) for n in pool)
+    v = len(pool)
+    if len(set(pool)) != v or not all(1 <= n <= N_NUMBERS for n in pool):
+        raise ValueError(f"Pool deve ter números distintos entre 1 e {N_NUMBERS}")
+    _check_params(v, hits, condition)
+
+    path = _cache_path(cache_dir, v, hits, condition) if cache_dir else None
+    design = None if refresh or path is None else _load_cached(path)
+
+    if design is None:
+        cover = _Cover(v, hits, condition, block_elements)
+        rng = np.random.default_rng(seed)
+        best = None
+        for _ in range(max(restarts, 1)):
+            chosen = cover.improve(cover.greedy(rng), rng)
+            if best is None or len(chosen) < len(best):
+                best = chosen
+        index_masks = np.sort(cover.candidates[best])
+        design = [np.flatnonzero((int(m) >> np.arange(v)) & 1).tolist() for m in index_masks]
+
+        cached = _load_cached(path) if path else None
+        if path and (cached is None or len(design) < len(cached)):
+            os.makedirs(cache_dir, exist_ok=True)
+            write_json(path, {'pool': v, 'aposta': TICKET_SIZE, 'acertos': hits,
+                              'condicao': condition, 'apostas': design})
+        elif cached is not None:
+            design = cached
+
+    masks = index_masks_to_number_masks(
+        np.array([sum(1 << i for i in ticket) for ticket in design], dtype=np.uint32), pool)
+    return masks_to_numbers_array(masks, TICKET_SIZE).tolist()
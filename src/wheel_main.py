@@ -0,0 +1,85 @@
+"""
+Script de fechamento (wheel) de um pool de 18 a 21 números.
+
+Gera poucas apostas de 15 números com garantia, em vez de jogar todas as
+C(v, 15) combinações do pool.
+
+Exemplos:
+    python src/wheel_main.py
+    python src/wheel_main.py --pool 1 2 3 4 5 6 8 10 11 12 13 14 15 18 20 22 24 25 --acertos 14
+    python src/wheel_main.py --acertos 13 --condicao 14
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from math import comb
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.wheel import DEFAULT_WHEEL_DIR, TICKET_SIZE, build_wheel, wheel_guarantee
+
+# pool salvo por find_optimal_18_pool.py
+DEFAULT_POOL_PATH = "out/estrategia_frios/pool_otimo_18_numeros.txt"
+# pool otimizado usado em check_15_hits_optimized.py
+FALLBACK_POOL = [1, 2, 3, 4, 5, 6, 8, 10, 11, 12, 13, 14, 15, 18, 20, 22, 24, 25]
+
+
+def load_default_pool() -> list:
+    """Pool ótimo salvo pela busca, ou o pool otimizado conhecido."""
+    if os.path.exists(DEFAULT_POOL_PATH):
+        with open(DEFAULT_POOL_PATH, encoding='utf-8') as f:
+            return [int(n) for n in f.read().strip().split(',')]
+    return FALLBACK_POOL
+
+
+def main(argv=None):
+    """Ponto de entrada do script."""
+    parser = argparse.ArgumentParser(description="Fechamento (wheel) de um pool da Lotofácil")
+    parser.add_argument("--pool", type=int, nargs="+", help="Números do pool (padrão: pool ótimo de 18)")
+    parser.add_argument("--acertos", type=int, default=14, help="Acertos garantidos")
+    parser.add_argument("--condicao", type=int, default=TICKET_SIZE,
+                        help="Quantos dos sorteados precisam estar no pool")
+    parser.add_argument("--restarts", type=int, default=4, help="Execuções gulosas (fica a menor)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente da busca")
+    parser.add_argument("--refresh", action="store_true", help="Ignora o cache de fechamentos")
+    parser.add_argument("--preco", type=float, default=3.50, help="Preço por aposta (R$)")
+    parser.add_argument("--out", help="CSV de saída (padrão: out/wheels/jogos_<v>_<acertos>se<condicao>.csv)")
+    args = parser.parse_args(argv)
+
+    pool = sorted(args.pool or load_default_pool())
+    full = comb(len(pool), TICKET_SIZE)
+
+    print("=" * 80)
+    print(f"🎡 FECHAMENTO DE {len(pool)} NÚMEROS: {args.acertos} SE {args.condicao}")
+    print("=" * 80)
+    print(f"\nPool: {pool}")
+    print(f"Garantia: se {args.condicao} dos sorteados estiverem no pool, "
+          f"pelo menos uma aposta faz {args.acertos} acertos")
+
+    tickets = build_wheel(pool, args.acertos, args.condicao, restarts=args.restarts,
+                          seed=args.seed, refresh=args.refresh)
+    guaranteed = wheel_guarantee(tickets, pool, args.condicao)
+
+    print(f"\n📊 RESULTADO:")
+    print(f"   • Apostas no fechamento: {len(tickets):,} (R$ {len(tickets) * args.preco:,.2f})")
+    print(f"   • Fechar o pool inteiro: {full:,} (R$ {full * args.preco:,.2f})")
+    print(f"   • Redução: {(1 - len(tickets) / full) * 100:.1f}%")
+    print(f"   • Garantia verificada: {guaranteed} acertos "
+          f"{'✅' if guaranteed >= args.acertos else '❌'}")
+
+    out = Path(args.out or f"{DEFAULT_WHEEL_DIR}/jogos_{len(pool)}_{args.acertos}se{args.condicao}.csv")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({
+        'jogo_id': range(1, len(tickets) + 1),
+        'numeros': [','.join(map(str, t)) for t in tickets],
+    }).to_csv(out, index=False)
+    print(f"\n💾 Apostas salvas em: {out}")
+
+
+if __name__ == "__main__":
+    main()